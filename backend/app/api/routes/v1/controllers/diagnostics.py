@@ -0,0 +1,55 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
+
+from app.api.routes.v1.providers import diagnostics as diagnostics_provider
+from app.api.routes.v1.providers.auth import get_current_user
+from app.core.db.models import User
+from app.core.db.setup import create_db_session
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+DBSessionDependency = Annotated[Session, Depends(create_db_session)]
+CurrentUserDependency = Annotated[User, Depends(get_current_user)]
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+    limit: int = 50,
+):
+    """Get slow query fingerprints with count, p50 and p99 (Admin only)"""
+    return await diagnostics_provider.get_slow_queries(
+        db_session=db_session, current_user=current_user, limit=limit
+    )
+
+
+@router.get("/profiles")
+async def get_profiles(
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+):
+    """Get the ids of stored request profiles (Admin only)"""
+    return await diagnostics_provider.get_profiles(
+        db_session=db_session, current_user=current_user
+    )
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+    profile_id: str,
+    text: bool = False,
+    limit: int = 50,
+):
+    """Download a request profile as pstats, or as a text report (Admin only)"""
+    return await diagnostics_provider.get_profile(
+        db_session=db_session,
+        current_user=current_user,
+        profile_id=profile_id,
+        text=text,
+        limit=limit,
+    )
@@ -1,18 +1,32 @@
+from datetime import datetime
 from typing import Annotated, List
 from uuid import UUID
 
-from fastapi import APIRouter, Cookie, Depends, Response, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Cookie,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 from sqlmodel import Session
 
 from app.api.routes.v1.dto.form import (
     AnswerSessionDTO,
     FieldResponseDTO,
+    FormBootstrapDTO,
     FormCreationDTO,
     FormDTO,
     FormFieldCreationDTO,
     FormFieldDTO,
     FormFieldUpdateDTO,
+    FormFunnelDTO,
     FormSaveDTO,
+    FormSummaryDTO,
     FormTranslationModel,
     FormUpdateDTO,
     ResponseCreationDTO,
@@ -36,8 +50,27 @@ CurrentUserDependency = Annotated[User, Depends(get_current_user)]
 OptionalUserDependency = Annotated[
     User | None, Depends(get_current_user_optional)
 ]
+
+
+def get_answer_session_id(
+    answer_session_id: Annotated[
+        str | None, Cookie(alias=ANSWER_SESSION_COOKIE_KEY)
+    ] = None,
+) -> UUID | None:
+    """Answer session id from its cookie, a 400 when it is malformed."""
+    if not answer_session_id:
+        return None
+    try:
+        return UUID(answer_session_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Malformed answer session cookie.",
+        )
+
+
 CurrentAnswerSessionDependency = Annotated[
-    str | None, Cookie(alias=ANSWER_SESSION_COOKIE_KEY)
+    UUID | None, Depends(get_answer_session_id)
 ]
 
 
@@ -94,14 +127,12 @@ async def get_user_forms(
 @router.get("/sessions", response_model=AnswerSessionDTO)
 async def get_answer_session(
     db_session: DBSessionDependency,
-    answer_session_id: Annotated[
-    str | None, Cookie(alias=ANSWER_SESSION_COOKIE_KEY)
-    ] = None,
+    answer_session_id: CurrentAnswerSessionDependency,
 ):
     """Get an answer session (Public endpoint for session management)"""
     return await form_provider.get_answer_session(
         db_session=db_session,
-    answer_session_id=UUID(answer_session_id) if answer_session_id else None,
+        answer_session_id=answer_session_id,
     )
 
 
@@ -110,12 +141,30 @@ async def get_form(
     form_id: UUID,
     db_session: DBSessionDependency,
     current_user: OptionalUserDependency,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     """Get a specific form by ID (Public for form filling)"""
     return await form_provider.get_form_by_id(
         db_session=db_session,
         form_id=form_id,
         current_user=current_user,
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/{form_id}/bootstrap", response_model=FormBootstrapDTO)
+async def get_form_bootstrap(
+    form_id: UUID,
+    db_session: DBSessionDependency,
+    current_user: OptionalUserDependency,
+    answer_session_id: CurrentAnswerSessionDependency,
+):
+    """Get everything the fill page needs in one call (Public)"""
+    return await form_provider.get_form_bootstrap(
+        db_session=db_session,
+        form_id=form_id,
+        current_user=current_user,
+        answer_session_id=answer_session_id,
     )
 
 
@@ -130,6 +179,18 @@ async def translate_form(
     )
 
 
+@router.post("/{form_id}/translate/stream")
+async def stream_translate_form(
+    db_session: DBSessionDependency,
+    form_id: UUID,
+    language: SupportedLanguages,
+):
+    """Translate a form, streamed as Server-Sent Events"""
+    return await form_provider.stream_translate_form(
+        db_session=db_session, form_id=form_id, language=language
+    )
+
+
 @router.put("/{form_id}", response_model=FormDTO)
 async def update_form(
     form_id: UUID,
@@ -180,6 +241,7 @@ async def close_form(
 @router.post("/{form_id}/open", response_model=MessageResponse)
 async def open_form(
     form_id: UUID,
+    bt: BackgroundTasks,
     db_session: DBSessionDependency,
     current_user: CurrentUserDependency,
 ):
@@ -188,6 +250,7 @@ async def open_form(
         db_session=db_session,
         current_user=current_user,
         form_id=form_id,
+        bt=bt,
     )
 
 
@@ -197,12 +260,14 @@ async def get_form_fields(
     form_id: UUID,
     db_session: DBSessionDependency,
     current_user: OptionalUserDependency,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     """Get all fields for a form (Public for form filling)"""
     return await form_provider.get_form_fields(
         db_session=db_session,
         form_id=form_id,
         current_user=current_user,
+        if_none_match=if_none_match,
     )
 
 
@@ -279,14 +344,12 @@ async def save_responses(
     response: Response,
     save_data: FormSaveDTO,
     db_session: DBSessionDependency,
-    response_session_id: CurrentAnswerSessionDependency = None,
+    response_session_id: CurrentAnswerSessionDependency,
 ):
     """Save multiple responses at once (Public endpoint for batch saving)"""
     answer_session = await form_provider.save_responses(
         db_session=db_session,
-        answer_session_id=UUID(response_session_id)
-        if response_session_id
-        else None,
+        answer_session_id=response_session_id,
         data=save_data,
     )
     response.set_cookie(
@@ -306,16 +369,14 @@ async def respond_to_field(
     response: Response,
     response_data: ResponseCreationDTO,
     db_session: DBSessionDependency,
-    response_session_id: CurrentAnswerSessionDependency = None,
+    response_session_id: CurrentAnswerSessionDependency,
 ):
     """Submit a response to a form field (Public endpoint)"""
     return await form_provider.respond_to_field(
         api_response=response,
         db_session=db_session,
         response_data=response_data,
-        response_session_id=UUID(response_session_id)
-        if response_session_id
-        else None,
+        response_session_id=response_session_id,
     )
 
 
@@ -324,7 +385,7 @@ async def edit_response(
     answer_id: UUID,
     value: str,
     db_session: DBSessionDependency,
-    answer_session_id: CurrentAnswerSessionDependency = None,
+    answer_session_id: CurrentAnswerSessionDependency,
 ):
     """Edit a response (Public endpoint with session validation)"""
     return await form_provider.edit_response(
@@ -340,7 +401,7 @@ async def delete_response(
     answer_id: UUID,
     db_session: DBSessionDependency,
     current_user: OptionalUserDependency,
-    answer_session_id: CurrentAnswerSessionDependency = None,
+    answer_session_id: CurrentAnswerSessionDependency,
 ):
     """Delete a response"""
     return await form_provider.delete_response(
@@ -356,14 +417,12 @@ async def submit_responses(
     form_id: UUID,
     response: Response,
     db_session: DBSessionDependency,
-    answer_session_id: CurrentAnswerSessionDependency = None,
+    answer_session_id: CurrentAnswerSessionDependency,
 ):
     """Submit all responses in a session for a specific form (Public endpoint)."""
     return await form_provider.submit(
         db_session=db_session,
-        answer_session_id=UUID(answer_session_id)
-        if answer_session_id
-        else None,
+        answer_session_id=answer_session_id,
         form_id=form_id,
         response=response,
     )
@@ -377,14 +436,61 @@ async def get_form_responses(
     current_user: CurrentUserDependency,
     skip: int = 0,
     limit: int = 10,
+    filters: Annotated[list[str] | None, Query(alias="filter")] = None,
+    submitted_after: datetime | None = None,
+    submitted_before: datetime | None = None,
+    q: str | None = None,
 ):
-    """Get all responses for a form (Admin/Owner only)"""
+    """
+    Get the submitted responses of a form (Admin/Owner only), optionally
+    filtered by answers (`filter=<field_id>:<operator>:<value>`, repeatable)
+    and submission time. With `q`, only responses whose text answers match
+    it are returned, best matches first.
+    """
     return await form_provider.get_responses(
         db_session=db_session,
         current_user=current_user,
         form_id=form_id,
         skip=skip,
         limit=limit,
+        filters=filters,
+        submitted_after=submitted_after,
+        submitted_before=submitted_before,
+        q=q,
+    )
+
+
+@router.get("/{form_id}/summary", response_model=FormSummaryDTO)
+async def get_form_summary(
+    form_id: UUID,
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+):
+    """
+    Option counts, true/false counts and numeric statistics of the
+    submitted responses of a form (Admin/Owner only).
+    """
+    return await form_provider.get_form_summary(
+        db_session=db_session,
+        current_user=current_user,
+        form_id=form_id,
+    )
+
+
+@router.get("/{form_id}/funnel", response_model=FormFunnelDTO)
+async def get_form_funnel(
+    form_id: UUID,
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+):
+    """
+    How many answer sessions reached, answered and submitted after each
+    field of a form (Admin/Owner only). Refreshed every few minutes.
+    """
+    return await form_provider.get_form_funnel(
+        db_session=db_session,
+        current_user=current_user,
+        form_id=form_id,
     )
 
 
@@ -1,13 +1,52 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
 
 from app.api.routes.v1.dto.miscellaneous import TextTranslationDTO
 from app.api.routes.v1.providers import miscellaneous as miscellaneous_provider
+from app.api.routes.v1.providers.auth import get_current_user
+from app.core.db.models import User
+from app.core.db.setup import create_db_session
 
 router = APIRouter(prefix="/miscellaneous", tags=["Miscellaneous"])
 
+DBSessionDependency = Annotated[Session, Depends(create_db_session)]
+CurrentUserDependency = Annotated[User, Depends(get_current_user)]
+
 
 @router.post("/translate")
 async def translate_text(data: TextTranslationDTO):
     return await miscellaneous_provider.translate_text(
         text=data.input, language=data.language
     )
+
+
+@router.post("/translate/stream")
+async def stream_translate_text(data: TextTranslationDTO):
+    """Translate a text, streamed as Server-Sent Events"""
+    return await miscellaneous_provider.stream_translate_text(
+        text=data.input, language=data.language
+    )
+
+
+@router.get("/coalescing")
+async def get_coalescing_stats(
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+):
+    """Request coalescing counters per single-flight group (Admin only)"""
+    return await miscellaneous_provider.get_coalescing_stats(
+        db_session=db_session, current_user=current_user
+    )
+
+
+@router.get("/llm")
+async def get_llm_metrics(
+    db_session: DBSessionDependency,
+    current_user: CurrentUserDependency,
+):
+    """Latency, token usage and circuit state per LLM backend (Admin only)"""
+    return await miscellaneous_provider.get_llm_metrics(
+        db_session=db_session, current_user=current_user
+    )
@@ -31,6 +31,11 @@ class FormTranslationModel(BaseModel):
     fields: List["FormFieldDTO"]
 
 
+class FormSchemaDTO(BaseModel):
+    form: "FormDTO"
+    fields: List["FormFieldDTO"]
+
+
 class FormCreationDTO(BaseModel):
     label: str
     description: str | None = None
@@ -54,6 +59,7 @@ class FormDTO(BaseModel):
     submissions_limit: int | None
     deadline: datetime | None
     submissions: int
+    version: int  # bumped by every change to the form or its fields
 
 
 class FormFieldCreationDTO(BaseModel):
@@ -109,3 +115,55 @@ class AnswerSessionDTO(BaseModel):
     form_id: UUID
     answers: List[FieldResponseDTO]
     submitted: bool
+    form_version: int | None = None  # None for sessions predating versions
+
+
+class FormAcceptanceDTO(BaseModel):
+    accepting: bool  # open, before the deadline and under the limit
+    open: bool
+    deadline: datetime | None
+    remaining: int | None  # None when there is no submissions limit
+
+
+class FormBootstrapDTO(BaseModel):
+    form: FormDTO
+    fields: List[FormFieldDTO]  # ordered by position
+    answer_session: AnswerSessionDTO | None
+    acceptance: FormAcceptanceDTO
+
+
+class FieldSummaryDTO(BaseModel):
+    field_id: UUID
+    label: str
+    field_type: FormFieldType
+    answered: int
+    # Select and Multiselect options, "true" and "false" for Boolean
+    counts: Dict[str, int] | None = None
+    # Numerical and Currency answers
+    minimum: float | None = None
+    maximum: float | None = None
+    mean: float | None = None
+    histogram: Dict[str, int] | None = None  # "low:high" bin -> count
+
+
+class FormSummaryDTO(BaseModel):
+    form_id: UUID
+    submissions: int
+    fields: List[FieldSummaryDTO]  # aggregated fields, ordered by position
+
+
+class FunnelStepDTO(BaseModel):
+    field_id: UUID
+    label: str
+    position: int | None
+    reached: int  # sessions that answered this field or a later one
+    answered: int  # sessions that answered this field
+    submitted: int  # sessions that reached this field, then submitted
+
+
+class FormFunnelDTO(BaseModel):
+    form_id: UUID
+    started: int  # sessions with at least one answer
+    submitted: int  # of the started sessions
+    steps: List[FunnelStepDTO]  # ordered by position
+    computed_at: datetime
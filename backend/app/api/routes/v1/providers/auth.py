@@ -17,6 +17,7 @@ from app.core.db.models import (
     User,
 )
 from app.core.db.setup import create_db_session
+from app.core.metrics.instruments import record_event
 from app.core.security.checkers import (
     check_conditions,
     check_equality,
@@ -146,6 +147,7 @@ async def send_verification_email(db_session: Session, email: EmailStr):
             "otp_code": account_verification_session.token,
         },
     )
+    record_event("otp_send")
 
 
 async def register(
@@ -248,6 +250,7 @@ async def login(
             "otp_code": auth_session.token,
         },
     )
+    record_event("otp_send")
 
     return MessageResponse(message="OTP sent to your email.")
 
@@ -0,0 +1,67 @@
+import io
+import pstats
+
+from fastapi.responses import FileResponse, PlainTextResponse
+from sqlmodel import Session
+
+from app.core.security.checkers import check_existence
+
+from app.core.db.models import User
+from app.core.db.slow_queries import slow_query_log
+from app.core.profiling.middleware import list_profiles, profile_path
+from app.core.security.permissions import (
+    ACTION_READ,
+    ADMIN_ROLE_NAME,
+    SUPER_ADMIN_ROLE_NAME,
+    SYSTEM_RESOURCE,
+    GlobalPermissionCheckModel,
+    PermissionChecker,
+)
+
+
+def check_admin(db_session: Session, current_user: User):
+    PermissionChecker(
+        db_session=db_session,
+        roles=current_user.roles,
+        bypass_roles=[ADMIN_ROLE_NAME, SUPER_ADMIN_ROLE_NAME],
+        pcheck_models=[
+            GlobalPermissionCheckModel(
+                resource_name=SYSTEM_RESOURCE, action_names=[ACTION_READ]
+            )
+        ],
+    ).check()
+
+
+async def get_slow_queries(
+    db_session: Session, current_user: User, limit: int = 50
+):
+    """Slowest statement fingerprints, by total time - Admin only"""
+    check_admin(db_session, current_user)
+    return slow_query_log.summary(limit=limit)
+
+
+async def get_profiles(db_session: Session, current_user: User):
+    """Ids of the stored request profiles, newest first - Admin only"""
+    check_admin(db_session, current_user)
+    return list_profiles()
+
+
+async def get_profile(
+    db_session: Session,
+    current_user: User,
+    profile_id: str,
+    text: bool = False,
+    limit: int = 50,
+):
+    """
+    A stored request profile, as a pstats file (for snakeviz, flameprof,
+    ...) or as a text report sorted by cumulative time - Admin only
+    """
+    check_admin(db_session, current_user)
+    path = check_existence(profile_path(profile_id))
+    if not text:
+        return FileResponse(path, filename=path.name)
+    report = io.StringIO()
+    stats = pstats.Stats(str(path), stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return PlainTextResponse(report.getvalue())
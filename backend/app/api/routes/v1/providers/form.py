@@ -1,35 +1,75 @@
+import asyncio
 import csv
+import hashlib
 import io
+from collections.abc import Sequence
 from datetime import date, datetime, timezone
+from typing import Literal, get_args
 from uuid import UUID
 
 import phonenumbers
-from fastapi import HTTPException, Response
+from fastapi import BackgroundTasks, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import EmailStr, HttpUrl, TypeAdapter, constr
-from sqlmodel import Session, asc, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import noload, selectinload
+from sqlmodel import Session, asc, delete, select, update
 from starlette.status import (
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
+    HTTP_409_CONFLICT,
     HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 from app.api.routes.v1.dto.form import (
+    AnswerSessionDTO,
+    FieldResponseDTO,
+    FormAcceptanceDTO,
+    FormBootstrapDTO,
+    FormDTO,
+    FormFieldDTO,
     FormFieldType,
+    FormFunnelDTO,
     FormSaveDTO,
+    FormSchemaDTO,
+    FormSummaryDTO,
     FormTranslationModel,
     ResponseCreationDTO,
 )
 from app.api.routes.v1.dto.message import MessageResponse
+from app.core.config.env import get_env
+from app.core.db.aggregates import (
+    aggregate_submission,
+    mark_aggregates_stale,
+    read_field_summaries,
+    rebuild_form_aggregates,
+)
 from app.core.db.builders.permission import PermissionBuilder
 from app.core.db.builders.role import RoleBuilder
+from app.core.db.documents import (
+    remove_document_answer,
+    write_document_answers,
+)
+from app.core.db.funnel import read_form_funnel
 from app.core.db.models import (
     AnswerSession,
     FieldAnswer,
     Form,
     FormField,
+    FormTranslation,
     User,
+    document_answer_id,
+)
+from app.core.db.response_filters import (
+    parse_response_filter,
+    response_filter_clause,
 )
-from app.core.logging.log import log_warning
+from app.core.db.search import answer_search_ranks
+from app.core.db.setup import engine
+from app.core.logging.log import log_error
+from app.core.metrics.instruments import record_event
 from app.core.security.checkers import (
     check_conditions,
     check_existence,
@@ -45,13 +85,74 @@ from app.core.security.permissions import (
     PermissionChecker,
     PermissionCheckModel,
 )
+from app.core.services.ai.providers import CircuitOpenError
 from app.core.services.ai.translation import (
+    SUPPORTED_LANGUAGES,
     SupportedLanguages,
     translate_json,
 )
+from app.utils.answers import TYPED_FIELD_TYPES, typed_answer_values
 from app.utils.date import utc
+from app.utils.etag import etag_matches
+from app.utils.responses import json_response
+from app.utils.singleflight import SingleFlight
+from app.utils.sse import sse_event
+from app.utils.ttl_cache import TTLCache
 
 ANSWER_SESSION_COOKIE_KEY = "response_session_id"
+TRANSLATION_PRECOMPUTE_CONCURRENCY = int(
+    get_env("TRANSLATION_PRECOMPUTE_CONCURRENCY", "2")
+)
+TRANSLATION_CHUNK_SIZE = int(get_env("TRANSLATION_CHUNK_SIZE", "20"))
+TRANSLATION_CHUNK_RETRIES = int(get_env("TRANSLATION_CHUNK_RETRIES", "2"))
+TRANSLATION_CHUNK_BACKOFF = (
+    float(get_env("TRANSLATION_CHUNK_BACKOFF_MS", "250")) / 1000
+)
+
+TRANSLATION_CHUNK_CACHE_SIZE = int(
+    get_env("TRANSLATION_CHUNK_CACHE_SIZE", "1024")
+)
+
+form_translation_flight = SingleFlight("form_translation")
+# Chunk translations by content hash, kept until evicted
+translation_chunk_cache: TTLCache[
+    tuple[str, SupportedLanguages], FormTranslationModel
+] = TTLCache("translation_chunk", max_size=TRANSLATION_CHUNK_CACHE_SIZE)
+AnswerStorage = Literal["rows", "document"]
+
+
+def configured_answer_storage() -> AnswerStorage:
+    storage = get_env("ANSWER_STORAGE", "rows")
+    if storage not in get_args(AnswerStorage):
+        raise ValueError(
+            f"Unknown ANSWER_STORAGE {storage!r}, expected one of"
+            f" {', '.join(get_args(AnswerStorage))}"
+        )
+    return storage
+
+
+# "document" keeps a session's answers in one JSON column, see save_answers
+ANSWER_STORAGE = configured_answer_storage()
+FORM_SCHEMA_CACHE_SIZE = int(get_env("FORM_SCHEMA_CACHE_SIZE", "1024"))
+FORM_SCHEMA_MAX_AGE = int(get_env("FORM_SCHEMA_MAX_AGE", "30"))
+FORM_FUNNEL_TTL = float(get_env("FORM_FUNNEL_TTL", "300"))
+FORM_FUNNEL_CACHE_SIZE = int(get_env("FORM_FUNNEL_CACHE_SIZE", "256"))
+RETYPE_BATCH_SIZE = 5000
+
+FORM_ADAPTER = TypeAdapter(FormDTO)
+FIELDS_ADAPTER = TypeAdapter(list[FormFieldDTO])
+ANSWER_SESSIONS_ADAPTER = TypeAdapter(list[AnswerSessionDTO])
+BOOTSTRAP_ADAPTER = TypeAdapter(FormBootstrapDTO)
+
+# Schemas are immutable per version, so entries never go stale
+form_schema_cache: TTLCache[tuple[UUID, int], FormSchemaDTO | None] = TTLCache(
+    "form_schema", max_size=FORM_SCHEMA_CACHE_SIZE
+)
+# Funnels scan every answer of a form, they are recomputed every
+# FORM_FUNNEL_TTL seconds at most
+form_funnel_cache: TTLCache[UUID, FormFunnelDTO] = TTLCache(
+    "form_funnel", ttl=FORM_FUNNEL_TTL, max_size=FORM_FUNNEL_CACHE_SIZE
+)
 
 
 async def create_form(
@@ -93,17 +194,368 @@ async def create_form(
     return form.to_dto()
 
 
+TRANSLATABLE_CONTENT = {
+    "form": {"label", "description"},
+    "fields": {"__all__": {"id", "label", "description", "possible_answers"}},
+}
+
+
+def translation_content_hash(data: FormTranslationModel) -> str:
+    """
+    Hashes only the translatable parts of a form so that counters such as
+    submissions do not invalidate stored translations.
+    """
+    content = data.model_dump_json(include=TRANSLATABLE_CONTENT)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def apply_translation(
+    data: FormTranslationModel, translated: FormTranslationModel
+) -> FormTranslationModel:
+    """
+    Copies translated texts onto the current form data, leaving ids,
+    counters and settings untouched.
+    """
+    translated_fields = {field.id: field for field in translated.fields}
+    form = data.form.model_copy(
+        update={
+            "label": translated.form.label,
+            "description": translated.form.description,
+        }
+    )
+    fields = [
+        field.model_copy(
+            update={
+                "label": translated_fields[field.id].label,
+                "description": translated_fields[field.id].description,
+                "possible_answers": translated_fields[
+                    field.id
+                ].possible_answers,
+            }
+        )
+        if field.id in translated_fields
+        else field
+        for field in data.fields
+    ]
+    return FormTranslationModel(form=form, fields=fields)
+
+
+def invalidate_form_translations(db_session: Session, form_id: UUID):
+    """Drops stored translations, the caller is expected to commit."""
+    db_session.exec(
+        delete(FormTranslation).where(FormTranslation.form_id == form_id)
+    )
+
+
+def form_translation_data(form: Form) -> FormTranslationModel:
+    form_fields = [form_field.to_dto() for form_field in form.fields]
+    return FormTranslationModel(form=form.to_dto(), fields=form_fields)
+
+
+async def translate_chunk(
+    chunk: FormTranslationModel, language: SupportedLanguages
+) -> FormTranslationModel:
+    """
+    Translates one chunk of a form, retrying it alone with an exponential
+    backoff when the upstream call fails or the output does not match the
+    chunk. Not retried while the circuit breaker of the model is open.
+    """
+    field_ids = sorted(field.id for field in chunk.fields)
+    for attempt in range(TRANSLATION_CHUNK_RETRIES + 1):
+        if attempt > 0:
+            await asyncio.sleep(TRANSLATION_CHUNK_BACKOFF * 2 ** (attempt - 1))
+        try:
+            translated = FormTranslationModel.model_validate_json(
+                await translate_json(
+                    json_data=chunk.model_dump_json(), language=language
+                )
+            )
+            translated_ids = sorted(field.id for field in translated.fields)
+            check_conditions(
+                [translated_ids == field_ids],
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Translated fields do not match the original ones.",
+            )
+            return translated
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            log_error(f"Translation chunk failed (attempt {attempt + 1}): {e}")
+    raise HTTPException(
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Could not translate form.",
+    )
+
+
+def translation_chunks(
+    data: FormTranslationModel,
+) -> list[FormTranslationModel]:
+    """
+    Splits the fields of a form into chunks of TRANSLATION_CHUNK_SIZE. The
+    title and description are only sent with the first chunk.
+    """
+    untitled = data.form.model_copy(update={"label": "", "description": None})
+    return [
+        FormTranslationModel(
+            form=data.form if start == 0 else untitled,
+            fields=data.fields[start : start + TRANSLATION_CHUNK_SIZE],
+        )
+        for start in range(0, max(len(data.fields), 1), TRANSLATION_CHUNK_SIZE)
+    ]
+
+
+async def translate_cached_chunk(
+    chunk: FormTranslationModel, language: SupportedLanguages
+) -> FormTranslationModel:
+    """
+    Translates a chunk, or reuses its translation: chunks that succeeded
+    are kept when others fail, so that only the failed ones are retried.
+    """
+    return await translation_chunk_cache.get_or_load(
+        (translation_content_hash(chunk), language),
+        lambda: translate_chunk(chunk, language),
+    )
+
+
+def merge_translated_chunks(
+    chunks: list[FormTranslationModel],
+    results: list[FormTranslationModel | BaseException],
+) -> FormTranslationModel:
+    """Merges chunk translations in order, failed chunks untranslated."""
+    translated_chunks = [
+        chunk if isinstance(result, BaseException) else result
+        for chunk, result in zip(chunks, results)
+    ]
+    return FormTranslationModel(
+        form=translated_chunks[0].form,
+        fields=[
+            field
+            for translated_chunk in translated_chunks
+            for field in translated_chunk.fields
+        ],
+    )
+
+
+async def translate_form_data(
+    data: FormTranslationModel, language: SupportedLanguages
+) -> tuple[FormTranslationModel, bool]:
+    """
+    Translates the chunks of a form concurrently and merges them back in
+    their original order, with whether every chunk was translated. Only
+    fails when no chunk could be translated.
+    """
+    chunks = translation_chunks(data)
+    results = await asyncio.gather(
+        *[translate_cached_chunk(chunk, language) for chunk in chunks],
+        return_exceptions=True,
+    )
+    failed = [
+        result for result in results if isinstance(result, BaseException)
+    ]
+    check_conditions(
+        [len(failed) < len(chunks)],
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Could not translate form.",
+    )
+    if failed:
+        log_error(
+            f"{len(failed)} of {len(chunks)} translation chunks failed"
+            f" for {language}, returning a partial translation"
+        )
+    return merge_translated_chunks(chunks, results), not failed
+
+
+def store_translation(
+    form_id: UUID,
+    language: SupportedLanguages,
+    content_hash: str,
+    translated: FormTranslationModel,
+):
+    """Stores a translation, unless another process stored it first."""
+    match engine.dialect.name:
+        case "postgresql":
+            insert = postgresql.insert
+        case "sqlite":
+            insert = sqlite.insert
+        case dialect:
+            raise NotImplementedError(f"No translation insert on {dialect}")
+    translation = FormTranslation(
+        form_id=form_id,
+        language=language,
+        content_hash=content_hash,
+        content=translated.model_dump_json(),
+    )
+    with Session(engine) as db_session:
+        db_session.exec(
+            insert(FormTranslation.__table__)
+            .values(translation.model_dump())
+            .on_conflict_do_nothing(
+                index_elements=["form_id", "language", "content_hash"]
+            )
+        )
+        db_session.commit()
+
+
+async def translate_and_store(
+    form_id: UUID,
+    data: FormTranslationModel,
+    language: SupportedLanguages,
+    content_hash: str,
+) -> FormTranslationModel:
+    """
+    Translates form data and stores the result once complete. Concurrent
+    calls for the same form content and language share a single
+    translation.
+    """
+
+    async def run():
+        translated, complete = await translate_form_data(data, language)
+        if complete:
+            store_translation(form_id, language, content_hash, translated)
+        return translated
+
+    return await form_translation_flight.do(
+        (form_id, language, content_hash), run
+    )
+
+
+async def precompute_form_translations(form_id: UUID):
+    """
+    Translates a form into every supported language that is not stored
+    yet. Runs as a background task, so it uses its own database session.
+    """
+    with Session(engine) as db_session:
+        form = db_session.get(Form, form_id)
+        if form is None:
+            return
+        data = form_translation_data(form)
+        content_hash = translation_content_hash(data)
+        stored_languages = set(
+            db_session.exec(
+                select(FormTranslation.language).where(
+                    FormTranslation.form_id == form_id,
+                    FormTranslation.content_hash == content_hash,
+                )
+            ).all()
+        )
+    semaphore = asyncio.Semaphore(TRANSLATION_PRECOMPUTE_CONCURRENCY)
+
+    async def translate_into(language: SupportedLanguages):
+        async with semaphore:
+            try:
+                await translate_and_store(
+                    form_id, data, language, content_hash
+                )
+            except Exception as e:
+                log_error(f"Could not translate form into {language}: {e}")
+
+    await asyncio.gather(
+        *[
+            translate_into(language)
+            for language in SUPPORTED_LANGUAGES
+            if language not in stored_languages
+        ]
+    )
+
+
 async def translate_form(
     db_session: Session, form_id: UUID, language: SupportedLanguages
 ):
     form = check_existence(db_session.get(Form, form_id))
-    form_fields = [form_field.to_dto() for form_field in form.fields]
-    data = FormTranslationModel(form=form.to_dto(), fields=form_fields)
-    translated_form = await translate_json(
-        json_data=data.model_dump_json(), language=language
+    data = form_translation_data(form)
+    content_hash = translation_content_hash(data)
+    stored_translation = db_session.exec(
+        select(FormTranslation).where(
+            FormTranslation.form_id == form.id,
+            FormTranslation.language == language,
+            FormTranslation.content_hash == content_hash,
+        )
+    ).first()
+    if stored_translation is not None:
+        return apply_translation(
+            data,
+            FormTranslationModel.model_validate_json(
+                stored_translation.content
+            ),
+        )
+
+    translated = await translate_and_store(
+        form.id, data, language, content_hash
     )
-    log_warning(translated_form)
-    return FormTranslationModel.model_validate_json(translated_form)
+    return apply_translation(data, translated)
+
+
+async def stream_translate_form(
+    db_session: Session, form_id: UUID, language: SupportedLanguages
+):
+    """
+    Streams the translation of a form as Server-Sent Events: each chunk
+    once translated, then the whole translation. Chunks go through the
+    same cache and single-flights as translate_form.
+    """
+    form = check_existence(db_session.get(Form, form_id))
+    data = form_translation_data(form)
+    content_hash = translation_content_hash(data)
+    stored_translation = db_session.exec(
+        select(FormTranslation).where(
+            FormTranslation.form_id == form.id,
+            FormTranslation.language == language,
+            FormTranslation.content_hash == content_hash,
+        )
+    ).first()
+    stored_content = (
+        stored_translation.content if stored_translation is not None else None
+    )
+    chunks = translation_chunks(data)
+
+    async def translate_indexed(index: int):
+        try:
+            return index, await translate_cached_chunk(chunks[index], language)
+        except Exception as e:
+            return index, e
+
+    async def events():
+        if stored_content is not None:
+            translated = FormTranslationModel.model_validate_json(
+                stored_content
+            )
+            yield sse_event(
+                apply_translation(data, translated).model_dump(mode="json"),
+                event="result",
+            )
+            return
+        # Shares its chunk translations with the chunks streamed below
+        translation = asyncio.ensure_future(
+            translate_and_store(form_id, data, language, content_hash)
+        )
+        try:
+            for next_chunk in asyncio.as_completed(
+                [translate_indexed(index) for index in range(len(chunks))]
+            ):
+                index, translated_chunk = await next_chunk
+                if isinstance(translated_chunk, Exception):
+                    continue
+                # Only the first chunk carries the form title
+                yield sse_event(
+                    apply_translation(
+                        chunks[index], translated_chunk
+                    ).model_dump(
+                        mode="json", exclude={"form"} if index else None
+                    ),
+                    event="chunk",
+                )
+            translated = await translation
+            yield sse_event(
+                apply_translation(data, translated).model_dump(mode="json"),
+                event="result",
+            )
+        except Exception as e:
+            log_error(e)
+            yield sse_event(
+                {"detail": "Could not translate form."}, event="error"
+            )
+
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 
 async def add_field_to_form(
@@ -159,6 +611,8 @@ async def add_field_to_form(
         .withActionName(ACTION_READWRITE)
         .forRole(rw_role)
     ).make()
+    invalidate_form_translations(db_session, form_id)
+    bump_form_version(db_session, form_id)
     db_session.add_all([field, rw_role, rw_permission])
     db_session.commit()
     db_session.refresh(field)
@@ -185,6 +639,8 @@ async def delete_field(
             ),
         ],
     ).check(either=True)
+    invalidate_form_translations(db_session, field.form_id)
+    bump_form_version(db_session, field.form_id)
     db_session.delete(field)
     db_session.commit()
     return MessageResponse(message="Field deleted successfully !")
@@ -310,11 +766,29 @@ async def respond_to_field(
             db_session.get(AnswerSession, response_session_id)
         )
     else:
-        new_rs = AnswerSession(form_id=field.form_id)
+        new_rs = AnswerSession(
+            form_id=field.form_id, form_version=field.form.version
+        )
         db_session.add(new_rs)
         db_session.commit()
         db_session.refresh(new_rs)
         response_session = new_rs
+    api_response.set_cookie(
+        key="response_session_id",
+        value=str(response_session.id),
+        httponly=True,
+    )
+    if ANSWER_STORAGE == "document":
+        save_answers(
+            db_session, response_session, {field.id: response_data.value}
+        )
+        return FieldResponseDTO(
+            id=document_answer_id(response_session.id, field.id),
+            field_id=field.id,
+            session_id=response_session.id,
+            value=response_data.value,
+            field=field.to_dto(),
+        )
     answer_fields = [
         response
         for response in response_session.answers
@@ -326,24 +800,42 @@ async def respond_to_field(
         if not field_already_answered
         else answer_fields[0]
     )
-    response.value = response_data.value
+    response.set_value(response_data.value, field.field_type)
     db_session.add(response)
     db_session.commit()
-    api_response.set_cookie(
-        key="response_session_id",
-        value=str(response_session.id),
-        httponly=True,
-    )
+    record_event("save")
     return response.to_dto()
 
 
+def save_answers(
+    db_session: Session,
+    answer_session: AnswerSession,
+    answers: dict[UUID, str | None],
+):
+    """
+    Document storage: merges validated answers into the session's answers
+    document, one UPDATE however many fields are saved.
+    """
+    write_document_answers(db_session, answer_session.id, answers)
+    db_session.commit()
+    record_event("save")
+
+
+def find_document_answer(answer_session: AnswerSession, answer_id: UUID):
+    """Field id of an answer stored in the session document, if any."""
+    for field_id in answer_session.answers_document or {}:
+        if document_answer_id(answer_session.id, UUID(field_id)) == answer_id:
+            return field_id
+    return None
+
+
 async def edit_response(
     db_session: Session,
     answer_id: UUID,
-    answer_session_id: str | None,
+    answer_session_id: UUID | None,
     value: str,
 ):
-    check_existence(
+    answer_session = check_existence(
         db_session.get(
             AnswerSession,
             check_existence(
@@ -352,8 +844,21 @@ async def edit_response(
         ),
         detail="Answer session not found.",
     )
-    answer = check_existence(db_session.get(FieldAnswer, answer_id))
-    answer.value = value
+    answer = db_session.get(FieldAnswer, answer_id)
+    if answer is None:
+        field_id = check_existence(
+            find_document_answer(answer_session, answer_id)
+        )
+        write_document_answers(
+            db_session, answer_session.id, {UUID(field_id): value}
+        )
+        if answer_session.submitted:
+            mark_aggregates_stale(db_session, answer_session.form_id)
+        db_session.commit()
+        return
+    answer.set_value(value, answer.field.field_type)
+    if answer.session.submitted:
+        mark_aggregates_stale(db_session, answer.session.form_id)
     db_session.add(answer)
     db_session.commit()
 
@@ -362,9 +867,23 @@ async def delete_response(
     db_session: Session,
     current_user: User | None,
     answer_id: UUID,
-    answer_session_id: str | None,
+    answer_session_id: UUID | None,
 ):
-    answer = check_existence(db_session.get(FieldAnswer, answer_id))
+    answer = db_session.get(FieldAnswer, answer_id)
+    if answer is None and answer_session_id is not None:
+        # Answers stored in a document are only reachable from their session
+        answer_session = check_existence(
+            db_session.get(AnswerSession, answer_session_id)
+        )
+        field_id = check_existence(
+            find_document_answer(answer_session, answer_id)
+        )
+        remove_document_answer(db_session, answer_session.id, UUID(field_id))
+        if answer_session.submitted:
+            mark_aggregates_stale(db_session, answer_session.form_id)
+        db_session.commit()
+        return MessageResponse(message="Answer deleted.")
+    answer = check_existence(answer)
     if answer_session_id is None:
         PermissionChecker(
             db_session=db_session,
@@ -383,6 +902,8 @@ async def delete_response(
             status_code=HTTP_401_UNAUTHORIZED,
             detail="Not authorized to delete this resource",
         )
+    if answer.session.submitted:
+        mark_aggregates_stale(db_session, answer.session.form_id)
     db_session.delete(answer)
     db_session.commit()
     return MessageResponse(message="Answer deleted.")
@@ -403,6 +924,11 @@ async def submit(
         )
     )
 
+    check_conditions(
+        [not answer_session.submitted],
+        detail="Responses already submitted.",
+        status_code=HTTP_409_CONFLICT,
+    )
     if answer_session.form.submissions_limit is not None:
         check_conditions(
             [
@@ -418,40 +944,51 @@ async def submit(
             FormField.form_id == form_id,
         )
     ).all()
-    answered_required_fields = db_session.exec(
-        select(FormField)
-        .where(
-            FormField.required == True,
-            FormField.form_id == form_id,
-        )
-        .join(FieldAnswer)
-        .where(FieldAnswer.session_id == answer_session.id)
-    ).all()
+    # Answer rows and the answers document alike
+    answers = answer_session.answer_values()
 
     for form_field in all_required_fields:
         check_conditions(
-            [form_field in answered_required_fields],
+            [form_field.id in answers],
             detail=f"Field '{form_field.label}' not answered.",
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
     # Validate all answers only at submission time
-    for ans in answer_session.answers:
-        # Ensure field is loaded; fallback to DB if necessary
-        field = (
-            ans.field
-            if hasattr(ans, "field") and ans.field
-            else db_session.get(FormField, ans.field_id)
-        )
+    fields = {field.id: field for field in answer_session.form.fields}
+    for field_id, value in answers.items():
+        field = fields.get(field_id)
         if field is None:
             continue
-        validate_answer(ans.value, field)
+        validate_answer(value, field)
 
-    answer_session.submitted = True
-    answer_session.form.submissions += 1
-    answer_session.submitted_at = datetime.now(timezone.utc)
-    db_session.add_all([answer_session, answer_session.form])
+    # Claimed with a conditional UPDATE, so that concurrent submissions of
+    # the same session count it once
+    claimed = db_session.exec(
+        update(AnswerSession)
+        .where(
+            AnswerSession.id == answer_session.id,
+            AnswerSession.submitted.is_(False),
+        )
+        .values(
+            submitted=True,
+            form_version=answer_session.form.version,
+            submitted_at=datetime.now(timezone.utc),
+        )
+    ).rowcount
+    check_conditions(
+        [claimed == 1],
+        detail="Responses already submitted.",
+        status_code=HTTP_409_CONFLICT,
+    )
+    db_session.exec(
+        update(Form)
+        .where(Form.id == answer_session.form_id)
+        .values(submissions=Form.submissions + 1)
+    )
+    aggregate_submission(db_session, fields, answers)
     db_session.commit()
+    record_event("submission")
     response.delete_cookie(ANSWER_SESSION_COOKIE_KEY)
     return MessageResponse(message="Responses submitted.")
 
@@ -480,6 +1017,7 @@ async def open_form(
     db_session: Session,
     current_user: User,
     form_id: UUID,
+    bt: BackgroundTasks,
 ):
     """Open a form to allow new responses"""
     PermissionChecker(
@@ -498,6 +1036,7 @@ async def open_form(
     form.open = True
     db_session.add(form)
     db_session.commit()
+    bt.add_task(precompute_form_translations, form_id=form_id)
     return MessageResponse(message="Form opened.")
 
 
@@ -519,11 +1058,24 @@ async def save_responses(
             db_session.get(AnswerSession, answer_session_id)
         )
     else:
-        new_rs = AnswerSession(form_id=data.form_id)
+        new_rs = AnswerSession(
+            form_id=data.form_id,
+            form_version=check_existence(
+                read_form_state(db_session, data.form_id)
+            ).version,
+        )
         db_session.add(new_rs)
         db_session.commit()
         db_session.refresh(new_rs)
         answer_session = new_rs
+    if ANSWER_STORAGE == "document":
+        answers = {}
+        for k, v in data.field_answers.items():
+            field = check_existence(db_session.get(FormField, k))
+            validate_answer(field=field, answer=v)
+            answers[field.id] = v
+        save_answers(db_session, answer_session, answers)
+        return answer_session.to_dto()
     for k, v in data.field_answers.items():
         field = check_existence(db_session.get(FormField, k))
         validate_answer(field=field, answer=v)
@@ -539,9 +1091,10 @@ async def save_responses(
             )
             db_session.add(field_answer)
             db_session.commit()
-        field_answer.value = v
+        field_answer.set_value(v, field.field_type)
         db_session.add(field_answer)
         db_session.commit()
+    record_event("save")
     return answer_session.to_dto()
 
 
@@ -551,6 +1104,10 @@ async def get_responses(
     form_id: UUID,
     skip: int,
     limit: int,
+    filters: list[str] | None = None,
+    submitted_after: datetime | None = None,
+    submitted_before: datetime | None = None,
+    q: str | None = None,
 ):
     PermissionChecker(
         db_session=db_session,
@@ -565,21 +1122,141 @@ async def get_responses(
         ],
     ).check()
     form = check_existence(db_session.get(Form, form_id))
+    response_filters = [parse_response_filter(raw) for raw in filters or []]
+    # Document answers live in a JSON column filters and search ignore
+    check_conditions(
+        [(not response_filters and q is None) or ANSWER_STORAGE == "rows"],
+        status_code=HTTP_400_BAD_REQUEST,
+        detail="Field filters and search require row answer storage",
+    )
+    field_types = (
+        dict(
+            db_session.exec(
+                select(FormField.id, FormField.field_type).where(
+                    FormField.form_id == form.id
+                )
+            ).all()
+        )
+        if response_filters
+        else {}
+    )
+    conditions = [
+        response_filter_clause(response_filter, field_types)
+        for response_filter in response_filters
+    ]
+    if submitted_after is not None:
+        conditions.append(AnswerSession.submitted_at >= submitted_after)
+    if submitted_before is not None:
+        conditions.append(AnswerSession.submitted_at < submitted_before)
+    statement = select(AnswerSession).where(
+        AnswerSession.form_id == form.id,
+        AnswerSession.submitted == True,
+        *conditions,
+    )
+    ranks = answer_search_ranks(db_session, form.id, q) if q else None
+    if ranks is not None:
+        statement = statement.join(
+            ranks, ranks.c.session_id == AnswerSession.id
+        ).order_by(ranks.c.rank.desc())
     answer_sessions = check_existence(
         (
             db_session.exec(
-                select(AnswerSession)
-                .where(
-                    AnswerSession.form_id == form.id,
-                    AnswerSession.submitted == True,
-                )
-                .order_by(asc(AnswerSession.submitted_at))
+                statement.order_by(asc(AnswerSession.submitted_at))
                 .offset(skip)
                 .limit(limit)
             )
         ).all()
     )
-    return [answer_session.to_dto() for answer_session in answer_sessions]
+    return json_response(
+        ANSWER_SESSIONS_ADAPTER,
+        [answer_session.to_dto() for answer_session in answer_sessions],
+    )
+
+
+async def get_form_summary(
+    db_session: Session, current_user: User, form_id: UUID
+):
+    """Per-field summary of the submitted answers, from the aggregates."""
+    PermissionChecker(
+        db_session=db_session,
+        roles=current_user.roles,
+        bypass_roles=[SUPER_ADMIN_ROLE_NAME, ADMIN_ROLE_NAME],
+        pcheck_models=[
+            PermissionCheckModel(
+                resource_name=FORM_RESOURCE,
+                resource_id=form_id,
+                action_names=[ACTION_READWRITE],
+            )
+        ],
+    ).check()
+    submissions, aggregates_stale = check_existence(
+        db_session.exec(
+            select(Form.submissions, Form.aggregates_stale).where(
+                Form.id == form_id
+            )
+        ).first()
+    )
+    if aggregates_stale:
+        rebuild_form_aggregates(db_session, form_id)
+        db_session.commit()
+    return FormSummaryDTO(
+        form_id=form_id,
+        submissions=submissions,
+        fields=read_field_summaries(db_session, form_id),
+    )
+
+
+def compute_form_funnel(form_id: UUID) -> FormFunnelDTO:
+    with Session(engine) as db_session:
+        return read_form_funnel(db_session, form_id)
+
+
+async def get_form_funnel(
+    db_session: Session, current_user: User, form_id: UUID
+):
+    """
+    Per-field completion funnel of a form, computed off the event loop and
+    cached for FORM_FUNNEL_TTL seconds.
+    """
+    PermissionChecker(
+        db_session=db_session,
+        roles=current_user.roles,
+        bypass_roles=[SUPER_ADMIN_ROLE_NAME, ADMIN_ROLE_NAME],
+        pcheck_models=[
+            PermissionCheckModel(
+                resource_name=FORM_RESOURCE,
+                resource_id=form_id,
+                action_names=[ACTION_READWRITE],
+            )
+        ],
+    ).check()
+    check_existence(
+        db_session.exec(select(Form.id).where(Form.id == form_id)).first()
+    )
+    check_conditions(
+        [ANSWER_STORAGE == "rows"],
+        status_code=HTTP_400_BAD_REQUEST,
+        detail="The completion funnel requires row answer storage",
+    )
+    return await form_funnel_cache.get_or_load(
+        form_id, lambda: asyncio.to_thread(compute_form_funnel, form_id)
+    )
+
+
+def response_rows(
+    fields: Sequence[FormField], answer_sessions: Sequence[AnswerSession]
+):
+    """Pivots answer sessions into CSV rows ordered like `fields`."""
+    for session in answer_sessions:
+        values_by_field_id = session.answer_values()
+        row = [values_by_field_id.get(field.id) or "" for field in fields]
+        submitted_at = (
+            session.submitted_at.isoformat()
+            if session.submitted_at is not None
+            else ""
+        )
+        row += [str(session.id), submitted_at]
+        yield row
 
 
 async def export_responses_csv(
@@ -626,20 +1303,10 @@ async def export_responses_csv(
     ]
     csv_writer.writerow(headers)
 
-    for session in answer_sessions:
-        values_by_field_id = {
-            ans.field_id: (ans.value or "") for ans in session.answers
-        }
-        row = [values_by_field_id.get(field.id, "") for field in fields]
-        submitted_at = (
-            session.submitted_at.isoformat()
-            if session.submitted_at is not None
-            else ""
-        )
-        row += [str(session.id), submitted_at]
-        csv_writer.writerow(row)
+    csv_writer.writerows(response_rows(fields, answer_sessions))
 
     csv_data = csv_output.getvalue()
+    record_event("export")
     filename_label = (form.label or "form").strip().replace(" ", "_")
     headers_dict = {
         "Content-Disposition": f'attachment; filename="{filename_label}_responses.csv"'
@@ -674,21 +1341,133 @@ async def get_forms(
     return [form.to_dto() for form in forms]
 
 
+def bump_form_version(db_session: Session, form_id: UUID):
+    """
+    Gives a form a new schema version, in the caller's transaction. Called
+    by every change to the form or its fields.
+    """
+    db_session.exec(
+        update(Form)
+        .where(Form.id == form_id)  # type: ignore[arg-type]
+        .values(version=Form.version + 1)
+    )
+
+
+def read_form_state(db_session: Session, form_id: UUID):
+    """The parts of a form that change without a new version."""
+    return db_session.exec(
+        select(Form.version, Form.open, Form.submissions).where(
+            Form.id == form_id
+        )
+    ).first()
+
+
+def read_form_schema(form_id: UUID) -> FormSchemaDTO | None:
+    with Session(engine) as db_session:
+        form = db_session.exec(
+            select(Form)
+            .where(Form.id == form_id)
+            .options(
+                noload(Form.answer_sessions),  # type: ignore[arg-type]
+                selectinload(Form.fields).noload(  # type: ignore[arg-type]
+                    FormField.answers  # type: ignore[arg-type]
+                ),
+            )
+        ).first()
+        if form is None:
+            return None
+        fields = sorted(
+            form.fields,
+            key=lambda field: (field.position is None, field.position or 0),
+        )
+        return FormSchemaDTO(
+            form=form.to_dto(),
+            fields=[field.to_dto() for field in fields],
+        )
+
+
+async def load_form_schema(
+    form_id: UUID, version: int
+) -> FormSchemaDTO | None:
+    """
+    Loads a version of a form and its fields off the event loop, through
+    an in-process cache. Concurrent loads share one database round trip.
+    """
+    return await form_schema_cache.get_or_load(
+        (form_id, version),
+        lambda: asyncio.to_thread(read_form_schema, form_id),
+    )
+
+
+async def load_form(db_session: Session, form_id: UUID) -> FormSchemaDTO:
+    """
+    The current schema of a form: its version, open state and submissions
+    are read by primary key, the rest comes from the schema cache.
+    """
+    state = check_existence(read_form_state(db_session, form_id))
+    schema = check_existence(await load_form_schema(form_id, state.version))
+    return FormSchemaDTO(
+        form=schema.form.model_copy(
+            update={"open": state.open, "submissions": state.submissions}
+        ),
+        fields=schema.fields,
+    )
+
+
+def form_accepts_responses(form: FormDTO):
+    return form.open and not (
+        (form.deadline is not None and form.deadline < datetime.now())
+        or (
+            form.submissions_limit is not None
+            and form.submissions >= form.submissions_limit
+        )
+    )
+
+
+def schema_cache_headers(schema: FormSchemaDTO, public: bool):
+    """
+    Forms accepting responses are public and may be kept by browsers and
+    proxies for FORM_SCHEMA_MAX_AGE seconds, others are only revalidated.
+    Submissions only change the ETag when they close the form, so that
+    active forms stay cached.
+    """
+    form = schema.form
+    return {
+        "ETag": f'"{form.version}.{int(form.open)}.{int(public)}"',
+        "Cache-Control": (
+            f"public, max-age={FORM_SCHEMA_MAX_AGE}"
+            if public
+            else "private, no-cache"
+        ),
+    }
+
+
+def schema_response[T](
+    schema: FormSchemaDTO,
+    adapter: TypeAdapter[T],
+    content: T,
+    public: bool,
+    if_none_match: str | None,
+):
+    """Renders part of a schema, or a 304 if the client copy is fresh."""
+    headers = schema_cache_headers(schema, public)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    return json_response(adapter, content, headers=headers)
+
+
 async def get_form_by_id(
     db_session: Session,
     form_id: UUID,
     current_user: User | None = None,
+    if_none_match: str | None = None,
 ):
     """Get a specific form by ID - Public access for form filling"""
-    form = check_existence(db_session.get(Form, form_id))
+    schema = await load_form(db_session, form_id)
+    form = schema.form
 
-    if not form.open or (
-        (form.deadline is not None and form.deadline < datetime.now())
-        or (
-            form.submissions_limit is not None
-            and form.submissions >= form.submissions_limit
-        )
-    ):
+    public = form_accepts_responses(form)
+    if not public:
         PermissionChecker(
             db_session=db_session,
             roles=(check_existence(current_user)).roles,
@@ -701,17 +1480,111 @@ async def get_form_by_id(
                 )
             ],
         ).check()
-    return form.to_dto()
+    return schema_response(schema, FORM_ADAPTER, form, public, if_none_match)
 
 
 async def get_form_fields(
     db_session: Session,
     form_id: UUID,
     current_user: User | None = None,
+    if_none_match: str | None = None,
 ):
     """Get all fields for a specific form - Public access for form filling"""
-    form = check_existence(db_session.get(Form, form_id))
-    if not form.open:
+    schema = await load_form(db_session, form_id)
+    if not schema.form.open:
+        PermissionChecker(
+            db_session=db_session,
+            roles=(check_existence(current_user)).roles,
+            bypass_roles=[ADMIN_ROLE_NAME, SUPER_ADMIN_ROLE_NAME],
+            pcheck_models=[
+                PermissionCheckModel(
+                    resource_name=FORM_RESOURCE,
+                    resource_id=form_id,
+                    action_names=[ACTION_READWRITE],
+                )
+            ],
+        ).check()
+    # Open forms past their deadline or limit stay readable, not public
+    return schema_response(
+        schema,
+        FIELDS_ADAPTER,
+        schema.fields,
+        form_accepts_responses(schema.form),
+        if_none_match,
+    )
+
+
+def read_answer_session(
+    db_session: Session, schema: FormSchemaDTO, answer_session_id: UUID
+) -> AnswerSessionDTO | None:
+    """
+    Reads an answer session of the form and its answers in one query,
+    reusing the field DTOs of the schema instead of loading relationships.
+    """
+    rows = db_session.exec(
+        select(
+            AnswerSession.submitted,
+            AnswerSession.form_version,
+            AnswerSession.answers_document,
+            FieldAnswer.id,
+            FieldAnswer.field_id,
+            FieldAnswer.value,
+        )
+        .outerjoin(FieldAnswer)
+        .where(
+            AnswerSession.id == answer_session_id,
+            AnswerSession.form_id == schema.form.id,
+        )
+    ).all()
+    if not rows:
+        return None
+    fields = {field.id: field for field in schema.fields}
+    submitted, form_version, document, *_ = rows[0]
+    answers = {
+        field_id: (answer_id, value)
+        for *_, answer_id, field_id, value in rows
+        if answer_id is not None
+    }
+    for key, value in (document or {}).items():
+        field_id = UUID(key)
+        answers[field_id] = (
+            document_answer_id(answer_session_id, field_id),
+            value,
+        )
+    return AnswerSessionDTO(
+        id=answer_session_id,
+        form_id=schema.form.id,
+        submitted=submitted,
+        form_version=form_version,
+        answers=[
+            FieldResponseDTO(
+                id=answer_id,
+                field_id=field_id,
+                session_id=answer_session_id,
+                value=value,
+                field=fields[field_id],
+            )
+            for field_id, (answer_id, value) in answers.items()
+            if field_id in fields
+        ],
+    )
+
+
+async def get_form_bootstrap(
+    db_session: Session,
+    form_id: UUID,
+    current_user: User | None = None,
+    answer_session_id: UUID | None = None,
+):
+    """
+    Everything the fill page needs in one call: the form, its ordered
+    fields, the caller's answer session and whether responses are accepted.
+    The schema part comes from the form schema cache.
+    """
+    schema = await load_form(db_session, form_id)
+    form = schema.form
+    accepting = form_accepts_responses(form)
+    if not accepting:
         PermissionChecker(
             db_session=db_session,
             roles=(check_existence(current_user)).roles,
@@ -724,7 +1597,31 @@ async def get_form_fields(
                 )
             ],
         ).check()
-    return [field.to_dto() for field in form.fields]
+
+    bootstrap = FormBootstrapDTO(
+        form=form,
+        fields=schema.fields,
+        answer_session=(
+            read_answer_session(db_session, schema, answer_session_id)
+            if answer_session_id is not None
+            else None
+        ),
+        acceptance=FormAcceptanceDTO(
+            accepting=accepting,
+            open=form.open,
+            deadline=form.deadline,
+            remaining=(
+                max(form.submissions_limit - form.submissions, 0)
+                if form.submissions_limit is not None
+                else None
+            ),
+        ),
+    )
+    return json_response(
+        BOOTSTRAP_ADAPTER,
+        bootstrap,
+        headers={"Cache-Control": "private, no-cache"},
+    )
 
 
 async def update_form(
@@ -761,6 +1658,8 @@ async def update_form(
     if deadline is not None:
         form.deadline = deadline
 
+    invalidate_form_translations(db_session, form.id)
+    bump_form_version(db_session, form.id)
     db_session.add(form)
     db_session.commit()
     db_session.refresh(form)
@@ -830,8 +1729,9 @@ async def update_form_field(
         field.label = field_label
     if field_description is not None:
         field.description = field_description
-    if field_type is not None:
+    if field_type is not None and field_type != field.field_type:
         field.field_type = field_type
+        retype_field_answers(db_session, field_id, field_type)
     if required is not None:
         field.required = required
     if possible_answers is not None:
@@ -842,13 +1742,56 @@ async def update_form_field(
         field.text_bounds = text_bounds
     if field_position is not None:
         field.position = field_position
+    if (
+        field_type is not None
+        or possible_answers is not None
+        or number_bounds is not None
+    ):
+        mark_aggregates_stale(db_session, field.form_id)
 
+    invalidate_form_translations(db_session, field.form_id)
+    bump_form_version(db_session, field.form_id)
     db_session.add(field)
     db_session.commit()
     db_session.refresh(field)
     return field.to_dto()
 
 
+def retype_field_answers(db_session: Session, field_id: UUID, field_type: str):
+    """
+    Recomputes the typed copies of the answers to a field whose type
+    changed, RETYPE_BATCH_SIZE answers at a time. Before commit.
+    """
+    if field_type not in TYPED_FIELD_TYPES:
+        db_session.exec(
+            update(FieldAnswer)
+            .where(FieldAnswer.field_id == field_id)
+            .values(value_num=None, value_date=None, value_bool=None)
+        )
+        return
+    last_id = None
+    while True:
+        statement = (
+            select(FieldAnswer.id, FieldAnswer.value)
+            .where(FieldAnswer.field_id == field_id)
+            .order_by(FieldAnswer.id)
+            .limit(RETYPE_BATCH_SIZE)
+        )
+        if last_id is not None:
+            statement = statement.where(FieldAnswer.id > last_id)
+        answers = db_session.exec(statement).all()
+        if not answers:
+            return
+        db_session.exec(
+            update(FieldAnswer),
+            params=[
+                {"id": answer_id, **typed_answer_values(field_type, value)}
+                for answer_id, value in answers
+            ],
+        )
+        last_id = answers[-1][0]
+
+
 async def get_user_forms(
     db_session: Session,
     current_user: User,
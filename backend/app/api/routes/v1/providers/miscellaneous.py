@@ -1,6 +1,50 @@
-from app.core.services.ai.translation import SupportedLanguages, translate
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from app.api.routes.v1.providers.diagnostics import check_admin
+from app.core.db.models import User
+from app.core.logging.log import log_error
+from app.core.services.ai.providers import llm_metrics
+from app.core.services.ai.translation import (
+    SupportedLanguages,
+    stream_translate,
+    translate,
+)
+from app.utils.singleflight import SingleFlight, singleflight_stats
+from app.utils.sse import sse_event
+
+text_translation_flight = SingleFlight("text_translation")
 
 
 async def translate_text(text: str, language: SupportedLanguages):
-    translated_text = await translate(text=text, language=language)
+    translated_text = await text_translation_flight.do(
+        (language, text), lambda: translate(text=text, language=language)
+    )
     return translated_text
+
+
+async def stream_translate_text(text: str, language: SupportedLanguages):
+    async def events():
+        try:
+            async for translated_text in stream_translate(
+                text=text, language=language
+            ):
+                yield sse_event({"text": translated_text})
+            yield sse_event({}, event="done")
+        except Exception as e:
+            log_error(e)
+            yield sse_event(
+                {"detail": "Could not get a response."}, event="error"
+            )
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+async def get_coalescing_stats(db_session: Session, current_user: User):
+    check_admin(db_session, current_user)
+    return singleflight_stats()
+
+
+async def get_llm_metrics(db_session: Session, current_user: User):
+    check_admin(db_session, current_user)
+    return llm_metrics()
@@ -1,6 +1,9 @@
 from fastapi import APIRouter
 
 from app.api.routes.v1.controllers.auth import router as auth_router
+from app.api.routes.v1.controllers.diagnostics import (
+    router as diagnostics_router,
+)
 from app.api.routes.v1.controllers.form import router as form_router
 from app.api.routes.v1.controllers.miscellaneous import (
     router as miscellaneous_router,
@@ -11,3 +14,4 @@ router = APIRouter(prefix="/api/v1")
 router.include_router(auth_router)
 router.include_router(form_router)
 router.include_router(miscellaneous_router)
+router.include_router(diagnostics_router)
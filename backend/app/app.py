@@ -1,12 +1,31 @@
 from contextlib import asynccontextmanager
+from typing import Annotated
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from sqlmodel import Session
 
+from app.api.routes.v1.providers.auth import (
+    USER_SESSION_COOKIE_ID,
+    get_current_user,
+)
+from app.api.routes.v1.providers.diagnostics import check_admin
 from app.api.routes.v1.router import router as v1_router
 from app.core.config.env import get_env
-from app.core.db.setup import setup_db
+from app.core.db.middleware import QueryCountMiddleware
+from app.core.db.models import User
+from app.core.db.setup import create_db_session, engine, setup_db
+from app.core.db.slow_queries import slow_query_log
+from app.core.logging.log import setup_logging, stop_logging
+from app.core.metrics.middleware import MetricsMiddleware
+from app.core.metrics.registry import Gauge, register_collector, render_metrics
+from app.core.profiling.middleware import ProfilingMiddleware
+from app.core.services.ai.client import close_http_client, open_http_client
+from app.core.services.ai.providers import llm_metrics
+from app.utils.singleflight import singleflight_stats
+from app.utils.ttl_cache import cache_stats
 
 DEBUG = get_env("DEBUG", "True") == "True"
 PORT = int(get_env("PORT", "8000")) or 8000
@@ -16,12 +35,19 @@ CORS_ORIGINS = [o.strip() for o in get_env("CORS_ORIGINS", "").split(",")]
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     # startup
+    setup_logging()
     setup_db()
+    await open_http_client()
     yield
+    # shutdown
+    await close_http_client()
+    slow_query_log.dump()
+    stop_logging()
 
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=("/docs" if DEBUG is True else None),
     redoc_url=("/redoc" if DEBUG is True else None),
     openapi_url=("/openapi.json" if DEBUG is True else None),
@@ -30,6 +56,62 @@ app = FastAPI(
 app.include_router(v1_router)
 
 
+def collect_service_metrics():
+    coalescing = Gauge(
+        "singleflight_calls",
+        "Single-flight calls by group and outcome.",
+        ("group", "outcome"),
+    )
+    for group, stats in singleflight_stats().items():
+        for outcome in ("executed", "coalesced", "in_flight"):
+            coalescing.set(group, outcome, value=stats[outcome])
+    llm = Gauge(
+        "llm_usage",
+        "LLM requests, failures and token usage by model.",
+        ("model", "kind"),
+    )
+    for model, stats in llm_metrics().items():
+        for kind in ("requests", "failures", "rejected", "total_tokens"):
+            llm.set(model, kind, value=stats[kind])
+    cache = Gauge(
+        "cache_usage",
+        "In-process cache hits, misses and size by cache.",
+        ("cache", "kind"),
+    )
+    for name, stats in cache_stats().items():
+        for kind in ("hits", "misses", "size"):
+            cache.set(name, kind, value=stats[kind])
+    return [coalescing, llm, cache]
+
+
+register_collector(collect_service_metrics)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(
+    db_session: Annotated[Session, Depends(create_db_session)],
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    check_admin(db_session, current_user)
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4"
+    )
+
+
+async def can_profile(request: Request):
+    """Only admins' requests can be profiled."""
+    with Session(engine) as db_session:
+        try:
+            current_user = await get_current_user(
+                db_session=db_session,
+                session_id=request.cookies.get(USER_SESSION_COOKIE_ID),
+            )
+            check_admin(db_session, current_user)
+        except HTTPException:
+            return False
+    return True
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -42,6 +124,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(QueryCountMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware, allow=can_profile)
 
 
 def run_app():
@@ -19,7 +19,40 @@ EnvKey = Literal[
     "PG_PASSWORD",
     "PG_DATABASE",
     "GEMINI_API_KEY",
+    "GEMINI_API_URL",
+    "GEMINI_CONNECT_TIMEOUT",
+    "GEMINI_READ_TIMEOUT",
+    "GEMINI_MAX_CONCURRENCY",
     "CORS_ORIGINS",
+    "SQL_QUERY_BUDGET",
+    "SQL_QUERY_BUDGET_STRICT",
+    "SQL_LOG_QUERIES",
+    "SLOW_QUERY_MS",
+    "SLOW_QUERY_DUMP_DIR",
+    "LOG_FILE",
+    "LOG_LEVEL",
+    "LOG_LEVELS",
+    "LOG_MAX_BYTES",
+    "LOG_BACKUP_COUNT",
+    "LLM_MODEL",
+    "LLM_RATE_PER_SECOND",
+    "LLM_BURST",
+    "LLM_MAX_IN_FLIGHT",
+    "LLM_BREAKER_THRESHOLD",
+    "LLM_BREAKER_COOLDOWN",
+    "LLM_STUB_LATENCY_MS",
+    "TRANSLATION_PRECOMPUTE_CONCURRENCY",
+    "TRANSLATION_CHUNK_SIZE",
+    "TRANSLATION_CHUNK_RETRIES",
+    "TRANSLATION_CHUNK_BACKOFF_MS",
+    "TRANSLATION_CHUNK_CACHE_SIZE",
+    "PROFILE_DIR",
+    "ANSWER_STORAGE",
+    "FORM_SCHEMA_CACHE_SIZE",
+    "FORM_SCHEMA_MAX_AGE",
+    "FORM_FUNNEL_TTL",
+    "FORM_FUNNEL_CACHE_SIZE",
+    "PROFILE_KEEP",
 ]
 
 
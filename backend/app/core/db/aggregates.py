@@ -0,0 +1,316 @@
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy import case
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import noload
+from sqlmodel import Session, delete, select, update
+
+from app.api.routes.v1.dto.form import FieldSummaryDTO
+from app.core.db.documents import has_document
+from app.core.db.models import (
+    AnswerSession,
+    FieldAggregate,
+    FieldAnswer,
+    Form,
+    FormField,
+)
+from app.utils.answers import NUMERIC_FIELD_TYPES, typed_answer_values
+
+AGGREGATED_FIELD_TYPES = (
+    "Select",
+    "Multiselect",
+    "Boolean",
+    *NUMERIC_FIELD_TYPES,
+)
+HISTOGRAM_BINS = 10
+
+AggregateKey = tuple[UUID, str, str]  # field_id, kind, bucket
+
+
+def field_options(field: FormField) -> list[str]:
+    if field.possible_answers is None:
+        return []
+    return [option.strip() for option in field.possible_answers.split("\\")]
+
+
+def histogram_bin(value: float, number_bounds: str | None) -> str:
+    """
+    "low:high" bin of a numeric answer: HISTOGRAM_BINS equal bins over
+    the field's bounds, decades (mirrored for negatives) without bounds.
+    """
+    if number_bounds is not None:
+        low, high = (float(bound) for bound in number_bounds.split(":"))
+        if high > low:
+            width = (high - low) / HISTOGRAM_BINS
+            index = min(
+                max(int((value - low) // width), 0), HISTOGRAM_BINS - 1
+            )
+            start = low + index * width
+            return f"{start:g}:{start + width:g}"
+    if abs(value) < 1:
+        return "-1:1"
+    magnitude = 10 ** math.floor(math.log10(abs(value)))
+    if value < 0:
+        return f"{-magnitude * 10:g}:{-magnitude:g}"
+    return f"{magnitude:g}:{magnitude * 10:g}"
+
+
+def answer_aggregates(
+    field: FormField, value: str | None
+) -> list[FieldAggregate]:
+    """Aggregate rows counting a single answer to `field`."""
+    if field.field_type not in AGGREGATED_FIELD_TYPES or not value:
+        return []
+    aggregates = [FieldAggregate(field_id=field.id, kind="answered", count=1)]
+    match field.field_type:
+        case "Select":
+            options = [value]
+        case "Multiselect":
+            options = value.split(",")
+        case "Boolean":
+            options = ["true" if value == "1" else "false"]
+        case _:
+            options = []
+    aggregates += [
+        FieldAggregate(
+            field_id=field.id, kind="option", bucket=option, count=1
+        )
+        for option in options
+    ]
+    number = typed_answer_values(field.field_type, value)["value_num"]
+    if number is not None:
+        aggregates += [
+            FieldAggregate(
+                field_id=field.id,
+                kind="numeric",
+                count=1,
+                total=number,
+                minimum=number,
+                maximum=number,
+            ),
+            FieldAggregate(
+                field_id=field.id,
+                kind="bin",
+                bucket=histogram_bin(number, field.number_bounds),
+                count=1,
+            ),
+        ]
+    return aggregates
+
+
+def combine(
+    aggregates: Iterable[FieldAggregate],
+) -> dict[AggregateKey, FieldAggregate]:
+    """Sums aggregate rows sharing a key."""
+    combined: dict[AggregateKey, FieldAggregate] = {}
+    for aggregate in aggregates:
+        key = (aggregate.field_id, aggregate.kind, aggregate.bucket)
+        current = combined.get(key)
+        if current is None:
+            combined[key] = aggregate
+            continue
+        current.count += aggregate.count
+        # Only "numeric" rows carry a total, always with their bounds
+        if current.total is not None and aggregate.total is not None:
+            current.total += aggregate.total
+            current.minimum = min(current.minimum, aggregate.minimum)
+            current.maximum = max(current.maximum, aggregate.maximum)
+    return combined
+
+
+def add_to_aggregates(
+    db_session: Session, aggregates: Iterable[FieldAggregate]
+):
+    """
+    Adds `aggregates` to the stored ones with one upsert, so that
+    concurrent submissions increment the same rows without losing counts.
+    """
+    rows = [
+        aggregate.model_dump() for aggregate in combine(aggregates).values()
+    ]
+    if not rows:
+        return
+    match db_session.get_bind().dialect.name:
+        case "postgresql":
+            insert = postgresql.insert
+        case "sqlite":
+            insert = sqlite.insert
+        case dialect:
+            raise NotImplementedError(f"No aggregate upsert on {dialect}")
+    table = FieldAggregate.__table__
+    statement = insert(table).values(rows)
+    added = statement.excluded
+    db_session.exec(
+        statement.on_conflict_do_update(
+            index_elements=["field_id", "kind", "bucket"],
+            set_={
+                "count": table.c.count + added.count,
+                "total": table.c.total + added.total,
+                "minimum": case(
+                    (added.minimum < table.c.minimum, added.minimum),
+                    else_=table.c.minimum,
+                ),
+                "maximum": case(
+                    (added.maximum > table.c.maximum, added.maximum),
+                    else_=table.c.maximum,
+                ),
+            },
+        )
+    )
+
+
+def aggregate_submission(
+    db_session: Session,
+    fields: Mapping[UUID, FormField],
+    answers: Mapping[UUID, str | None],
+):
+    """
+    Counts the answers of a session being submitted, before commit and
+    after the submission count of the form was updated.
+    """
+    add_to_aggregates(
+        db_session,
+        (
+            aggregate
+            for field_id, value in answers.items()
+            if field_id in fields
+            for aggregate in answer_aggregates(fields[field_id], value)
+        ),
+    )
+
+
+def mark_aggregates_stale(db_session: Session, form_id: UUID):
+    """Has the aggregates of a form rebuilt on their next read."""
+    db_session.exec(
+        update(Form).where(Form.id == form_id).values(aggregates_stale=True)
+    )
+
+
+def read_aggregated_fields(
+    db_session: Session, form_id: UUID
+) -> Sequence[FormField]:
+    """Fields of a form that are aggregated, without their answers."""
+    return db_session.exec(
+        select(FormField)
+        .options(noload(FormField.answers), noload(FormField.form))
+        .where(
+            FormField.form_id == form_id,
+            FormField.field_type.in_(AGGREGATED_FIELD_TYPES),
+        )
+        .order_by(FormField.position)
+    ).all()
+
+
+def rebuild_form_aggregates(db_session: Session, form_id: UUID):
+    """
+    Recomputes the aggregates of a form from its submitted answers, after
+    a migration or a change to how its fields are aggregated.
+
+    The form row stays locked until commit: submissions and changes that
+    mark the aggregates stale update it, so they wait for the rebuild
+    rather than interleave with it, and a rebuild that waited on another
+    one finds the aggregates fresh and stops.
+    """
+    stale = db_session.exec(
+        select(Form.aggregates_stale)
+        .where(Form.id == form_id)
+        .with_for_update()
+    ).first()
+    if not stale:
+        return
+    fields = {
+        field.id: field
+        for field in read_aggregated_fields(db_session, form_id)
+    }
+    db_session.exec(
+        delete(FieldAggregate).where(
+            FieldAggregate.field_id.in_(
+                select(FormField.id).where(FormField.form_id == form_id)
+            )
+        )
+    )
+    submitted = (AnswerSession.form_id == form_id) & (
+        AnswerSession.submitted.is_(True)
+    )
+    answers: dict[UUID, dict[UUID, str | None]] = {}
+    for session_id, field_id, value in db_session.exec(
+        select(FieldAnswer.session_id, FieldAnswer.field_id, FieldAnswer.value)
+        .join(AnswerSession, AnswerSession.id == FieldAnswer.session_id)
+        .where(submitted, FieldAnswer.field_id.in_(list(fields)))
+    ):
+        answers.setdefault(session_id, {})[field_id] = value
+    # The answers document takes over answer rows
+    dialect = db_session.get_bind().dialect.name
+    for session_id, document in db_session.exec(
+        select(AnswerSession.id, AnswerSession.answers_document).where(
+            submitted, has_document(dialect)
+        )
+    ):
+        for field_id, value in document.items():
+            answers.setdefault(session_id, {})[UUID(field_id)] = value
+    add_to_aggregates(
+        db_session,
+        (
+            aggregate
+            for session_answers in answers.values()
+            for field_id, value in session_answers.items()
+            if field_id in fields
+            for aggregate in answer_aggregates(fields[field_id], value)
+        ),
+    )
+    db_session.exec(
+        update(Form).where(Form.id == form_id).values(aggregates_stale=False)
+    )
+
+
+def read_field_summaries(
+    db_session: Session, form_id: UUID
+) -> list[FieldSummaryDTO]:
+    """Summaries of the aggregated fields of a form, from their rows."""
+    fields = read_aggregated_fields(db_session, form_id)
+    aggregates: dict[UUID, list[FieldAggregate]] = {}
+    for aggregate in db_session.exec(
+        select(FieldAggregate).where(
+            FieldAggregate.field_id.in_([field.id for field in fields])
+        )
+    ):
+        aggregates.setdefault(aggregate.field_id, []).append(aggregate)
+
+    summaries = []
+    for field in fields:
+        summary = FieldSummaryDTO(
+            field_id=field.id,
+            label=field.label,
+            field_type=field.field_type,
+            answered=0,
+        )
+        if field.field_type in NUMERIC_FIELD_TYPES:
+            summary.histogram = {}
+        elif field.field_type == "Boolean":
+            summary.counts = {"true": 0, "false": 0}
+        else:
+            summary.counts = dict.fromkeys(field_options(field), 0)
+        bins = {}
+        for aggregate in aggregates.get(field.id, []):
+            match aggregate.kind:
+                case "answered":
+                    summary.answered = aggregate.count
+                case "option" if summary.counts is not None:
+                    summary.counts[aggregate.bucket] = aggregate.count
+                case "numeric" if aggregate.count:
+                    summary.minimum = aggregate.minimum
+                    summary.maximum = aggregate.maximum
+                    summary.mean = (aggregate.total or 0) / aggregate.count
+                case "bin":
+                    bins[aggregate.bucket] = aggregate.count
+        if summary.histogram is not None:
+            summary.histogram = {
+                bucket: bins[bucket]
+                for bucket in sorted(
+                    bins, key=lambda bucket: float(bucket.split(":")[0])
+                )
+            }
+        summaries.append(summary)
+    return summaries
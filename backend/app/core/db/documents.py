@@ -0,0 +1,138 @@
+from collections.abc import Mapping
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    String,
+    Text,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Session, delete, update
+
+from app.core.db.models import AnswerSession, FieldAnswer
+
+
+def json_path(field_id: str) -> str:
+    return f'$."{field_id}"'
+
+
+def has_document(dialect: str) -> ColumnElement[bool]:
+    """
+    Whether a session has an answers document: a session without one holds
+    a JSON null, or a NULL when it predates the column.
+    """
+    column = AnswerSession.answers_document
+    match dialect:
+        case "postgresql":
+            return func.jsonb_typeof(column) == "object"
+        case "sqlite":
+            return func.json_type(column) == "object"
+        case _:
+            raise NotImplementedError(f"No answers document on {dialect}")
+
+
+def stored_document(dialect: str) -> ColumnElement:
+    """The answers document of a session, {} when it has none yet."""
+    column = AnswerSession.answers_document
+    match dialect:
+        case "postgresql":
+            return case(
+                (has_document(dialect), column), else_=literal({}, JSONB)
+            )
+        case "sqlite":
+            return case(
+                (has_document(dialect), column),
+                else_=literal_column("'{}'"),
+            )
+        case _:
+            raise NotImplementedError(f"No answers document on {dialect}")
+
+
+def merged_document(
+    dialect: str, document: Mapping[str, str | None]
+) -> ColumnElement:
+    """The answers document with `document` merged in, in SQL."""
+    match dialect:
+        case "postgresql":
+            return stored_document(dialect).op("||", return_type=JSONB)(
+                literal(dict(document), JSONB)
+            )
+        case "sqlite":
+            # json_patch would read null answers as removals
+            return func.json_set(
+                stored_document(dialect),
+                *(
+                    argument
+                    for field_id, value in document.items()
+                    for argument in (
+                        json_path(field_id),
+                        literal(value, String),
+                    )
+                ),
+            )
+        case _:
+            raise NotImplementedError(f"No answers document on {dialect}")
+
+
+def removed_from_document(dialect: str, field_id: str) -> ColumnElement:
+    """The answers document without the answer to `field_id`, in SQL."""
+    document = stored_document(dialect)
+    if dialect == "postgresql":
+        return document.op("-", return_type=JSONB)(cast(field_id, Text))
+    return func.json_remove(document, json_path(field_id))
+
+
+def drop_answer_rows(
+    db_session: Session, session_id: UUID, field_ids: list[UUID]
+):
+    """The document takes over answer rows: rows it covers are dropped."""
+    db_session.exec(
+        delete(FieldAnswer).where(
+            FieldAnswer.session_id == session_id,
+            FieldAnswer.field_id.in_(field_ids),
+        )
+    )
+
+
+def write_document_answers(
+    db_session: Session,
+    session_id: UUID,
+    answers: Mapping[UUID, str | None],
+):
+    """
+    Merges `answers` into the answers document of a session in the
+    database rather than rewriting it, so that concurrent saves of
+    different fields all land. Before commit.
+    """
+    if not answers:
+        return
+    dialect = db_session.get_bind().dialect.name
+    drop_answer_rows(db_session, session_id, list(answers))
+    db_session.exec(
+        update(AnswerSession)
+        .where(AnswerSession.id == session_id)
+        .values(
+            answers_document=merged_document(
+                dialect,
+                {str(field_id): value for field_id, value in answers.items()},
+            )
+        )
+    )
+
+
+def remove_document_answer(
+    db_session: Session, session_id: UUID, field_id: UUID
+):
+    """Removes an answer from the answers document of a session."""
+    dialect = db_session.get_bind().dialect.name
+    drop_answer_rows(db_session, session_id, [field_id])
+    db_session.exec(
+        update(AnswerSession)
+        .where(AnswerSession.id == session_id)
+        .values(answers_document=removed_from_document(dialect, str(field_id)))
+    )
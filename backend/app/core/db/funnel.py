@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import case, distinct, func
+from sqlmodel import Session, select
+
+from app.api.routes.v1.dto.form import FormFunnelDTO, FunnelStepDTO
+from app.core.db.models import AnswerSession, FieldAnswer, FormField
+
+
+def read_form_funnel(db_session: Session, form_id: UUID) -> FormFunnelDTO:
+    """
+    Completion funnel of a form over its answer sessions, in one query.
+
+    Fields are ranked by position into steps, fields without a position
+    sharing the last one. A session reached a step when it answered a
+    field at that step or a later one: the sessions ending at each step
+    are summed from the last step backwards with a window function.
+    """
+    steps = (
+        select(
+            FormField.id.label("field_id"),
+            FormField.label,
+            FormField.position,
+            func.dense_rank()
+            .over(order_by=FormField.position.asc().nulls_last())
+            .label("step"),
+        )
+        .where(FormField.form_id == form_id)
+        .subquery()
+    )
+    answers = (
+        select(
+            FieldAnswer.session_id,
+            FieldAnswer.field_id,
+            AnswerSession.submitted,
+        )
+        .join(AnswerSession, AnswerSession.id == FieldAnswer.session_id)
+        .where(
+            AnswerSession.form_id == form_id,
+            FieldAnswer.value.is_not(None),
+            FieldAnswer.value != "",
+        )
+        .subquery()
+    )
+    answered = (
+        select(
+            answers.c.field_id,
+            func.count(distinct(answers.c.session_id)).label("answered"),
+        )
+        .group_by(answers.c.field_id)
+        .subquery()
+    )
+    # The furthest step each session answered
+    furthest = (
+        select(
+            answers.c.session_id,
+            func.max(case((answers.c.submitted, 1), else_=0)).label(
+                "submitted"
+            ),
+            func.max(steps.c.step).label("step"),
+        )
+        .join(steps, steps.c.field_id == answers.c.field_id)
+        .group_by(answers.c.session_id)
+        .subquery()
+    )
+    ended = (
+        select(
+            furthest.c.step,
+            func.count().label("sessions"),
+            func.sum(furthest.c.submitted).label("submitted"),
+        )
+        .group_by(furthest.c.step)
+        .subquery()
+    )
+    distinct_steps = select(steps.c.step).distinct().subquery()
+    backwards = {"order_by": distinct_steps.c.step.desc()}
+    reached = (
+        select(
+            distinct_steps.c.step,
+            func.sum(func.coalesce(ended.c.sessions, 0))
+            .over(**backwards)
+            .label("reached"),
+            func.sum(func.coalesce(ended.c.submitted, 0))
+            .over(**backwards)
+            .label("submitted"),
+        )
+        .outerjoin(ended, ended.c.step == distinct_steps.c.step)
+        .subquery()
+    )
+    rows = db_session.exec(
+        select(
+            steps.c.field_id,
+            steps.c.label,
+            steps.c.position,
+            reached.c.reached,
+            func.coalesce(answered.c.answered, 0),
+            reached.c.submitted,
+        )
+        .join(reached, reached.c.step == steps.c.step)
+        .outerjoin(answered, answered.c.field_id == steps.c.field_id)
+        .order_by(steps.c.step, steps.c.label)
+    ).all()
+
+    funnel = [
+        FunnelStepDTO(
+            field_id=field_id,
+            label=label,
+            position=position,
+            reached=reached_count,
+            answered=answered_count,
+            submitted=submitted_count,
+        )
+        for (
+            field_id,
+            label,
+            position,
+            reached_count,
+            answered_count,
+            submitted_count,
+        ) in rows
+    ]
+    return FormFunnelDTO(
+        form_id=form_id,
+        started=funnel[0].reached if funnel else 0,
+        submitted=funnel[0].submitted if funnel else 0,
+        steps=funnel,
+        computed_at=datetime.now(timezone.utc),
+    )
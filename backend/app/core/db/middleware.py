@@ -0,0 +1,103 @@
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.env import get_env
+from app.core.db.setup import QueryStats, query_stats
+from app.core.logging.log import log_info, log_warning
+
+SQL_QUERY_BUDGET = int(get_env("SQL_QUERY_BUDGET", "25"))
+SQL_QUERY_BUDGET_STRICT = get_env("SQL_QUERY_BUDGET_STRICT", "False") == "True"
+SQL_LOG_QUERIES = get_env("SQL_LOG_QUERIES", "False") == "True"
+
+
+class QueryCountMiddleware:
+    """
+    Counts the SQL statements issued while serving a request and reports
+    them in a Server-Timing header. Requests going over SQL_QUERY_BUDGET
+    are logged, or answered with a 500 when SQL_QUERY_BUDGET_STRICT is set
+    (for tests). Statements issued once the response has started, e.g. by
+    streamed bodies or background tasks, are logged separately.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats(scope=scope)
+        token = query_stats.set(stats)
+        count_at_start: int | None = None
+        rejected = False
+
+        async def send_wrapper(message: Message):
+            nonlocal count_at_start, rejected
+            if rejected:
+                return  # the app's response was replaced
+            if message["type"] == "http.response.start":
+                count_at_start = stats.count
+                over_budget = self.check_budget(scope, stats)
+                if over_budget is not None and SQL_QUERY_BUDGET_STRICT:
+                    rejected = True
+                    await self.send_budget_error(send, over_budget)
+                    return
+                duration = f"{stats.duration * 1000:.2f}"
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={duration};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            query_stats.reset(token)
+            if count_at_start is not None and stats.count > count_at_start:
+                log_warning(
+                    f"{scope['method']} {stats.route} issued"
+                    f" {stats.count - count_at_start} queries after its"
+                    " response started",
+                    context={
+                        "method": scope["method"],
+                        "route": stats.route,
+                        "queries": stats.count,
+                        "late_queries": stats.count - count_at_start,
+                    },
+                )
+
+    def check_budget(self, scope: Scope, stats: QueryStats) -> str | None:
+        """Logs the queries of a request, the budget message if over it."""
+        route = stats.route
+        context = {
+            "method": scope["method"],
+            "route": route,
+            "queries": stats.count,
+            "db_ms": round(stats.duration * 1000, 2),
+        }
+        if stats.count > SQL_QUERY_BUDGET:
+            message = (
+                f"{scope['method']} {route} issued {stats.count} queries "
+                f"(budget: {SQL_QUERY_BUDGET})"
+            )
+            log_warning(message, context=context)
+            return message
+        if SQL_LOG_QUERIES:
+            log_info(f"{scope['method']} {route}", context=context)
+        return None
+
+    async def send_budget_error(self, send: Send, message: str):
+        body = orjson.dumps({"detail": message})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": HTTP_500_INTERNAL_SERVER_ERROR,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
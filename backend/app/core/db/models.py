@@ -1,7 +1,9 @@
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import List
 
+from sqlalchemy import DDL, JSON, Index, UniqueConstraint, event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, DateTime, Field, Relationship, SQLModel
 
 from app.api.routes.v1.dto.form import (
@@ -10,6 +12,7 @@ from app.api.routes.v1.dto.form import (
     FormDTO,
     FormFieldDTO,
 )
+from app.utils.answers import typed_answer_values
 from app.utils.crypto import gen_id, gen_otp
 
 
@@ -85,6 +88,9 @@ class Form(SQLModel, table=True):
     submissions_limit: int | None = None
     submissions: int = 0
     deadline: datetime | None = None
+    version: int = 1
+    # Set when the field aggregates must be rebuilt from the answers
+    aggregates_stale: bool = False
     fields: List["FormField"] = Relationship(
         back_populates="form",
         cascade_delete=True,
@@ -99,6 +105,10 @@ class Form(SQLModel, table=True):
         back_populates="forms",
         sa_relationship_kwargs={"lazy": "selectin"},
     )
+    translations: List["FormTranslation"] = Relationship(
+        back_populates="form",
+        cascade_delete=True,
+    )
 
     def to_dto(self):
         return FormDTO(
@@ -110,9 +120,32 @@ class Form(SQLModel, table=True):
             submissions_limit=self.submissions_limit,
             deadline=self.deadline,
             submissions=self.submissions,
+            version=self.version,
         )
 
 
+class FormTranslation(SQLModel, table=True):
+    # One translation per form content and language
+    __table_args__ = (
+        UniqueConstraint(
+            "form_id",
+            "language",
+            "content_hash",
+            name="uq_formtranslation_form_id_language_content_hash",
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    form_id: uuid.UUID = Field(foreign_key="form.id", index=True)
+    language: str
+    content_hash: str  # sha256 of the translatable form content
+    content: str  # FormTranslationModel as JSON
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    form: Form = Relationship(back_populates="translations")
+
+
 class FormField(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     form_id: uuid.UUID = Field(foreign_key="form.id")
@@ -137,6 +170,10 @@ class FormField(SQLModel, table=True):
         back_populates="fields",
         sa_relationship_kwargs={"lazy": "selectin"},
     )
+    aggregates: List["FieldAggregate"] = Relationship(
+        back_populates="field",
+        cascade_delete=True,
+    )
 
     def to_dto(self):
         return FormFieldDTO(
@@ -154,10 +191,21 @@ class FormField(SQLModel, table=True):
 
 
 class FieldAnswer(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_fieldanswer_field_id_value_num", "field_id", "value_num"),
+        Index("ix_fieldanswer_field_id_value_date", "field_id", "value_date"),
+        # Probed by the EXISTS clauses of response filters
+        Index("ix_fieldanswer_session_id_field_id", "session_id", "field_id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     field_id: uuid.UUID = Field(foreign_key="formfield.id")
     session_id: uuid.UUID = Field(foreign_key="answersession.id")
     value: str | None = None
+    # Typed copies of value, set by set_value
+    value_num: float | None = None
+    value_date: date | None = None
+    value_bool: bool | None = None
     field: FormField = Relationship(
         back_populates="answers",
         sa_relationship_kwargs={"lazy": "selectin"},
@@ -167,6 +215,11 @@ class FieldAnswer(SQLModel, table=True):
         sa_relationship_kwargs={"lazy": "selectin"},
     )
 
+    def set_value(self, value: str | None, field_type: str):
+        self.value = value
+        for column, typed in typed_answer_values(field_type, value).items():
+            setattr(self, column, typed)
+
     def to_dto(self):
         return FieldResponseDTO(
             id=self.id,
@@ -177,7 +230,86 @@ class FieldAnswer(SQLModel, table=True):
         )
 
 
+class FieldAggregate(SQLModel, table=True):
+    """
+    Running aggregate of the submitted answers to a field, maintained by
+    app/core/db/aggregates.py.
+    """
+
+    field_id: uuid.UUID = Field(foreign_key="formfield.id", primary_key=True)
+    kind: str = Field(primary_key=True)  # answered, option, numeric, bin
+    bucket: str = Field(default="", primary_key=True)  # option or bin
+    count: int = 0
+    # Numeric answers, on the "numeric" row
+    total: float | None = None
+    minimum: float | None = None
+    maximum: float | None = None
+    field: FormField = Relationship(back_populates="aggregates")
+
+
+# Full-text index over answer values, queried by app/core/db/search.py.
+# Maintained by the database on every write: a generated tsvector column
+# on Postgres, an FTS5 table kept in sync by triggers on SQLite.
+FIELD_ANSWER_SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE fieldanswer ADD COLUMN search_vector tsvector"
+        " GENERATED ALWAYS AS"
+        " (to_tsvector('simple', coalesce(value, ''))) STORED",
+        "CREATE INDEX ix_fieldanswer_search_vector ON fieldanswer"
+        " USING gin (search_vector)",
+    ],
+    "sqlite": [
+        # Answer rowids are not stable (VACUUM, batch migrations), so the
+        # FTS table keeps the answer id to join on instead
+        "CREATE VIRTUAL TABLE IF NOT EXISTS fieldanswer_fts USING fts5"
+        "(answer_id UNINDEXED, value)",
+        "CREATE TRIGGER fieldanswer_fts_insert AFTER INSERT ON fieldanswer"
+        " BEGIN"
+        " INSERT INTO fieldanswer_fts(answer_id, value)"
+        " VALUES (new.id, new.value);"
+        " END",
+        "CREATE TRIGGER fieldanswer_fts_delete AFTER DELETE ON fieldanswer"
+        " BEGIN"
+        " DELETE FROM fieldanswer_fts WHERE answer_id = old.id;"
+        " END",
+        "CREATE TRIGGER fieldanswer_fts_update"
+        " AFTER UPDATE OF value ON fieldanswer"
+        " BEGIN"
+        " UPDATE fieldanswer_fts SET value = new.value"
+        " WHERE answer_id = new.id;"
+        " END",
+    ],
+}
+
+for dialect, statements in FIELD_ANSWER_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(
+            FieldAnswer.__table__,
+            "after_create",
+            DDL(statement).execute_if(dialect=dialect),
+        )
+event.listen(
+    FieldAnswer.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS fieldanswer_fts").execute_if(dialect="sqlite"),
+)
+
+
+def document_answer_id(session_id: uuid.UUID, field_id: uuid.UUID):
+    """Stable id of an answer stored in a session's answers document."""
+    return uuid.uuid5(session_id, str(field_id))
+
+
 class AnswerSession(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_answersession_form_id_submitted_submitted_at",
+            "form_id",
+            "submitted",
+            "submitted_at",
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     form_id: uuid.UUID = Field(foreign_key="form.id")
     answers: List[FieldAnswer] = Relationship(
@@ -186,18 +318,55 @@ class AnswerSession(SQLModel, table=True):
         sa_relationship_kwargs={"lazy": "selectin"},
     )
     submitted: bool = False
+    form_version: int | None = None  # version of the form when filled
+    # field id -> value, when answers are stored as one document
+    answers_document: dict[str, str | None] | None = Field(
+        default=None,
+        sa_column=Column(JSON().with_variant(JSONB(), "postgresql")),
+    )
     form: Form = Relationship(
         back_populates="answer_sessions",
         sa_relationship_kwargs={"lazy": "selectin"},
     )
 
+    def answer_values(self) -> dict[uuid.UUID, str | None]:
+        """Answers by field id, the document taking over answer rows."""
+        values = {answer.field_id: answer.value for answer in self.answers}
+        for field_id, value in (self.answers_document or {}).items():
+            values[uuid.UUID(field_id)] = value
+        return values
+
     def to_dto(self):
+        document = self.answers_document or {}
+        answers = [
+            answer.to_dto()
+            for answer in self.answers
+            if str(answer.field_id) not in document
+        ]
+        if document:
+            fields = {field.id: field for field in self.form.fields}
+            answers += [
+                FieldResponseDTO(
+                    id=document_answer_id(self.id, field.id),
+                    field_id=field.id,
+                    session_id=self.id,
+                    value=value,
+                    field=field.to_dto(),
+                )
+                for field, value in (
+                    (fields.get(uuid.UUID(field_id)), value)
+                    for field_id, value in document.items()
+                )
+                if field is not None
+            ]
         return AnswerSessionDTO(
             id=self.id,
             form_id=self.form_id,
             submitted=self.submitted,
-            answers=[answer.to_dto() for answer in self.answers],
+            form_version=self.form_version,
+            answers=answers,
         )
+
     submitted_at: datetime | None = None
 
 
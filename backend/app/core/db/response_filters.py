@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Literal, get_args
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, or_
+from sqlmodel import select
+from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
+
+from app.core.db.models import AnswerSession, FieldAnswer
+from app.utils.answers import NUMERIC_FIELD_TYPES
+
+FilterOperator = Literal[
+    "eq", "contains", "gt", "gte", "lt", "lte", "includes"
+]
+
+TEXT_FIELD_TYPES = (
+    "Text",
+    "LongText",
+    "Select",
+    "Email",
+    "Phone",
+    "URL",
+    "Alpha",
+    "Alphanum",
+)
+
+
+@dataclass
+class ResponseFilter:
+    """One `<field_id>:<operator>:<value>` filter on submitted answers."""
+
+    field_id: UUID
+    operator: FilterOperator
+    value: str
+
+
+def invalid_filter(detail: str):
+    return HTTPException(
+        status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=f"Invalid response filter: {detail}",
+    )
+
+
+def parse_response_filter(raw: str) -> ResponseFilter:
+    field_id, _, rest = raw.partition(":")
+    operator, separator, value = rest.partition(":")
+    if not separator:
+        raise invalid_filter(f"expected <field_id>:<operator>:<value> ({raw})")
+    if operator not in get_args(FilterOperator):
+        raise invalid_filter(f"unknown operator {operator}")
+    try:
+        return ResponseFilter(UUID(field_id), operator, value)
+    except ValueError:
+        raise invalid_filter(f"bad field id {field_id}")
+
+
+def escape_like(value: str):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def typed_operand(field_type: str, value: str) -> tuple[Any, Any]:
+    """Column and parsed value a comparison on `field_type` runs against."""
+    try:
+        if field_type in NUMERIC_FIELD_TYPES:
+            return FieldAnswer.value_num, float(value)
+        if field_type == "Date":
+            return FieldAnswer.value_date, date.fromisoformat(value)
+    except ValueError:
+        raise invalid_filter(f"{value} is not a valid {field_type} value")
+    return FieldAnswer.value, value
+
+
+def answer_condition(
+    response_filter: ResponseFilter, field_type: str
+) -> ColumnElement[bool]:
+    operator, value = response_filter.operator, response_filter.value
+    match operator:
+        case "eq":
+            column, operand = typed_operand(field_type, value)
+            return column == operand
+        case "contains" if field_type in TEXT_FIELD_TYPES:
+            return FieldAnswer.value.ilike(
+                f"%{escape_like(value)}%", escape="\\"
+            )
+        case "gt" | "gte" | "lt" | "lte" if (
+            field_type in NUMERIC_FIELD_TYPES or field_type == "Date"
+        ):
+            column, operand = typed_operand(field_type, value)
+            return {
+                "gt": column > operand,
+                "gte": column >= operand,
+                "lt": column < operand,
+                "lte": column <= operand,
+            }[operator]
+        case "includes" if field_type == "Multiselect":
+            # Multiselect answers are stored as comma separated options
+            option = escape_like(value)
+            return or_(
+                FieldAnswer.value == value,
+                FieldAnswer.value.like(f"{option},%", escape="\\"),
+                FieldAnswer.value.like(f"%,{option}", escape="\\"),
+                FieldAnswer.value.like(f"%,{option},%", escape="\\"),
+            )
+    raise invalid_filter(f"{operator} does not apply to {field_type} fields")
+
+
+def response_filter_clause(
+    response_filter: ResponseFilter, field_types: dict[UUID, str]
+) -> ColumnElement[bool]:
+    """
+    EXISTS clause keeping the answer sessions with an answer to the
+    filtered field that satisfies it, to be used in a query on
+    AnswerSession.
+    """
+    field_type = field_types.get(response_filter.field_id)
+    if field_type is None:
+        raise invalid_filter(
+            f"field {response_filter.field_id} is not in this form"
+        )
+    return (
+        select(FieldAnswer.id)
+        .where(
+            FieldAnswer.session_id == AnswerSession.id,
+            FieldAnswer.field_id == response_filter.field_id,
+            answer_condition(response_filter, field_type),
+        )
+        .exists()
+    )
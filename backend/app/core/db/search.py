@@ -0,0 +1,78 @@
+import re
+from uuid import UUID
+
+from sqlalchemy import Subquery, column, func, literal_column, table
+from sqlmodel import Session, select
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from app.core.db.models import FieldAnswer, FormField
+from app.core.security.checkers import check_conditions
+
+SEARCHABLE_FIELD_TYPES = ("Text", "LongText")
+SEARCH_CONFIG = "simple"
+SEARCH_DIALECTS = ("postgresql", "sqlite")
+
+fieldanswer_fts = table(
+    "fieldanswer_fts",
+    column("answer_id"),
+    column("rank"),
+    column("fieldanswer_fts"),
+)
+
+
+def fts5_query(q: str) -> str:
+    """
+    Every word of `q` as a quoted FTS5 string, so that user input cannot
+    be read as query syntax. Words are ANDed.
+    """
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", q))
+
+
+def answer_search_ranks(
+    db_session: Session, form_id: UUID, q: str
+) -> Subquery | None:
+    """
+    (session_id, rank) of the answer sessions of a form with a Text or
+    LongText answer matching `q`, a higher rank being a better match.
+    None when `q` has nothing to search for.
+    """
+    if re.search(r"\w", q) is None:
+        return None
+    dialect = db_session.get_bind().dialect.name
+    check_conditions(
+        [dialect in SEARCH_DIALECTS],
+        detail=f"Full-text search is not available on {dialect}.",
+        status_code=HTTP_400_BAD_REQUEST,
+    )
+    match dialect:
+        case "postgresql":
+            query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+            search_vector = literal_column("fieldanswer.search_vector")
+            rank = func.ts_rank(search_vector, query)
+            statement = select(FieldAnswer.session_id, rank.label("rank"))
+            matches = search_vector.op("@@")(query)
+        case _:
+            # The FTS5 rank is bm25, lower for better matches
+            rank = -fieldanswer_fts.c.rank
+            statement = select(
+                FieldAnswer.session_id, rank.label("rank")
+            ).join(
+                fieldanswer_fts,
+                fieldanswer_fts.c.answer_id == FieldAnswer.id,
+            )
+            matches = fieldanswer_fts.c.fieldanswer_fts.match(fts5_query(q))
+    matching = (
+        statement.join(FormField, FormField.id == FieldAnswer.field_id)
+        .where(
+            FormField.form_id == form_id,
+            FormField.field_type.in_(SEARCHABLE_FIELD_TYPES),
+            matches,
+        )
+        .subquery()
+    )
+    # A session ranks as its best matching answer
+    return (
+        select(matching.c.session_id, func.max(matching.c.rank).label("rank"))
+        .group_by(matching.c.session_id)
+        .subquery()
+    )
@@ -1,14 +1,73 @@
+import time
+from collections.abc import MutableMapping
+from contextvars import ContextVar
+from dataclasses import dataclass
 from sqlite3 import OperationalError
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, event
 from sqlmodel import Session
 
 from app.core.config.env import get_env
+from app.core.db.slow_queries import slow_query_log
 from app.core.logging.log import log_error, log_success
+from app.core.metrics.middleware import UNMATCHED_ROUTE
 
 engine: Engine = create_engine(get_env("DB_STRING"))
 
 
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0  # seconds
+    scope: MutableMapping | None = None  # ASGI scope of the request
+
+    @property
+    def route(self) -> str | None:
+        if self.scope is None:
+            return None
+        # raw paths of unmatched requests would give unbounded route keys
+        return getattr(self.scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, _):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _record_query(conn, statement: str):
+    duration = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += duration
+    slow_query_log.record(
+        statement, duration, stats.route if stats is not None else None
+    )
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, _):
+    _record_query(conn, statement)
+
+
+@event.listens_for(engine, "handle_error")
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    conn = exception_context.connection
+    statement = exception_context.statement
+    if (
+        conn is not None
+        and statement is not None
+        and conn.info.get("query_started_at")
+    ):
+        _record_query(conn, statement)
+
+
 def setup_db():
     try:
         with engine.connect():
@@ -0,0 +1,91 @@
+import json
+import re
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.core.config.env import get_env
+
+SLOW_QUERY_MS = float(get_env("SLOW_QUERY_MS", "100"))
+# Directory slow queries are dumped to on shutdown, no dump when unset
+SLOW_QUERY_DUMP_DIR = get_env("SLOW_QUERY_DUMP_DIR", "")
+
+_NORMALIZERS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # string literals
+    # bound parameters, not ::type casts
+    (re.compile(r"%\(\w+\)s|(?<!:):\w+\b|\$\d+"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),  # numeric literals
+    (re.compile(r"__\[POSTCOMPILE_\w+\]"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?+)"),  # IN lists
+    (re.compile(r"\s+"), " "),
+]
+
+
+def fingerprint(statement: str) -> str:
+    """Normalizes a statement so queries differing by values group up."""
+    for pattern, replacement in _NORMALIZERS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+@dataclass
+class FingerprintStats:
+    statement: str
+    count: int = 0
+    total: float = 0
+    durations: deque[float] = field(default_factory=lambda: deque(maxlen=500))
+    routes: Counter[str] = field(default_factory=Counter)
+
+    def percentile(self, p: float) -> float:
+        durations = sorted(self.durations)
+        return durations[min(len(durations) - 1, int(len(durations) * p))]
+
+    def summary(self):
+        return {
+            "fingerprint": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 2),
+            "p50_ms": round(self.percentile(0.5) * 1000, 2),
+            "p99_ms": round(self.percentile(0.99) * 1000, 2),
+            "routes": dict(self.routes.most_common(10)),
+        }
+
+
+class SlowQueryLog:
+    """Aggregates statements slower than a threshold by fingerprint."""
+
+    def __init__(self, threshold_ms: float) -> None:
+        self.threshold = threshold_ms / 1000
+        self._entries: dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration: float, route: str | None):
+        if duration < self.threshold:
+            return
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._entries.get(key)
+            if stats is None:
+                stats = self._entries[key] = FingerprintStats(statement=key)
+            stats.count += 1
+            stats.total += duration
+            stats.durations.append(duration)
+            stats.routes[route or "background"] += 1
+
+    def summary(self, limit: int | None = None):
+        with self._lock:
+            summaries = [stats.summary() for stats in self._entries.values()]
+        summaries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return summaries[:limit] if limit is not None else summaries
+
+    def dump(self, directory: str = SLOW_QUERY_DUMP_DIR):
+        if not directory:
+            return
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        with open(path / "slow_queries.json", "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+slow_query_log = SlowQueryLog(SLOW_QUERY_MS)
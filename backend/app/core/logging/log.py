@@ -1,50 +1,130 @@
-from datetime import datetime
+import atexit
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Any
 
-from rich.console import Console
+from rich.logging import RichHandler
 
-console = Console()
+from app.core.config.env import get_env
 
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
 
-def log_info(message: Any, log_file: str = "log.txt"):
+LOG_FILE = get_env("LOG_FILE", "log.txt")
+LOG_LEVEL = get_env("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = get_env("LOG_LEVELS", "")  # e.g. "app.core.db=WARNING,..."
+LOG_MAX_BYTES = int(get_env("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(get_env("LOG_BACKUP_COUNT", "5"))
+
+ROOT_LOGGER_NAME = "app"
+
+_listener: QueueListener | None = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(getattr(record, "context", None) or {})
+        return json.dumps(data, default=str)
+
+
+def parse_levels(levels: str) -> dict[str, str]:
+    return {
+        name.strip(): level.strip().upper()
+        for name, _, level in (
+            entry.partition("=") for entry in levels.split(",") if entry
+        )
+        if name.strip() and level.strip()
+    }
+
+
+def setup_logging():
+    """
+    Routes application logs through a queue, so that writing to the log
+    file and the terminal happens on a background thread.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    file_handler = RotatingFileHandler(
+        LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    file_handler.setFormatter(JSONFormatter())
+    console_handler = RichHandler(show_path=False)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(LOG_LEVEL)
+    root_logger.propagate = False
+    for name, level in parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flushes pending records, called on shutdown."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str | None = None):
+    setup_logging()
+    if name is None or not name.startswith(ROOT_LOGGER_NAME):
+        name = ROOT_LOGGER_NAME
+    return logging.getLogger(name)
+
+
+def _log(level: int, message: Any, context: dict[str, Any] | None):
+    # Records are attributed to the module calling the log_* helper
+    logger = get_logger(sys._getframe(2).f_globals.get("__name__"))
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra={"context": context})
+
+
+def log_info(message: Any, context: dict[str, Any] | None = None):
     """
     Logs an info message to the console and a log file.
     """
-    console.print(message, style="bold green")
-    with open(log_file, "a") as f:
-        _ = f.write(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} INFO] {message}\n"
-        )
+    _log(logging.INFO, message, context)
 
 
-def log_warning(message: Any, log_file: str = "log.txt"):
+def log_warning(message: Any, context: dict[str, Any] | None = None):
     """
     Logs a warning message to the console and a log file.
     """
-    console.print(message, style="bold yellow")
-    with open(log_file, "a") as f:
-        _ = f.write(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} WARNING] {message}\n"
-        )
+    _log(logging.WARNING, message, context)
 
 
-def log_error(message: Any, log_file: str = "log.txt"):
+def log_error(message: Any, context: dict[str, Any] | None = None):
     """
     Logs an error message to the console and a log file.
     """
-    console.print(message, style="bold red")
-    with open(log_file, "a") as f:
-        _ = f.write(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ERROR] {message}\n"
-        )
+    _log(logging.ERROR, message, context)
 
 
-def log_success(message: Any, log_file: str = "log.txt"):
+def log_success(message: Any, context: dict[str, Any] | None = None):
     """
     Logs a success message to the console and a log file.
     """
-    console.print(message, style="bold blue")
-    with open(log_file, "a") as f:
-        _ = f.write(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} SUCCESS] {message}\n"
-        )
+    _log(SUCCESS, message, context)
@@ -0,0 +1,44 @@
+from typing import Literal
+
+from app.core.metrics.registry import Counter, Gauge, Histogram, register
+
+DomainEvent = Literal[
+    "submission",
+    "save",
+    "export",
+    "otp_send",
+    "translation",
+]
+
+HTTP_REQUESTS = register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by method, route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DURATION = register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method and route template.",
+        ("method", "route"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = register(
+    Gauge(
+        "http_requests_in_flight",
+        "HTTP requests currently being served by route template.",
+        ("method", "route"),
+    )
+)
+DOMAIN_EVENTS = register(
+    Counter(
+        "openforms_events_total",
+        "Domain events such as submissions, saves and exports.",
+        ("event",),
+    )
+)
+
+
+def record_event(event: DomainEvent, amount: int = 1):
+    DOMAIN_EVENTS.inc(event, amount=amount)
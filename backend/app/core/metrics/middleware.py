@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics.instruments import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+ROUTE_CACHE_SIZE = 4096
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Resolves the route template of a request, e.g.
+    /api/v1/forms/{form_id}/fields, to keep label cardinality bounded.
+    """
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Records request count, latency and in-flight requests per route, up to
+    the end of the response body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # (method, path) -> route template, least recently used first
+        self.routes: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    def route_template(self, scope: Scope) -> str:
+        key = (scope["method"], scope["path"])
+        route = self.routes.get(key)
+        if route is not None:
+            self.routes.move_to_end(key)
+            return route
+        route = self.routes[key] = route_template(scope)
+        if len(self.routes) > ROUTE_CACHE_SIZE:
+            self.routes.popitem(last=False)
+        return route
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        route = self.route_template(scope)
+        status_code = 500
+        finished = False
+
+        def finish():
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            HTTP_REQUESTS_IN_FLIGHT.dec(method, route)
+            # The router records the route it dispatched to in the scope
+            matched_route = getattr(scope.get("route"), "path", route)
+            HTTP_REQUEST_DURATION.observe(
+                method, matched_route, value=time.perf_counter() - started_at
+            )
+            HTTP_REQUESTS.inc(method, matched_route, str(status_code))
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            # Background tasks run once the body is sent, they are not
+            # part of the request
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finish()
+
+        HTTP_REQUESTS_IN_FLIGHT.inc(method, route)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish()
@@ -0,0 +1,139 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{value.replace("\\", "\\\\").replace('"', '\\"')}"'
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+@dataclass
+class Counter:
+    name: str
+    documentation: str
+    label_names: tuple[str, ...] = ()
+    values: dict[LabelValues, float] = field(default_factory=dict)
+
+    def inc(self, *labels: str, amount: float = 1):
+        with _lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self.values.items():
+            label_text = format_labels(self.label_names, labels)
+            yield f"{self.name}{label_text} {value}"
+
+
+@dataclass
+class Gauge:
+    name: str
+    documentation: str
+    label_names: tuple[str, ...] = ()
+    values: dict[LabelValues, float] = field(default_factory=dict)
+
+    def inc(self, *labels: str, amount: float = 1):
+        with _lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float):
+        with _lock:
+            self.values[labels] = value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        for labels, value in self.values.items():
+            label_text = format_labels(self.label_names, labels)
+            yield f"{self.name}{label_text} {value}"
+
+
+@dataclass
+class Histogram:
+    name: str
+    documentation: str
+    label_names: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    # per label set: bucket counts (non cumulative), sum, count
+    values: dict[LabelValues, tuple[list[int], float, int]] = field(
+        default_factory=dict
+    )
+
+    def observe(self, *labels: str, value: float):
+        with _lock:
+            counts, total, count = self.values.get(
+                labels, ([0] * (len(self.buckets) + 1), 0.0, 0)
+            )
+            counts[bisect_left(self.buckets, value)] += 1
+            self.values[labels] = (counts, total + value, count + 1)
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, total, count) in self.values.items():
+            cumulative = 0
+            bucket_label_names = (*self.label_names, "le")
+            for bound, bucket_count in zip(
+                (*(str(b) for b in self.buckets), "+Inf"), counts
+            ):
+                cumulative += bucket_count
+                bucket_labels = format_labels(
+                    bucket_label_names, (*labels, bound)
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {total}"
+            yield f"{self.name}_count{label_text} {count}"
+
+
+Metric = Counter | Gauge | Histogram
+
+_lock = threading.Lock()
+_metrics: list[Metric] = []
+_collectors: list[Callable[[], Iterable[Metric]]] = []
+
+
+def register[M: Metric](metric: M) -> M:
+    _metrics.append(metric)
+    return metric
+
+
+def register_collector(collector: Callable[[], Iterable[Metric]]):
+    """Registers a callable building metrics at scrape time."""
+    _collectors.append(collector)
+
+
+def render_metrics() -> str:
+    metrics = [*_metrics]
+    for collector in _collectors:
+        metrics.extend(collector())
+    with _lock:
+        lines = [line for metric in metrics for line in metric.render()]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,111 @@
+import cProfile
+import re
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.env import get_env
+from app.core.logging.log import log_info
+
+PROFILE_DIR = Path(get_env("PROFILE_DIR", "profiles"))
+PROFILE_KEEP = int(get_env("PROFILE_KEEP", "50"))
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def profile_path(profile_id: str) -> Path | None:
+    """Path of a stored profile, None for ids that are not ours."""
+    if not re.fullmatch(r"[\w.-]+", profile_id):
+        return None
+    path = PROFILE_DIR / f"{profile_id}.pstats"
+    return path if path.is_file() else None
+
+
+def list_profiles():
+    return sorted(
+        (path.stem for path in PROFILE_DIR.glob("*.pstats")), reverse=True
+    )
+
+
+def prune_profiles():
+    for profile_id in list_profiles()[PROFILE_KEEP:]:
+        (PROFILE_DIR / f"{profile_id}.pstats").unlink(missing_ok=True)
+
+
+def store_profile(profiler: cProfile.Profile, profile_id: str):
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(PROFILE_DIR / f"{profile_id}.pstats")
+    prune_profiles()
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a single request with cProfile when it carries an X-Profile
+    header or a ?profile= query flag and `allow` accepts it. The pstats
+    file is stored under PROFILE_DIR and its id returned in X-Profile-Id.
+
+    The profiler sees everything running on the event loop meanwhile, so
+    only one request is profiled at a time and the others are served as
+    usual.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow: Callable[[Request], Awaitable[bool]],
+    ) -> None:
+        self.app = app
+        self.allow = allow
+        self.active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self.active:
+            return await self.app(scope, receive, send)
+        request = Request(scope)
+        if (
+            PROFILE_HEADER not in request.headers
+            and PROFILE_QUERY_PARAM not in request.query_params
+        ):
+            return await self.app(scope, receive, send)
+        # Claimed before awaiting, so that overlapping requests cannot
+        # both enable a profiler
+        self.active = True
+        try:
+            allowed = await self.allow(request)
+        except BaseException:
+            self.active = False
+            raise
+        if not allowed:
+            self.active = False
+            return await self.app(scope, receive, send)
+
+        slug = re.sub(r"[^\w]+", "_", scope["path"]).strip("_")
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}"
+        profile_id += f"-{slug}-{time.monotonic_ns() % 10**6}"
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    PROFILE_ID_HEADER, profile_id
+                )
+            await send(message)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            self.active = False
+        await run_in_threadpool(store_profile, profiler, profile_id)
+        log_info(
+            f"Profiled {scope['method']} {scope['path']}",
+            context={"profile_id": profile_id},
+        )
@@ -20,6 +20,7 @@ USER_RESOURCE = "user"
 FORM_RESOURCE = "form"
 FORM_FIELD_RESPONSE_RESOURCE = "fieldresponse"
 FORM_FIELD_RESOURCE = "formfield"
+SYSTEM_RESOURCE = "system"  # diagnostics, only granted to admins
 
 ACTION_CREATE = "c"
 ACTION_READ = "r"
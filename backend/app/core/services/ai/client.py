@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import httpx
+
+from app.core.config.env import get_env
+
+GEMINI_API_URL = get_env(
+    "GEMINI_API_URL", "https://generativelanguage.googleapis.com"
+)
+GEMINI_CONNECT_TIMEOUT = float(get_env("GEMINI_CONNECT_TIMEOUT", "5"))
+GEMINI_READ_TIMEOUT = float(get_env("GEMINI_READ_TIMEOUT", "60"))
+GEMINI_MAX_CONCURRENCY = int(get_env("GEMINI_MAX_CONCURRENCY", "16"))
+
+_client: httpx.AsyncClient | None = None
+_semaphore: asyncio.Semaphore | None = None
+
+
+async def open_http_client():
+    """
+    Creates the shared connection pool used for LLM calls.
+    Called once from the app lifespan.
+    """
+    global _client, _semaphore
+    if _client is not None:
+        return _client
+    _client = httpx.AsyncClient(
+        base_url=GEMINI_API_URL,
+        timeout=httpx.Timeout(
+            GEMINI_READ_TIMEOUT, connect=GEMINI_CONNECT_TIMEOUT
+        ),
+        limits=httpx.Limits(
+            max_connections=GEMINI_MAX_CONCURRENCY,
+            max_keepalive_connections=GEMINI_MAX_CONCURRENCY,
+        ),
+    )
+    _semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+    return _client
+
+
+async def close_http_client():
+    global _client, _semaphore
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _semaphore = None
+
+
+async def post_json(url: str, payload: dict, params: dict | None = None):
+    """
+    POSTs a JSON payload through the shared client, waiting for a free
+    slot when the concurrency limit is reached.
+    """
+    client = _client or await open_http_client()
+    assert _semaphore is not None
+    async with _semaphore:
+        response = await client.post(url, json=payload, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+async def stream_sse(url: str, payload: dict, params: dict | None = None):
+    """
+    POSTs a JSON payload and yields the JSON documents of the
+    Server-Sent Events stream sent back.
+    """
+    client = _client or await open_http_client()
+    assert _semaphore is not None
+    async with _semaphore:
+        async with client.stream(
+            "POST", url, json=payload, params=params
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    yield json.loads(line.removeprefix("data:").strip())
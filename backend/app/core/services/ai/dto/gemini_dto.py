@@ -57,3 +57,31 @@ class GeminiResponse(BaseModel):
             model_version=data["modelVersion"],
             response_id=data["responseId"],
         )
+
+
+class GeminiStreamChunk(BaseModel):
+    text: str
+    finish_reason: str | None = None
+    usage: SimpleUsageMetadata | None = None
+
+    @classmethod
+    def from_raw(cls, data: dict) -> "GeminiStreamChunk":
+        # Partial responses only carry the newly generated text, the
+        # finish reason and usage metadata arrive with the last chunk
+        candidate = (data.get("candidates") or [{}])[0]
+        parts = candidate.get("content", {}).get("parts", [])
+        usage_data = data.get("usageMetadata")
+        usage = (
+            SimpleUsageMetadata(
+                prompt_tokens=usage_data.get("promptTokenCount", 0),
+                candidates_tokens=usage_data.get("candidatesTokenCount", 0),
+                total_tokens=usage_data.get("totalTokenCount", 0),
+            )
+            if usage_data is not None
+            else None
+        )
+        return cls(
+            text="".join(part.get("text", "") for part in parts),
+            finish_reason=candidate.get("finishReason"),
+            usage=usage,
+        )
@@ -1,30 +1,53 @@
+import asyncio
+import time
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, get_args
 
-import requests
 from fastapi import HTTPException
 from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
 
 from app.core.config.env import get_env
 from app.core.logging.log import log_error
+from app.core.services.ai.client import post_json, stream_sse
 from app.core.services.ai.dto import gemini_dto
+from app.core.services.ai.resilience import (
+    CircuitBreaker,
+    LLMMetrics,
+    TokenBucket,
+)
 
-SupportedModels = Literal["gemini"]
+SupportedModels = Literal["gemini", "stub"]
+
+
+def configured_model() -> SupportedModels:
+    model = get_env("LLM_MODEL", "gemini")
+    if model not in get_args(SupportedModels):
+        raise ValueError(
+            f"Unknown LLM_MODEL {model!r}, expected one of"
+            f" {', '.join(get_args(SupportedModels))}"
+        )
+    return model
+
+
+LLM_MODEL = configured_model()
+LLM_RATE_PER_SECOND = float(get_env("LLM_RATE_PER_SECOND", "10"))
+LLM_BURST = float(get_env("LLM_BURST", "20"))
+LLM_MAX_IN_FLIGHT = int(get_env("LLM_MAX_IN_FLIGHT", "16"))
+LLM_BREAKER_THRESHOLD = int(get_env("LLM_BREAKER_THRESHOLD", "5"))
+LLM_BREAKER_COOLDOWN = float(get_env("LLM_BREAKER_COOLDOWN", "30"))
+LLM_STUB_LATENCY = float(get_env("LLM_STUB_LATENCY_MS", "0")) / 1000
 
 
 async def ask_gemini(message: str):
     try:
         GEMINI_API_KEY = get_env("GEMINI_API_KEY")
-        base_url = (
-            "https://generativelanguage.googleapis.com"
-            "/v1beta/models/"
-            f"gemini-2.0-flash:generateContent?key={GEMINI_API_KEY}"
-        )
         request_data = gemini_dto.GeminiRequest(message=message)
-        response = requests.post(url=base_url, json=request_data.to_dict())
-        json_response = response.json()
-        parsed_response = gemini_dto.GeminiResponse.from_raw(json_response)
-        return parsed_response.candidates[0].text
+        json_response = await post_json(
+            "/v1beta/models/gemini-2.0-flash:generateContent",
+            payload=request_data.to_dict(),
+            params={"key": GEMINI_API_KEY},
+        )
+        return gemini_dto.GeminiResponse.from_raw(json_response)
     except Exception as e:
         log_error(e)
         raise HTTPException(
@@ -33,11 +56,162 @@ async def ask_gemini(message: str):
         )
 
 
+async def stream_gemini(message: str):
+    GEMINI_API_KEY = get_env("GEMINI_API_KEY")
+    request_data = gemini_dto.GeminiRequest(message=message)
+    async for raw_chunk in stream_sse(
+        "/v1beta/models/gemini-2.0-flash:streamGenerateContent",
+        payload=request_data.to_dict(),
+        params={"key": GEMINI_API_KEY, "alt": "sse"},
+    ):
+        yield gemini_dto.GeminiStreamChunk.from_raw(raw_chunk)
+
+
+def stub_answer(message: str):
+    # Prompts end with the content to translate, which is sent back as is
+    return message.split("\n", 1)[-1].rstrip('"')
+
+
+def stub_usage(message: str, answer: str):
+    prompt_tokens = len(message.split())
+    candidates_tokens = len(answer.split())
+    return gemini_dto.SimpleUsageMetadata(
+        prompt_tokens=prompt_tokens,
+        candidates_tokens=candidates_tokens,
+        total_tokens=prompt_tokens + candidates_tokens,
+    )
+
+
+async def ask_stub(message: str):
+    """Deterministic local model for benchmarks and tests."""
+    await asyncio.sleep(LLM_STUB_LATENCY)
+    answer = stub_answer(message)
+    return gemini_dto.GeminiResponse(
+        candidates=[
+            gemini_dto.SimpleCandidate(
+                text=answer, role="model", finish_reason="STOP", avg_logprobs=0
+            )
+        ],
+        usage=stub_usage(message, answer),
+        model_version="stub",
+        response_id="stub",
+    )
+
+
+async def stream_stub(message: str):
+    await asyncio.sleep(LLM_STUB_LATENCY)
+    answer = stub_answer(message)
+    words = answer.split(" ")
+    for index, word in enumerate(words):
+        last = index == len(words) - 1
+        yield gemini_dto.GeminiStreamChunk(
+            text=word if last else f"{word} ",
+            finish_reason="STOP" if last else None,
+            usage=stub_usage(message, answer) if last else None,
+        )
+
+
+class CircuitOpenError(HTTPException):
+    """Raised without calling a model while its circuit breaker is open."""
+
+
+@dataclass
+class ProviderGuard:
+    """Rate limit, concurrency cap, circuit breaker and metrics of a model."""
+
+    bucket: TokenBucket
+    in_flight: asyncio.Semaphore
+    breaker: CircuitBreaker
+    metrics: LLMMetrics
+
+    def check_breaker(self):
+        if not self.breaker.allow():
+            self.metrics.rejected += 1
+            raise CircuitOpenError(
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Translation service temporarily unavailable.",
+            )
+
+    def record_failure(self):
+        self.metrics.failures += 1
+        self.breaker.record_failure()
+
+    def record_success(
+        self, started_at: float, usage: gemini_dto.SimpleUsageMetadata | None
+    ):
+        self.breaker.record_success()
+        self.metrics.record(time.monotonic() - started_at, usage)
+
+
+_guards: dict[SupportedModels, ProviderGuard] = {}
+
+
+def get_guard(model: SupportedModels) -> ProviderGuard:
+    if model not in _guards:
+        _guards[model] = ProviderGuard(
+            bucket=TokenBucket(rate=LLM_RATE_PER_SECOND, capacity=LLM_BURST),
+            in_flight=asyncio.Semaphore(LLM_MAX_IN_FLIGHT),
+            breaker=CircuitBreaker(
+                failure_threshold=LLM_BREAKER_THRESHOLD,
+                cooldown=LLM_BREAKER_COOLDOWN,
+            ),
+            metrics=LLMMetrics(),
+        )
+    return _guards[model]
+
+
+def llm_metrics():
+    return {
+        model: {**guard.metrics.snapshot(), "circuit": guard.breaker.state}
+        for model, guard in _guards.items()
+    }
+
+
 @dataclass
 class LLMProvider:
-    model: SupportedModels
+    model: SupportedModels = LLM_MODEL
 
-    async def ask(self, message: str):
+    async def _generate(self, message: str):
         match self.model:
             case "gemini":
                 return await ask_gemini(message=message)
+            case "stub":
+                return await ask_stub(message=message)
+
+    def _generate_stream(self, message: str):
+        match self.model:
+            case "gemini":
+                return stream_gemini(message=message)
+            case "stub":
+                return stream_stub(message=message)
+
+    async def ask(self, message: str):
+        guard = get_guard(self.model)
+        guard.check_breaker()
+        await guard.bucket.acquire()
+        async with guard.in_flight:
+            started_at = time.monotonic()
+            try:
+                response = await self._generate(message)
+            except Exception:
+                guard.record_failure()
+                raise
+        guard.record_success(started_at, response.usage)
+        return response.candidates[0].text
+
+    async def stream(self, message: str):
+        guard = get_guard(self.model)
+        guard.check_breaker()
+        await guard.bucket.acquire()
+        async with guard.in_flight:
+            started_at = time.monotonic()
+            usage = None
+            try:
+                async for chunk in self._generate_stream(message):
+                    usage = chunk.usage or usage
+                    if chunk.text:
+                        yield chunk.text
+            except Exception:
+                guard.record_failure()
+                raise
+        guard.record_success(started_at, usage)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Literal
+
+from app.core.services.ai.dto.gemini_dto import SimpleUsageMetadata
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass
+class TokenBucket:
+    """Allows `rate` acquisitions per second with bursts up to `capacity`."""
+
+    rate: float
+    capacity: float
+    tokens: float = -1
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        if self.tokens < 0:
+            self.tokens = self.capacity
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    async def acquire(self):
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and lets a single
+    trial call through once `cooldown` seconds have passed.
+    """
+
+    failure_threshold: int
+    cooldown: float
+    state: CircuitState = "closed"
+    failures: int = 0
+    opened_at: float = 0
+
+    def allow(self) -> bool:
+        match self.state:
+            case "closed":
+                return True
+            case "open" | "half_open":
+                # A single trial call is let through per cooldown period
+                if time.monotonic() - self.opened_at >= self.cooldown:
+                    self.state = "half_open"
+                    self.opened_at = time.monotonic()
+                    return True
+                return False
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if (
+            self.state == "half_open"
+            or self.failures >= self.failure_threshold
+        ):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
+@dataclass
+class LLMMetrics:
+    requests: int = 0
+    failures: int = 0
+    rejected: int = 0
+    prompt_tokens: int = 0
+    candidates_tokens: int = 0
+    total_tokens: int = 0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def record(self, latency: float, usage: SimpleUsageMetadata | None):
+        self.requests += 1
+        self.latencies.append(latency)
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens
+            self.candidates_tokens += usage.candidates_tokens
+            self.total_tokens += usage.total_tokens
+
+    def snapshot(self):
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "latency_p50": percentile(0.5),
+            "latency_p99": percentile(0.99),
+            "prompt_tokens": self.prompt_tokens,
+            "candidates_tokens": self.candidates_tokens,
+            "total_tokens": self.total_tokens,
+        }
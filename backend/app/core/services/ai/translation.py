@@ -1,29 +1,56 @@
-from typing import Literal
+from typing import Literal, get_args
 
+from app.core.metrics.instruments import record_event
 from app.core.services.ai.providers import LLMProvider
 
 SupportedLanguages = Literal[
     "English", "French", "Chinese", "Japanese", "Spanish", "German"
 ]
+SUPPORTED_LANGUAGES: tuple[SupportedLanguages, ...] = get_args(
+    SupportedLanguages
+)
 
 
-async def translate(text: str, language: SupportedLanguages):
-    translation_provider = LLMProvider(model="gemini")
-    translated_text = await translation_provider.ask(
-        message=f"Translate this text into {language}"
+def text_translation_prompt(text: str, language: SupportedLanguages):
+    return (
+        f"Translate this text into {language}"
         f'do not comment and be straigtforward. "\n{text}"'
     )
-    return translated_text
 
 
-async def translate_json(json_data: str, language: SupportedLanguages):
-    translation_provider = LLMProvider(model="gemini")
-    translated_text = await translation_provider.ask(
-        message=f"Translate this json into {language} in the same json format."
+def json_translation_prompt(json_data: str, language: SupportedLanguages):
+    return (
+        f"Translate this json into {language} in the same json format."
         + "only translate titles, labels, descriptions and possible answers"
         + "You are a translator. ONLY return raw JSON."
         + "Do NOT use markdown formatting or code blocks."
         + "You do not need to format your answer."
         f"do not comment and be straigtforward. \n{json_data}"
     )
+
+
+async def translate(text: str, language: SupportedLanguages):
+    record_event("translation")
+    translation_provider = LLMProvider()
+    translated_text = await translation_provider.ask(
+        message=text_translation_prompt(text, language)
+    )
     return translated_text
+
+
+async def translate_json(json_data: str, language: SupportedLanguages):
+    record_event("translation")
+    translation_provider = LLMProvider()
+    translated_text = await translation_provider.ask(
+        message=json_translation_prompt(json_data, language)
+    )
+    return translated_text
+
+
+async def stream_translate(text: str, language: SupportedLanguages):
+    record_event("translation")
+    translation_provider = LLMProvider()
+    async for translated_text in translation_provider.stream(
+        message=text_translation_prompt(text, language)
+    ):
+        yield translated_text
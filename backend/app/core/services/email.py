@@ -37,7 +37,7 @@ def send_email(email: str, subject: str, message: str, html: bool = False):
         try:
             server.send_message(email_message)
         except Exception as e:
-            print(e)
+            log_error(e)
             raise Exception("Email not sent")
 
 
@@ -0,0 +1,33 @@
+import math
+from datetime import date
+from typing import Any
+
+NUMERIC_FIELD_TYPES = ("Numerical", "Currency")
+# Field types whose answers have a typed copy
+TYPED_FIELD_TYPES = (*NUMERIC_FIELD_TYPES, "Date", "Boolean")
+
+
+def typed_answer_values(field_type: str, value: str | None) -> dict[str, Any]:
+    """
+    Typed copies of an answer for SQL-side filtering and aggregation, None
+    where the answer does not parse as the field's type.
+    """
+    typed: dict[str, Any] = {
+        "value_num": None,
+        "value_date": None,
+        "value_bool": None,
+    }
+    if value is None:
+        return typed
+    try:
+        if field_type in NUMERIC_FIELD_TYPES:
+            number = float(value)
+            if math.isfinite(number):
+                typed["value_num"] = number
+        elif field_type == "Date":
+            typed["value_date"] = date.fromisoformat(value)
+        elif field_type == "Boolean" and value in ("0", "1"):
+            typed["value_bool"] = value == "1"
+    except ValueError:
+        pass
+    return typed
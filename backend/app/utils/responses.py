@@ -0,0 +1,20 @@
+from collections.abc import Mapping
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response[T](
+    adapter: TypeAdapter[T],
+    content: T,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Renders DTOs we built ourselves with pydantic's JSON serializer,
+    skipping FastAPI's validation against the response model.
+    """
+    return Response(
+        adapter.dump_json(content),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,8 @@
+import json
+from typing import Any
+
+
+def sse_event(data: Any, event: str | None = None) -> str:
+    """Formats a Server-Sent Event carrying JSON data."""
+    message = f"event: {event}\n" if event is not None else ""
+    return message + f"data: {json.dumps(data)}\n\n"
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+
+from app.utils.singleflight import SingleFlight
+
+_caches: dict[str, "TTLCache"] = {}
+
+
+class TTLCache[K: Hashable, V]:
+    """
+    In-process cache filled through a single-flight, so that concurrent
+    misses load once. Entries expire after `ttl` seconds (never if None)
+    and the least recently used ones are evicted past `max_size`. There
+    is no invalidation: keys should change with the data, e.g. carry a
+    version.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._flight = SingleFlight(f"{name}_cache")
+        _caches[name] = self
+
+    async def get_or_load(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+        self.misses += 1
+
+        async def run():
+            value = await load()
+            self._store(key, value)
+            return value
+
+        return await self._flight.do(key, run)
+
+    def _store(self, key: K, value: V):
+        expires_at = (
+            time.monotonic() + self.ttl
+            if self.ttl is not None
+            else float("inf")
+        )
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while self.max_size is not None and len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+
+
+def cache_stats():
+    return {name: cache.stats() for name, cache in _caches.items()}
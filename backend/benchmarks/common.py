@@ -0,0 +1,150 @@
+"""
+Shared helpers for the benchmarks: database selection, seeding and
+latency statistics. Import this module before anything from `app`, the
+engine is created from DB_STRING at import time.
+"""
+
+import argparse
+import os
+import statistics
+from collections.abc import Iterable
+
+DEFAULT_DB_URL = "sqlite:///./benchmark.db"
+
+# One sample field per type, with a value passing validate_answer
+FIELD_SAMPLES: list[tuple[str, str | None, str]] = [
+    ("Boolean", None, "1"),
+    ("Numerical", None, "42"),
+    ("Text", None, "A short answer"),
+    ("LongText", None, "A much longer answer " * 10),
+    ("Select", "Red\\Green\\Blue", "Green"),
+    ("Multiselect", "Red\\Green\\Blue", "Red,Blue"),
+    ("Email", None, "respondent@example.com"),
+    ("Phone", None, "+33612345678"),
+    ("Currency", None, "1500"),
+    ("Date", None, "2025-07-14"),
+    ("URL", None, "https://example.com/page"),
+    ("Alpha", None, "Only letters"),
+    ("Alphanum", None, "Letters and 123"),
+]
+
+
+def add_database_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--db-url", help="defaults to a local SQLite file")
+    parser.add_argument(
+        "--yes-drop",
+        action="store_true",
+        help="allow dropping the tables of a --db-url that is neither SQLite"
+        " nor a database named like *bench*",
+    )
+
+
+def configure_database(db_url: str | None, yes_drop: bool = False):
+    """
+    Points the app at the benchmark database and disables LLM calls. The
+    benchmarks drop every table of that database, so URLs that are
+    neither SQLite nor a *bench* database are refused without yes_drop.
+    """
+    from sqlalchemy.engine import make_url
+
+    url = make_url(db_url or DEFAULT_DB_URL)
+    if not (
+        yes_drop
+        or url.get_backend_name() == "sqlite"
+        or "bench" in (url.database or "")
+    ):
+        raise SystemExit(
+            f"Refusing to drop the tables of {url.render_as_string()},"
+            " pass --yes-drop if this is a throwaway database."
+        )
+    os.environ["DB_STRING"] = db_url or DEFAULT_DB_URL
+    os.environ.setdefault("LLM_MODEL", "stub")
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+
+def reset_schema():
+    from sqlmodel import SQLModel
+
+    from app.core.db import models  # noqa: F401
+    from app.core.db.setup import engine
+
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+
+def seed_admin():
+    """Creates a verified admin and returns (user id, login session id)."""
+    from sqlmodel import Session
+
+    from app.core.db.builders.role import RoleBuilder
+    from app.core.db.models import LoginSession, User
+    from app.core.db.setup import engine
+    from app.core.security.permissions import ADMIN_ROLE_NAME
+
+    with Session(engine) as db_session:
+        user = User(
+            email="bench@example.com",
+            username="bench",
+            hashed_password="-",
+            name="Benchmark",
+            verified=True,
+        )
+        role = RoleBuilder().addUser(user).withName(ADMIN_ROLE_NAME).make()
+        login_session = LoginSession(user_id=user.id)
+        db_session.add_all([user, role, login_session])
+        db_session.commit()
+        return user.id, login_session.id
+
+
+def seed_form(user_id: str, fields_per_type: int = 1, open: bool = True):
+    """Creates a form holding every field type, returns its id."""
+    from sqlmodel import Session
+
+    from app.core.db.models import Form, FormField
+    from app.core.db.setup import engine
+
+    with Session(engine) as db_session:
+        form = Form(user_id=user_id, label="Benchmark form", open=open)
+        position = 0
+        for _ in range(fields_per_type):
+            for field_type, possible_answers, _value in FIELD_SAMPLES:
+                db_session.add(
+                    FormField(
+                        form_id=form.id,
+                        label=f"{field_type} {position}",
+                        description=f"A {field_type} field",
+                        field_type=field_type,
+                        possible_answers=possible_answers,
+                        position=position,
+                    )
+                )
+                position += 1
+        db_session.add(form)
+        db_session.commit()
+        return form.id
+
+
+def sample_value(field_type: str) -> str:
+    for sample_type, _possible_answers, value in FIELD_SAMPLES:
+        if sample_type == field_type:
+            return value
+    return "value"
+
+
+def percentiles(samples: Iterable[float]) -> dict[str, float]:
+    """Summarizes durations in seconds as milliseconds."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def at(p: float):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(at(0.50), 3),
+        "p95_ms": round(at(0.95), 3),
+        "p99_ms": round(at(0.99), 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
@@ -0,0 +1,183 @@
+"""
+End-to-end load benchmark of the respondent flow.
+
+Runs the ASGI app in-process, seeds a form holding every field type and
+drives concurrent respondents through:
+
+    GET  /forms/{id}
+    GET  /forms/{id}/fields
+    POST /forms/responses         (one autosave per field)
+    POST /forms/responses/save
+    POST /forms/{id}/sessions/submit
+
+Usage (from backend/):
+
+    python -m benchmarks.load --respondents 200 --concurrency 20
+    python -m benchmarks.load --db-url postgresql+psycopg2://... \\
+        --output results.json --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+
+from benchmarks.common import (
+    add_database_arguments,
+    configure_database,
+    percentiles,
+)
+
+API = "/api/v1/forms"
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(self, step: str, request, expected: int):
+        started_at = time.perf_counter()
+        response = await request
+        self.durations[step].append(time.perf_counter() - started_at)
+        if response.status_code != expected:
+            self.errors[step] += 1
+        return response
+
+
+async def respondent(app, form_id, recorder: Recorder, autosaves: int):
+    import httpx
+
+    from benchmarks.common import sample_value
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await recorder.call("get_form", client.get(f"{API}/{form_id}"), 200)
+        response = await recorder.call(
+            "get_fields", client.get(f"{API}/{form_id}/fields"), 200
+        )
+        fields = response.json()
+        answers = {
+            field["id"]: sample_value(field["field_type"]) for field in fields
+        }
+        for field_id, value in list(answers.items())[:autosaves]:
+            await recorder.call(
+                "autosave",
+                client.post(
+                    f"{API}/responses",
+                    json={"field_id": field_id, "value": value},
+                ),
+                201,
+            )
+        await recorder.call(
+            "save",
+            client.post(
+                f"{API}/responses/save",
+                json={"form_id": str(form_id), "field_answers": answers},
+            ),
+            200,
+        )
+        await recorder.call(
+            "submit", client.post(f"{API}/{form_id}/sessions/submit"), 200
+        )
+
+
+async def run(args: argparse.Namespace):
+    from benchmarks.common import reset_schema, seed_admin, seed_form
+
+    reset_schema()
+    user_id, _ = seed_admin()
+    form_id = seed_form(user_id, fields_per_type=args.fields_per_type)
+
+    from app.app import app
+
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited():
+        async with semaphore:
+            await respondent(app, form_id, recorder, args.autosaves)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[limited() for _ in range(args.respondents)])
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "respondents": args.respondents,
+        "concurrency": args.concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "flows_per_s": round(args.respondents / elapsed, 2),
+        "requests_per_s": round(
+            sum(len(d) for d in recorder.durations.values()) / elapsed, 2
+        ),
+        "steps": {
+            step: {
+                **percentiles(durations),
+                "errors": recorder.errors[step],
+            }
+            for step, durations in recorder.durations.items()
+        },
+    }
+
+
+def print_report(results: dict, baseline: dict | None):
+    print(
+        f"{results['respondents']} respondents, concurrency "
+        f"{results['concurrency']}: {results['elapsed_s']}s, "
+        f"{results['flows_per_s']} flows/s, "
+        f"{results['requests_per_s']} req/s"
+    )
+    header = f"{'step':<12}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}"
+    header += f"{'p99 ms':>10}{'errors':>8}"
+    if baseline is not None:
+        header += f"{'p50 vs base':>14}"
+    print(header)
+    for step, stats in results["steps"].items():
+        line = f"{step:<12}{stats['count']:>8}{stats['p50_ms']:>10}"
+        line += f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+        line += f"{stats['errors']:>8}"
+        base = (baseline or {}).get("steps", {}).get(step)
+        if base is not None:
+            change = (stats["p50_ms"] - base["p50_ms"]) / base["p50_ms"]
+            line += f"{change:>+14.1%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_database_arguments(parser)
+    parser.add_argument("--respondents", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--fields-per-type",
+        type=int,
+        default=1,
+        help="how many fields of each FormFieldType the form holds",
+    )
+    parser.add_argument(
+        "--autosaves",
+        type=int,
+        default=5,
+        help="autosaved fields per respondent before the batch save",
+    )
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="baseline JSON to compare with")
+    args = parser.parse_args()
+
+    configure_database(args.db_url, args.yes_drop)
+    results = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
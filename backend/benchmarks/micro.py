@@ -0,0 +1,317 @@
+"""
+Microbenchmarks of the CPU-bound paths: answer validation, permission
+checks, DTO building, response serialization, CSV pivoting and id/OTP
+generation.
+
+Usage (from backend/):
+
+    python -m benchmarks.micro --save-baseline   # record this machine
+    python -m benchmarks.micro                   # compare, exit 1 on
+                                                 # regressions
+    python -m benchmarks.micro --filter validate --threshold 0.1
+    python -m benchmarks.micro --filter csv --save-baseline  # merged in
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from benchmarks.common import (
+    FIELD_SAMPLES,
+    add_database_arguments,
+    configure_database,
+)
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "baselines", "micro.json"
+)
+
+Benchmark = tuple[str, Callable[[], object]]
+
+
+def validation_benchmarks() -> list[Benchmark]:
+    from app.api.routes.v1.providers.form import validate_answer
+    from app.core.db.models import FormField
+
+    benchmarks = []
+    for field_type, possible_answers, value in FIELD_SAMPLES:
+        field = FormField(
+            form_id=uuid.uuid4(),
+            label=field_type,
+            description="",
+            field_type=field_type,
+            possible_answers=possible_answers,
+            number_bounds="0:100" if field_type == "Numerical" else None,
+            text_bounds="0:500" if "Text" in field_type else None,
+        )
+        benchmarks.append(
+            (
+                f"validate_answer[{field_type}]",
+                lambda value=value, field=field: validate_answer(value, field),
+            )
+        )
+    return benchmarks
+
+
+def permission_benchmarks() -> list[Benchmark]:
+    from sqlmodel import Session
+
+    from app.core.db.models import Permission, Role
+    from app.core.db.setup import engine
+    from app.core.security.permissions import (
+        ACTION_READWRITE,
+        FORM_RESOURCE,
+        PermissionChecker,
+        PermissionCheckModel,
+    )
+
+    resource_id = uuid.uuid4()
+    db_session = Session(engine)
+    benchmarks = []
+    for role_count in (1, 5, 25):
+        roles = [Role() for _ in range(role_count)]
+        # Only the last role holds the permission, so every role is checked
+        db_session.add(
+            Permission(
+                name=f"{FORM_RESOURCE}:{resource_id}:{ACTION_READWRITE}",
+                role=roles[-1],
+            )
+        )
+        db_session.add_all(roles)
+        db_session.commit()
+        checker = PermissionChecker(
+            db_session=db_session,
+            roles=roles,
+            pcheck_models=[
+                PermissionCheckModel(
+                    resource_name=FORM_RESOURCE,
+                    resource_id=resource_id,
+                    action_names=[ACTION_READWRITE],
+                )
+            ],
+        )
+        benchmarks.append(
+            (f"PermissionChecker.check[{role_count} roles]", checker.check)
+        )
+    return benchmarks
+
+
+def build_form(field_count: int, session_count: int):
+    from app.core.db.models import AnswerSession, FieldAnswer, Form, FormField
+
+    form = Form(user_id="bench", label="Benchmark form", open=True)
+    form.fields = [
+        FormField(
+            form_id=form.id,
+            label=f"{field_type} {position}",
+            description="",
+            field_type=field_type,
+            possible_answers=possible_answers,
+            position=position,
+        )
+        for position, (field_type, possible_answers, _) in enumerate(
+            FIELD_SAMPLES * (field_count // len(FIELD_SAMPLES) + 1)
+        )
+    ][:field_count]
+    sessions = []
+    for _ in range(session_count):
+        session = AnswerSession(
+            form_id=form.id,
+            submitted=True,
+            submitted_at=datetime.now(timezone.utc),
+        )
+        session.answers = [
+            FieldAnswer(
+                field_id=field.id,
+                session_id=session.id,
+                value="value",
+                field=field,
+            )
+            for field in form.fields
+        ]
+        sessions.append(session)
+    return form, sessions
+
+
+def dto_benchmarks() -> list[Benchmark]:
+    form, sessions = build_form(field_count=20, session_count=1)
+    return [
+        ("Form.to_dto[20 fields]", form.to_dto),
+        ("AnswerSession.to_dto[20 answers]", sessions[0].to_dto),
+    ]
+
+
+def run_coroutine(coroutine):
+    """Runs a coroutine that never suspends, without an event loop."""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspended")
+
+
+def serialization_benchmarks() -> list[Benchmark]:
+    """
+    Response serialization per endpoint as FastAPI does it (validation
+    against the response model, then rendering) with the stdlib JSON and
+    the ORJSON response classes, against pydantic's own serializer as used
+    by json_response. Also validated vs constructed DTOs.
+    """
+    from typing import List
+
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from pydantic import TypeAdapter
+
+    from app.api.routes.v1.dto.form import (
+        AnswerSessionDTO,
+        FormDTO,
+        FormFieldDTO,
+    )
+
+    form, sessions = build_form(field_count=20, session_count=10)
+    fields = [field.to_dto() for field in form.fields]
+    endpoints = [
+        ("get_form", FormDTO, form.to_dto()),
+        ("get_form_fields[20]", List[FormFieldDTO], fields),
+        (
+            "get_responses[10x20]",
+            List[AnswerSessionDTO],
+            [session.to_dto() for session in sessions],
+        ),
+    ]
+    benchmarks: list[Benchmark] = []
+    for endpoint, model, content in endpoints:
+        field = create_model_field(name="Response", type_=model)
+        for label, response_class in (
+            ("json", JSONResponse),
+            ("orjson", ORJSONResponse),
+        ):
+            benchmarks.append(
+                (
+                    f"serialize[{endpoint}][{label}]",
+                    lambda field=field, content=content, cls=response_class: (
+                        cls(
+                            run_coroutine(
+                                serialize_response(
+                                    field=field, response_content=content
+                                )
+                            )
+                        ).body
+                    ),
+                )
+            )
+        benchmarks.append(
+            (
+                f"serialize[{endpoint}][dump_json]",
+                lambda adapter=TypeAdapter(model), content=content: (
+                    adapter.dump_json(content)
+                ),
+            )
+        )
+    field_values = dict(fields[0])
+    return [
+        *benchmarks,
+        ("FormFieldDTO[validated]", lambda: FormFieldDTO(**field_values)),
+        (
+            "FormFieldDTO[constructed]",
+            lambda: FormFieldDTO.model_construct(**field_values),
+        ),
+    ]
+
+
+def csv_benchmarks() -> list[Benchmark]:
+    from app.api.routes.v1.providers.form import response_rows
+
+    form, sessions = build_form(field_count=20, session_count=1000)
+    return [
+        (
+            "response_rows[1000 sessions x 20 fields]",
+            lambda: list(response_rows(form.fields, sessions)),
+        )
+    ]
+
+
+def crypto_benchmarks() -> list[Benchmark]:
+    from app.utils.crypto import gen_id, gen_otp
+
+    return [("gen_id", gen_id), ("gen_otp", gen_otp)]
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """Best time per call in microseconds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_database_arguments(parser)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown reported as a regression (default 20%%)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="only run benchmarks matching this")
+    args = parser.parse_args()
+
+    configure_database(args.db_url, args.yes_drop)
+    from benchmarks.common import reset_schema
+
+    reset_schema()
+
+    benchmarks = [
+        *validation_benchmarks(),
+        *permission_benchmarks(),
+        *dto_benchmarks(),
+        *serialization_benchmarks(),
+        *csv_benchmarks(),
+        *crypto_benchmarks(),
+    ]
+    baseline: dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results: dict[str, float] = {}
+    regressions = []
+    for name, fn in benchmarks:
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(fn, args.repeat)
+        line = f"{name:<44}{results[name]:>14.2f} us"
+        if name in baseline:
+            change = (results[name] - baseline[name]) / baseline[name]
+            line += f"{change:>+10.1%}"
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        # A filtered run only replaces the benchmarks it measured
+        if args.filter:
+            results = {**baseline, **results}
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Data-scale benchmark: latency and peak RSS of the response, export,
+listing and deletion endpoints at growing submission counts.
+
+Each endpoint is measured in a fresh process so that peak RSS belongs to
+that request alone.
+
+Usage (from backend/):
+
+    python -m benchmarks.scale --scales 1000,100000,1000000
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.common import add_database_arguments, configure_database
+
+ENDPOINTS = {
+    "get_responses": ("GET", "/api/v1/forms/{form_id}/responses?limit=10"),
+    "export_responses_csv": (
+        "GET",
+        "/api/v1/forms/{form_id}/responses/export",
+    ),
+    "get_forms": ("GET", "/api/v1/forms/?limit=10"),
+    # Runs last, it removes the dataset
+    "delete_form": ("DELETE", "/api/v1/forms/{form_id}"),
+}
+
+
+async def measure(endpoint: str, form_id: str, login_session_id: str):
+    import httpx
+
+    from app.app import app
+
+    method, path = ENDPOINTS[endpoint]
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        cookies={"user_session_id": login_session_id},
+        timeout=None,
+    ) as client:
+        started_at = time.perf_counter()
+        response = await client.request(method, path.format(form_id=form_id))
+        _ = response.content
+        elapsed = time.perf_counter() - started_at
+    return {
+        "status": response.status_code,
+        "latency_ms": round(elapsed * 1000, 2),
+        # kilobytes on Linux
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+
+
+def run_scale(args: argparse.Namespace, submissions: int):
+    from benchmarks.seed import seed_dataset
+
+    started_at = time.perf_counter()
+    login_session_id, form_id = seed_dataset(
+        submissions, args.forms, args.fields_per_type
+    )
+    print(
+        f"\n{submissions} submissions "
+        f"(seeded in {time.perf_counter() - started_at:.1f}s)"
+    )
+    results = {}
+    for endpoint in ENDPOINTS:
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.scale",
+            "--measure",
+            endpoint,
+            "--form-id",
+            str(form_id),
+            "--login-session-id",
+            login_session_id,
+        ]
+        if args.db_url:
+            command += ["--db-url", args.db_url]
+        if args.yes_drop:
+            command.append("--yes-drop")
+        output = subprocess.run(
+            command, capture_output=True, text=True, check=True
+        ).stdout
+        results[endpoint] = json.loads(output.strip().splitlines()[-1])
+        stats = results[endpoint]
+        print(
+            f"  {endpoint:<22}{stats['latency_ms']:>12} ms"
+            f"{stats['peak_rss_mb']:>10} MB  (HTTP {stats['status']})"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_database_arguments(parser)
+    parser.add_argument("--scales", default="1000,100000,1000000")
+    parser.add_argument("--forms", type=int, default=10)
+    parser.add_argument("--fields-per-type", type=int, default=1)
+    parser.add_argument("--output", help="write results as JSON")
+    # Internal, used by the per-endpoint subprocesses
+    parser.add_argument("--measure", choices=ENDPOINTS, help=argparse.SUPPRESS)
+    parser.add_argument("--form-id", help=argparse.SUPPRESS)
+    parser.add_argument("--login-session-id", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    configure_database(args.db_url, args.yes_drop)
+    if args.measure:
+        result = asyncio.run(
+            measure(args.measure, args.form_id, args.login_session_id)
+        )
+        print(json.dumps(result))
+        return
+
+    results = {
+        scale: run_scale(args, int(scale)) for scale in args.scales.split(",")
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Synthetic data generator: forms holding every field type and submitted
+answer sessions, written with bulk inserts.
+
+Usage (from backend/):
+
+    python -m benchmarks.seed --submissions 100000 --forms 10
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import (
+    FIELD_SAMPLES,
+    add_database_arguments,
+    configure_database,
+)
+
+BATCH_SIZE = 5000
+
+
+def seed_responses(
+    form_id: uuid.UUID, submissions: int, batch_size: int = BATCH_SIZE
+):
+    """Bulk inserts submitted answer sessions answering every field."""
+    from sqlmodel import Session, select, update
+
+    from app.core.db.models import AnswerSession, FieldAnswer, Form, FormField
+    from app.core.db.setup import engine
+    from app.utils.answers import typed_answer_values
+
+    with Session(engine) as db_session:
+        fields = db_session.exec(
+            select(FormField.id, FormField.field_type).where(
+                FormField.form_id == form_id
+            )
+        ).all()
+    values = {
+        field_type: {"value": value, **typed_answer_values(field_type, value)}
+        for field_type, _, value in FIELD_SAMPLES
+    }
+    started_at = datetime.now(timezone.utc) - timedelta(days=30)
+    session_table = AnswerSession.__table__  # type: ignore[attr-defined]
+    answer_table = FieldAnswer.__table__  # type: ignore[attr-defined]
+
+    with engine.begin() as connection:
+        for offset in range(0, submissions, batch_size):
+            sessions = []
+            answers = []
+            for _ in range(min(batch_size, submissions - offset)):
+                session_id = uuid.uuid4()
+                sessions.append(
+                    {
+                        "id": session_id,
+                        "form_id": form_id,
+                        "submitted": True,
+                        "submitted_at": started_at
+                        + timedelta(seconds=random.randint(0, 30 * 86400)),
+                    }
+                )
+                answers.extend(
+                    {
+                        "id": uuid.uuid4(),
+                        "field_id": field_id,
+                        "session_id": session_id,
+                        **values[field_type],
+                    }
+                    for field_id, field_type in fields
+                )
+            connection.execute(session_table.insert(), sessions)
+            connection.execute(answer_table.insert(), answers)
+        connection.execute(
+            update(Form)
+            .where(Form.id == form_id)  # type: ignore[arg-type]
+            .values(submissions=Form.submissions + submissions)
+        )
+
+
+def seed_dataset(
+    submissions: int, forms: int = 10, fields_per_type: int = 1
+) -> tuple[str, uuid.UUID]:
+    """
+    Seeds an admin and `forms` forms, the first one receiving all the
+    submissions. Returns the admin login session id and that form's id.
+    """
+    from benchmarks.common import reset_schema, seed_admin, seed_form
+
+    reset_schema()
+    user_id, login_session_id = seed_admin()
+    form_ids = [
+        seed_form(user_id, fields_per_type=fields_per_type)
+        for _ in range(forms)
+    ]
+    seed_responses(form_ids[0], submissions)
+    return login_session_id, form_ids[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_database_arguments(parser)
+    parser.add_argument("--submissions", type=int, default=1000)
+    parser.add_argument("--forms", type=int, default=10)
+    parser.add_argument("--fields-per-type", type=int, default=1)
+    args = parser.parse_args()
+
+    configure_database(args.db_url, args.yes_drop)
+    started_at = time.perf_counter()
+    _, form_id = seed_dataset(
+        args.submissions, args.forms, args.fields_per_type
+    )
+    print(
+        f"Seeded {args.submissions} submissions into form {form_id} "
+        f"in {time.perf_counter() - started_at:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
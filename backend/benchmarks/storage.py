@@ -0,0 +1,194 @@
+"""
+Answer storage benchmark: row-per-answer against one JSON document per
+answer session.
+
+For each ANSWER_STORAGE mode, in a fresh process, respondents save every
+field of a form in one batch, read their session back and submit. Reports
+save and read latency, SQL statements per save, rows written and storage
+size, then the latency of listing and exporting the responses.
+
+Usage (from backend/):
+
+    python -m benchmarks.storage --respondents 200 --fields-per-type 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from benchmarks.common import (
+    add_database_arguments,
+    configure_database,
+    percentiles,
+)
+
+API = "/api/v1/forms"
+MODES = ("rows", "document")
+
+
+def storage_size(engine) -> int | None:
+    """
+    Bytes used by answer sessions and answers (the whole database file on
+    SQLite), None when unknown.
+    """
+    from sqlalchemy import text
+
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            return connection.execute(
+                text(
+                    "SELECT pg_total_relation_size('answersession')"
+                    " + pg_total_relation_size('fieldanswer')"
+                )
+            ).scalar_one()
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            pages, free, page_size = (
+                connection.execute(text(f"PRAGMA {pragma}")).scalar_one()
+                for pragma in ("page_count", "freelist_count", "page_size")
+            )
+            return (pages - free) * page_size
+    return None
+
+
+def query_count(response) -> int:
+    match = re.search(
+        r'desc="(\d+) queries"', response.headers["server-timing"]
+    )
+    return int(match.group(1)) if match else 0
+
+
+async def run(respondents: int, fields_per_type: int):
+    import httpx
+    from sqlmodel import Session, func, select
+
+    from app.app import app
+    from app.core.db.models import AnswerSession, FieldAnswer
+    from app.core.db.setup import engine
+    from benchmarks.common import (
+        reset_schema,
+        sample_value,
+        seed_admin,
+        seed_form,
+    )
+
+    reset_schema()
+    user_id, login_session_id = seed_admin()
+    form_id = seed_form(user_id, fields_per_type=fields_per_type)
+    size_before = storage_size(engine)
+    durations: dict[str, list[float]] = {"save": [], "read": []}
+    queries = []
+
+    transport = httpx.ASGITransport(app=app)
+    for _ in range(respondents):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            fields = (await client.get(f"{API}/{form_id}/fields")).json()
+            answers = {
+                field["id"]: sample_value(field["field_type"])
+                for field in fields
+            }
+            started_at = time.perf_counter()
+            response = await client.post(
+                f"{API}/responses/save",
+                json={"form_id": str(form_id), "field_answers": answers},
+            )
+            durations["save"].append(time.perf_counter() - started_at)
+            queries.append(query_count(response))
+            started_at = time.perf_counter()
+            await client.get(f"{API}/sessions")
+            durations["read"].append(time.perf_counter() - started_at)
+            await client.post(f"{API}/{form_id}/sessions/submit")
+
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        cookies={"user_session_id": login_session_id},
+        timeout=None,
+    ) as admin:
+        for step, path in (
+            ("list_responses", f"{API}/{form_id}/responses?limit=100"),
+            ("export", f"{API}/{form_id}/responses/export"),
+        ):
+            started_at = time.perf_counter()
+            (await admin.get(path)).raise_for_status()
+            durations[step] = [time.perf_counter() - started_at]
+
+    with Session(engine) as db_session:
+        sessions = db_session.exec(select(func.count(AnswerSession.id))).one()
+        answer_rows = db_session.exec(select(func.count(FieldAnswer.id))).one()
+    size_after = storage_size(engine)
+    return {
+        "fields": len(answers),
+        "queries_per_save": round(sum(queries) / len(queries), 1),
+        "rows_written": sessions + answer_rows,
+        "storage_bytes": (
+            size_after - size_before
+            if size_after is not None and size_before is not None
+            else None
+        ),
+        **{
+            step: percentiles(samples)["p50_ms"]
+            for step, samples in durations.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_database_arguments(parser)
+    parser.add_argument("--respondents", type=int, default=100)
+    parser.add_argument("--fields-per-type", type=int, default=2)
+    parser.add_argument("--output", help="write results as JSON")
+    # Internal, used by the per-mode subprocesses
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        os.environ["ANSWER_STORAGE"] = args.mode
+        configure_database(args.db_url, args.yes_drop)
+        result = asyncio.run(run(args.respondents, args.fields_per_type))
+        print(json.dumps(result))
+        return
+
+    results = {}
+    for mode in MODES:
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.storage",
+            "--mode",
+            mode,
+            "--respondents",
+            str(args.respondents),
+            "--fields-per-type",
+            str(args.fields_per_type),
+        ]
+        if args.db_url:
+            command += ["--db-url", args.db_url]
+        if args.yes_drop:
+            command.append("--yes-drop")
+        output = subprocess.run(
+            command, capture_output=True, text=True, check=True
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'':<20}" + "".join(f"{mode:>14}" for mode in MODES))
+    for metric in results[MODES[0]]:
+        print(
+            f"{metric:<20}"
+            + "".join(f"{str(results[mode][metric]):>14}" for mode in MODES)
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
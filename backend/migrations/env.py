@@ -25,6 +25,24 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Leaves out the answer search objects, they are created by the raw DDL in
+    FIELD_ANSWER_SEARCH_DDL rather than from the models.
+    """
+    if type_ == "table":
+        # the FTS5 table and its shadow tables
+        return not name.startswith("fieldanswer_fts")
+    if type_ == "column":
+        return not (
+            object.table.name == "fieldanswer" and name == "search_vector"
+        )
+    if type_ == "index":
+        return name != "ix_fieldanswer_search_vector"
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +65,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -70,7 +89,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,60 @@
+"""Add form translation cache
+
+Revision ID: 3b9e4f0c2d71
+Revises: 13d7c885ef1c
+Create Date: 2026-10-19 09:12:04.318527
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e4f0c2d71"
+down_revision: Union[str, None] = "13d7c885ef1c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "formtranslation",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("form_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "language", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "content_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "content", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["form_id"], ["form.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "form_id",
+            "language",
+            "content_hash",
+            name="uq_formtranslation_form_id_language_content_hash",
+        ),
+    )
+    op.create_index(
+        op.f("ix_formtranslation_form_id"),
+        "formtranslation",
+        ["form_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_formtranslation_form_id"), table_name="formtranslation"
+    )
+    op.drop_table("formtranslation")
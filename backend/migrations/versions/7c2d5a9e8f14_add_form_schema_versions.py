@@ -0,0 +1,36 @@
+"""Add form schema versions
+
+Revision ID: 7c2d5a9e8f14
+Revises: 3b9e4f0c2d71
+Create Date: 2026-10-19 14:03:27.905112
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2d5a9e8f14"
+down_revision: Union[str, None] = "3b9e4f0c2d71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "form",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+    op.add_column(
+        "answersession",
+        sa.Column("form_version", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("answersession", "form_version")
+    op.drop_column("form", "version")
@@ -0,0 +1,36 @@
+"""Add answer session documents
+
+Revision ID: 9a4e6b1f3c58
+Revises: 7c2d5a9e8f14
+Create Date: 2026-10-19 16:41:52.118734
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e6b1f3c58"
+down_revision: Union[str, None] = "7c2d5a9e8f14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "answersession",
+        sa.Column(
+            "answers_document",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("answersession", "answers_document")
@@ -0,0 +1,134 @@
+"""Add typed answer values
+
+Revision ID: b5f17c3e2a90
+Revises: 9a4e6b1f3c58
+Create Date: 2026-10-19 18:22:09.473051
+
+"""
+
+import math
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5f17c3e2a90"
+down_revision: Union[str, None] = "9a4e6b1f3c58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def typed_values(field_type: str, value: str):
+    # Frozen copy of app.utils.answers.typed_answer_values
+    typed = {"value_num": None, "value_date": None, "value_bool": None}
+    try:
+        if field_type in ("Numerical", "Currency"):
+            number = float(value)
+            if math.isfinite(number):
+                typed["value_num"] = number
+        elif field_type == "Date":
+            typed["value_date"] = date.fromisoformat(value)
+        elif field_type == "Boolean" and value in ("0", "1"):
+            typed["value_bool"] = value == "1"
+    except ValueError:
+        pass
+    return typed
+
+
+def backfill():
+    connection = op.get_bind()
+    answers = sa.table(
+        "fieldanswer",
+        sa.column("id", sa.Uuid()),
+        sa.column("field_id", sa.Uuid()),
+        sa.column("value", sa.String()),
+        sa.column("value_num", sa.Float()),
+        sa.column("value_date", sa.Date()),
+        sa.column("value_bool", sa.Boolean()),
+    )
+    fields = sa.table(
+        "formfield",
+        sa.column("id", sa.Uuid()),
+        sa.column("field_type", sa.String()),
+    )
+    update = (
+        answers.update()
+        .where(answers.c.id == sa.bindparam("answer_id"))
+        .values(
+            value_num=sa.bindparam("value_num"),
+            value_date=sa.bindparam("value_date"),
+            value_bool=sa.bindparam("value_bool"),
+        )
+    )
+    typed_answers = (
+        sa.select(answers.c.id, fields.c.field_type, answers.c.value)
+        .join(fields, fields.c.id == answers.c.field_id)
+        .where(
+            fields.c.field_type.in_(
+                ["Numerical", "Currency", "Date", "Boolean"]
+            ),
+            answers.c.value.is_not(None),
+        )
+        .order_by(answers.c.id)
+        .limit(BATCH_SIZE)
+    )
+    # Paged by primary key, so that only one batch is held in memory
+    last_id = None
+    while True:
+        page = typed_answers
+        if last_id is not None:
+            page = page.where(answers.c.id > last_id)
+        rows = connection.execute(page).all()
+        if not rows:
+            return
+        connection.execute(
+            update,
+            [
+                {"answer_id": answer_id, **typed_values(field_type, value)}
+                for answer_id, field_type, value in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "fieldanswer", sa.Column("value_num", sa.Float(), nullable=True)
+    )
+    op.add_column(
+        "fieldanswer", sa.Column("value_date", sa.Date(), nullable=True)
+    )
+    op.add_column(
+        "fieldanswer", sa.Column("value_bool", sa.Boolean(), nullable=True)
+    )
+    backfill()
+    op.create_index(
+        "ix_fieldanswer_field_id_value_num",
+        "fieldanswer",
+        ["field_id", "value_num"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fieldanswer_field_id_value_date",
+        "fieldanswer",
+        ["field_id", "value_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_fieldanswer_field_id_value_date", table_name="fieldanswer"
+    )
+    op.drop_index(
+        "ix_fieldanswer_field_id_value_num", table_name="fieldanswer"
+    )
+    op.drop_column("fieldanswer", "value_bool")
+    op.drop_column("fieldanswer", "value_date")
+    op.drop_column("fieldanswer", "value_num")
@@ -0,0 +1,44 @@
+"""Add response filter indexes
+
+Revision ID: d3a8c61f0b27
+Revises: b5f17c3e2a90
+Create Date: 2026-10-19 19:05:37.204416
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a8c61f0b27"
+down_revision: Union[str, None] = "b5f17c3e2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_fieldanswer_session_id_field_id",
+        "fieldanswer",
+        ["session_id", "field_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_answersession_form_id_submitted_submitted_at",
+        "answersession",
+        ["form_id", "submitted", "submitted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_answersession_form_id_submitted_submitted_at",
+        table_name="answersession",
+    )
+    op.drop_index(
+        "ix_fieldanswer_session_id_field_id", table_name="fieldanswer"
+    )
@@ -0,0 +1,77 @@
+"""Add answer full-text search
+
+Revision ID: e71b4d9c2f06
+Revises: d3a8c61f0b27
+Create Date: 2026-10-19 20:12:44.861392
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e71b4d9c2f06"
+down_revision: Union[str, None] = "d3a8c61f0b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.core.db.models.FIELD_ANSWER_SEARCH_DDL
+SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE fieldanswer ADD COLUMN search_vector tsvector"
+        " GENERATED ALWAYS AS"
+        " (to_tsvector('simple', coalesce(value, ''))) STORED",
+        "CREATE INDEX ix_fieldanswer_search_vector ON fieldanswer"
+        " USING gin (search_vector)",
+    ],
+    "sqlite": [
+        # Answer rowids are not stable (VACUUM, batch migrations), so the
+        # FTS table keeps the answer id to join on instead
+        "CREATE VIRTUAL TABLE IF NOT EXISTS fieldanswer_fts USING fts5"
+        "(answer_id UNINDEXED, value)",
+        "CREATE TRIGGER fieldanswer_fts_insert AFTER INSERT ON fieldanswer"
+        " BEGIN"
+        " INSERT INTO fieldanswer_fts(answer_id, value)"
+        " VALUES (new.id, new.value);"
+        " END",
+        "CREATE TRIGGER fieldanswer_fts_delete AFTER DELETE ON fieldanswer"
+        " BEGIN"
+        " DELETE FROM fieldanswer_fts WHERE answer_id = old.id;"
+        " END",
+        "CREATE TRIGGER fieldanswer_fts_update"
+        " AFTER UPDATE OF value ON fieldanswer"
+        " BEGIN"
+        " UPDATE fieldanswer_fts SET value = new.value"
+        " WHERE answer_id = new.id;"
+        " END",
+        # Indexes the answers already stored
+        "INSERT INTO fieldanswer_fts(answer_id, value)"
+        " SELECT id, value FROM fieldanswer",
+    ],
+}
+
+DROP_SEARCH_DDL = {
+    "postgresql": [
+        "DROP INDEX ix_fieldanswer_search_vector",
+        "ALTER TABLE fieldanswer DROP COLUMN search_vector",
+    ],
+    "sqlite": [
+        "DROP TRIGGER fieldanswer_fts_update",
+        "DROP TRIGGER fieldanswer_fts_delete",
+        "DROP TRIGGER fieldanswer_fts_insert",
+        "DROP TABLE fieldanswer_fts",
+    ],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in SEARCH_DDL.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in DROP_SEARCH_DDL.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
@@ -0,0 +1,53 @@
+"""Add field aggregates
+
+Revision ID: f40c8e2b7a13
+Revises: e71b4d9c2f06
+Create Date: 2026-10-19 21:27:58.390127
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f40c8e2b7a13"
+down_revision: Union[str, None] = "e71b4d9c2f06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "fieldaggregate",
+        sa.Column("field_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "bucket", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Float(), nullable=True),
+        sa.Column("minimum", sa.Float(), nullable=True),
+        sa.Column("maximum", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["field_id"], ["formfield.id"]),
+        sa.PrimaryKeyConstraint("field_id", "kind", "bucket"),
+    )
+    # Existing forms get their aggregates built on the first summary read
+    op.add_column(
+        "form",
+        sa.Column(
+            "aggregates_stale",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.true(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("form", "aggregates_stale")
+    op.drop_table("fieldaggregate")
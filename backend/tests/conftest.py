@@ -0,0 +1,115 @@
+import os
+import tempfile
+from pathlib import Path
+from uuid import UUID
+
+# The app reads its configuration on import
+_database = Path(tempfile.mkdtemp()) / "test.db"
+os.environ["DB_STRING"] = f"sqlite:///{_database}"
+os.environ["LLM_MODEL"] = "stub"
+os.environ["LLM_RATE_PER_SECOND"] = os.environ["LLM_BURST"] = "1000"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, SQLModel  # noqa: E402
+
+from app.app import app  # noqa: E402
+from app.core.db.builders.role import RoleBuilder  # noqa: E402
+from app.core.db.models import LoginSession, User  # noqa: E402
+from app.core.db.setup import engine  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+    _database.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def db_session(database):
+    with Session(database) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def admin_session_id(database) -> UUID:
+    with Session(database) as session:
+        user = User(
+            email="admin@example.com",
+            username="admin",
+            hashed_password="x",
+            name="Admin",
+            verified=True,
+        )
+        role = RoleBuilder().addUser(user).withName("admin").make()
+        login_session = LoginSession(user_id=user.id)
+        session.add_all([user, role, login_session])
+        session.commit()
+        return login_session.id
+
+
+@pytest.fixture(scope="session")
+def admin(admin_session_id):
+    with TestClient(app) as client:
+        client.cookies.set("user_session_id", str(admin_session_id))
+        yield client
+
+
+@pytest.fixture(scope="session")
+def member_session_id(database) -> UUID:
+    with Session(database) as session:
+        user = User(
+            email="member@example.com",
+            username="member",
+            hashed_password="x",
+            name="Member",
+            verified=True,
+        )
+        login_session = LoginSession(user_id=user.id)
+        session.add_all([user, login_session])
+        session.commit()
+        return login_session.id
+
+
+@pytest.fixture
+def member(member_session_id):
+    """A signed in user without any role."""
+    client = TestClient(app)
+    client.cookies.set("user_session_id", str(member_session_id))
+    return client
+
+
+@pytest.fixture(scope="session")
+def respondent():
+    """A new anonymous client, without an answer session, per call."""
+    return lambda: TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def make_form(admin):
+    """Creates and opens a form with a field per given field type."""
+
+    def make(*field_types: str, **field_options) -> tuple[str, list[dict]]:
+        form_id = admin.post(
+            "/api/v1/forms", json={"label": "Form", "description": "d"}
+        ).json()["id"]
+        fields = []
+        for position, field_type in enumerate(field_types):
+            response = admin.post(
+                f"/api/v1/forms/{form_id}/fields",
+                json={
+                    "form_id": form_id,
+                    "label": f"Q{position}",
+                    "description": "d",
+                    "field_type": field_type,
+                    **field_options.get(field_type, {}),
+                },
+            )
+            assert response.status_code == 201, response.text
+            fields.append(response.json())
+        assert admin.post(f"/api/v1/forms/{form_id}/open").status_code == 200
+        return form_id, fields
+
+    return make
@@ -0,0 +1,133 @@
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session, select, update
+
+from app.api.routes.v1.providers import form as form_provider
+from app.core.db.documents import (
+    has_document,
+    remove_document_answer,
+    write_document_answers,
+)
+from app.core.db.models import AnswerSession, FieldAnswer
+
+
+@pytest.fixture
+def answer_session(database, make_form):
+    """A session of a form with two fields, the first answered in a row."""
+    form_id, fields = make_form("Text", "Text")
+    first, second = (UUID(field["id"]) for field in fields)
+    with Session(database) as db_session:
+        answer_session = AnswerSession(form_id=UUID(form_id))
+        db_session.add(answer_session)
+        db_session.add(
+            FieldAnswer(
+                session_id=answer_session.id, field_id=first, value="row"
+            )
+        )
+        db_session.commit()
+        return answer_session.id, first, second
+
+
+def stored(database, session_id: UUID):
+    with Session(database) as db_session:
+        answer_session = db_session.get(AnswerSession, session_id)
+        assert answer_session is not None
+        return answer_session.answers_document, answer_session.answer_values()
+
+
+def test_concurrent_saves_are_merged(database, answer_session):
+    session_id, first, second = answer_session
+    with Session(database) as one, Session(database) as other:
+        # both requests loaded the session before either saved
+        one.get(AnswerSession, session_id)
+        other.get(AnswerSession, session_id)
+        write_document_answers(one, session_id, {first: "one"})
+        one.commit()
+        write_document_answers(other, session_id, {second: None})
+        other.commit()
+
+    document, values = stored(database, session_id)
+    assert document == {str(first): "one", str(second): None}
+    assert values == {first: "one", second: None}
+
+
+def test_removed_answers_do_not_come_back(database, answer_session):
+    session_id, first, second = answer_session
+    with Session(database) as db_session:
+        write_document_answers(db_session, session_id, {first: "document"})
+        db_session.commit()
+        remove_document_answer(db_session, session_id, first)
+        remove_document_answer(db_session, session_id, second)
+        db_session.commit()
+
+    document, values = stored(database, session_id)
+    assert document == {}
+    assert values == {}
+
+
+def test_answers_are_kept_in_one_document(
+    database, make_form, respondent, monkeypatch
+):
+    monkeypatch.setattr(form_provider, "ANSWER_STORAGE", "document")
+    form_id, fields = make_form("Text", "Text")
+    first, second = (field["id"] for field in fields)
+    client = respondent()
+
+    for answers in ({first: "a"}, {second: "b"}, {first: "c"}):
+        response = client.post(
+            "/api/v1/forms/responses/save",
+            json={"form_id": form_id, "field_answers": answers},
+        )
+        assert response.status_code == 200, response.text
+    answers = client.get("/api/v1/forms/sessions").json()["answers"]
+    assert {answer["field_id"]: answer["value"] for answer in answers} == {
+        first: "c",
+        second: "b",
+    }
+
+    answer_id = next(a["id"] for a in answers if a["field_id"] == second)
+    assert client.put(
+        f"/api/v1/forms/responses/{answer_id}", params={"value": "edited"}
+    ).is_success
+    answer_id = next(a["id"] for a in answers if a["field_id"] == first)
+    assert client.delete(f"/api/v1/forms/responses/{answer_id}").is_success
+
+    session = client.get("/api/v1/forms/sessions").json()
+    assert [(a["field_id"], a["value"]) for a in session["answers"]] == [
+        (second, "edited")
+    ]
+    document, _ = stored(database, UUID(session["id"]))
+    assert document == {second: "edited"}
+
+
+def test_sessions_without_a_document_are_told_apart(database, make_form):
+    form_id, _ = make_form("Text")
+    with Session(database) as db_session:
+        sessions = [AnswerSession(form_id=UUID(form_id)) for _ in range(3)]
+        db_session.add_all(sessions)
+        db_session.commit()
+        json_null, sql_null, document = (s.id for s in sessions)
+        db_session.exec(
+            update(AnswerSession)
+            .where(AnswerSession.id == sql_null)
+            .values(answers_document=None)
+            .execution_options(synchronize_session=False)
+        )
+        write_document_answers(db_session, document, {json_null: "a"})
+        db_session.commit()
+
+        assert db_session.exec(
+            select(AnswerSession.id).where(
+                AnswerSession.form_id == UUID(form_id), has_document("sqlite")
+            )
+        ).all() == [document]
+
+
+def test_unknown_answer_storages_are_rejected(monkeypatch):
+    monkeypatch.setenv("ANSWER_STORAGE", "document")
+    assert form_provider.configured_answer_storage() == "document"
+
+    monkeypatch.setenv("ANSWER_STORAGE", "documents")
+    with pytest.raises(ValueError, match="ANSWER_STORAGE"):
+        form_provider.configured_answer_storage()
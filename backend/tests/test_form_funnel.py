@@ -0,0 +1,72 @@
+import pytest
+
+from app.api.routes.v1.providers import form as form_provider
+
+
+@pytest.fixture
+def funnel_form(admin, make_form, respondent):
+    """Four sessions: stopping after one, two and three fields, skipping."""
+    form_id, fields = make_form(
+        "Text", "Text", "Text", Text={"required": False}
+    )
+    for position, field in enumerate(fields):
+        admin.put(
+            f"/api/v1/forms/fields/{field['id']}", json={"position": position}
+        )
+    for answered, submitted in (
+        ((0,), False),
+        ((0, 1), False),
+        ((0, 1, 2), True),
+        ((2,), False),
+    ):
+        client = respondent()
+        response = client.post(
+            "/api/v1/forms/responses/save",
+            json={
+                "form_id": form_id,
+                "field_answers": {fields[i]["id"]: "v" for i in answered},
+            },
+        )
+        assert response.status_code == 200, response.text
+        if submitted:
+            assert client.post(
+                f"/api/v1/forms/{form_id}/sessions/submit"
+            ).is_success
+    return form_id, fields
+
+
+def test_sessions_are_counted_per_step(admin, funnel_form):
+    form_id, fields = funnel_form
+
+    funnel = admin.get(f"/api/v1/forms/{form_id}/funnel").json()
+
+    assert (funnel["started"], funnel["submitted"]) == (4, 1)
+    assert [
+        (step["reached"], step["answered"], step["submitted"])
+        for step in funnel["steps"]
+    ] == [(4, 3, 1), (3, 2, 1), (2, 2, 1)]
+
+
+def test_funnels_are_cached(admin, funnel_form, respondent):
+    form_id, fields = funnel_form
+    funnel = admin.get(f"/api/v1/forms/{form_id}/funnel").json()
+
+    respondent().post(
+        "/api/v1/forms/responses/save",
+        json={"form_id": form_id, "field_answers": {fields[0]["id"]: "v"}},
+    )
+
+    assert admin.get(f"/api/v1/forms/{form_id}/funnel").json() == funnel
+
+
+def test_funnels_are_admin_only(member, funnel_form):
+    form_id, _ = funnel_form
+
+    assert member.get(f"/api/v1/forms/{form_id}/funnel").status_code == 401
+
+
+def test_funnels_need_answer_rows(admin, funnel_form, monkeypatch):
+    monkeypatch.setattr(form_provider, "ANSWER_STORAGE", "document")
+    form_id, _ = funnel_form
+
+    assert admin.get(f"/api/v1/forms/{form_id}/funnel").status_code == 400
@@ -0,0 +1,81 @@
+from app.utils.etag import etag_matches
+
+
+def test_etag_matching():
+    assert etag_matches('"1.1.0"', '"1.1.0"')
+    assert etag_matches('W/"1.1.0", "2.1.0"', '"2.1.0"')
+    assert etag_matches("*", '"1.1.0"')
+    assert not etag_matches(None, '"1.1.0"')
+    assert not etag_matches('"1.1.0"', '"1.1.1"')
+
+
+def test_changes_give_a_new_version(admin, make_form):
+    form_id, fields = make_form("Text")
+    version = admin.get(f"/api/v1/forms/{form_id}").json()["version"]
+
+    admin.put(f"/api/v1/forms/{form_id}", json={"label": "Renamed"})
+    renamed = admin.get(f"/api/v1/forms/{form_id}").json()["version"]
+    admin.put(f"/api/v1/forms/fields/{fields[0]['id']}", json={"label": "New"})
+    relabelled = admin.get(f"/api/v1/forms/{form_id}").json()["version"]
+
+    assert version < renamed < relabelled
+    fields = admin.get(f"/api/v1/forms/{form_id}/fields").json()
+    assert fields[0]["label"] == "New"
+
+
+def test_fresh_copies_are_not_modified(admin, make_form, respondent):
+    form_id, _ = make_form("Text")
+    client = respondent()
+
+    response = client.get(f"/api/v1/forms/{form_id}")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    for path in (
+        f"/api/v1/forms/{form_id}",
+        f"/api/v1/forms/{form_id}/fields",
+    ):
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    admin.put(f"/api/v1/forms/{form_id}", json={"label": "Renamed"})
+    response = client.get(
+        f"/api/v1/forms/{form_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["label"] == "Renamed"
+    assert response.headers["etag"] != etag
+
+
+def test_only_the_last_submission_changes_the_etag(
+    admin, make_form, respondent
+):
+    form_id, fields = make_form("Text")
+    admin.put(f"/api/v1/forms/{form_id}", json={"submissions_limit": 2})
+    etag = admin.get(f"/api/v1/forms/{form_id}").headers["etag"]
+
+    for submissions, status_code in ((1, 304), (2, 200)):
+        client = respondent()
+        client.post(
+            "/api/v1/forms/responses/save",
+            json={"form_id": form_id, "field_answers": {fields[0]["id"]: "v"}},
+        )
+        submitted = client.post(f"/api/v1/forms/{form_id}/sessions/submit")
+        assert submitted.is_success
+
+        response = admin.get(
+            f"/api/v1/forms/{form_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status_code
+    assert response.json()["submissions"] == 2
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_closed_forms_are_private(admin, make_form, respondent):
+    form_id, _ = make_form("Text")
+    admin.post(f"/api/v1/forms/{form_id}/close")
+
+    assert respondent().get(f"/api/v1/forms/{form_id}").status_code != 200
+    response = admin.get(f"/api/v1/forms/{form_id}")
+    assert response.headers["cache-control"] == "private, no-cache"
@@ -0,0 +1,101 @@
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session
+
+from app.core.db.aggregates import histogram_bin, mark_aggregates_stale
+
+
+@pytest.mark.parametrize(
+    ("value", "number_bounds", "expected"),
+    [
+        (5, "0:100", "0:10"),
+        (100, "0:100", "90:100"),
+        (-5, "0:100", "0:10"),
+        (1500, None, "1000:10000"),
+        (-20, None, "-100:-10"),
+        (0.5, None, "-1:1"),
+    ],
+)
+def test_histogram_bins(value, number_bounds, expected):
+    assert histogram_bin(value, number_bounds) == expected
+
+
+def submit(respondent, form_id: str, answers: dict[str, str]):
+    client = respondent()
+    response = client.post(
+        "/api/v1/forms/responses/save",
+        json={"form_id": form_id, "field_answers": answers},
+    )
+    assert response.status_code == 200, response.text
+    session_id = client.cookies["response_session_id"]
+    assert client.post(f"/api/v1/forms/{form_id}/sessions/submit").is_success
+    return client, session_id
+
+
+@pytest.fixture
+def summarized(make_form, respondent):
+    form_id, (select, boolean, number) = make_form(
+        "Select",
+        "Boolean",
+        "Numerical",
+        Select={"possible_answers": "a\\b"},
+        Numerical={"number_bounds": "0:100"},
+    )
+    for option, flag, value in (
+        ("a", "1", "5"),
+        ("a", "0", "55"),
+        ("b", "1", "100"),
+    ):
+        submit(
+            respondent,
+            form_id,
+            {select["id"]: option, boolean["id"]: flag, number["id"]: value},
+        )
+    return form_id, number["id"]
+
+
+def test_submissions_are_summarized(admin, summarized):
+    form_id, _ = summarized
+
+    summary = admin.get(f"/api/v1/forms/{form_id}/summary").json()
+
+    select, boolean, number = summary["fields"]
+    assert summary["submissions"] == 3
+    assert select["counts"] == {"a": 2, "b": 1}
+    assert boolean["counts"] == {"true": 2, "false": 1}
+    assert (number["answered"], number["minimum"], number["maximum"]) == (
+        3,
+        5,
+        100,
+    )
+    assert number["mean"] == pytest.approx(160 / 3)
+    assert number["histogram"] == {"0:10": 1, "50:60": 1, "90:100": 1}
+
+
+def test_responses_are_submitted_once(make_form, respondent, admin):
+    form_id, (field,) = make_form("Text")
+    client, session_id = submit(respondent, form_id, {field["id"]: "v"})
+    # submitting forgets the session, a replayed request still sends it
+    client.cookies.set("response_session_id", session_id)
+    response = client.post(f"/api/v1/forms/{form_id}/sessions/submit")
+
+    assert response.status_code == 409
+    summary = admin.get(f"/api/v1/forms/{form_id}/summary").json()
+    assert summary["submissions"] == 1
+
+
+def test_stale_aggregates_are_rebuilt(admin, summarized, database):
+    form_id, number_id = summarized
+    summary = admin.get(f"/api/v1/forms/{form_id}/summary").json()
+
+    with Session(database) as db_session:
+        mark_aggregates_stale(db_session, UUID(form_id))
+        db_session.commit()
+    assert admin.get(f"/api/v1/forms/{form_id}/summary").json() == summary
+
+    admin.put(
+        f"/api/v1/forms/fields/{number_id}", json={"number_bounds": "0:10"}
+    )
+    summary = admin.get(f"/api/v1/forms/{form_id}/summary").json()
+    assert summary["fields"][2]["histogram"] == {"5:6": 1, "9:10": 2}
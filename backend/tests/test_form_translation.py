@@ -0,0 +1,209 @@
+import json
+import time
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import select
+
+from app.api.routes.v1.dto.form import (
+    FormDTO,
+    FormFieldDTO,
+    FormTranslationModel,
+)
+from app.api.routes.v1.providers import form as form_provider
+from app.core.db.models import FormTranslation
+from app.core.services.ai.providers import CircuitOpenError
+from app.utils.ttl_cache import TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+def form_data(fields: int) -> FormTranslationModel:
+    form_id = uuid4()
+    return FormTranslationModel(
+        form=FormDTO(
+            id=form_id,
+            label="Title",
+            description="Description",
+            fields_length=fields,
+            open=True,
+            submissions_limit=None,
+            deadline=None,
+            submissions=0,
+            version=1,
+        ),
+        fields=[
+            FormFieldDTO(
+                id=uuid4(),
+                form_id=form_id,
+                label=f"field {position}",
+                description="d",
+                position=position,
+                required=True,
+                field_type="Text",
+                possible_answers=None,
+                number_bounds=None,
+                text_bounds=None,
+            )
+            for position in range(fields)
+        ],
+    )
+
+
+class FakeTranslator:
+    """Upper-cases labels, failing for chunks holding a `failing` label."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.failing: set[str] = set()
+
+    async def __call__(self, json_data: str, language: str):
+        data = json.loads(json_data)
+        labels = [field["label"] for field in data["fields"]]
+        self.calls.append(labels)
+        if self.failing & set(labels):
+            raise RuntimeError("upstream failure")
+        data["form"]["label"] = data["form"]["label"].upper()
+        for field in data["fields"]:
+            field["label"] = field["label"].upper()
+        return json.dumps(data)
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    translator = FakeTranslator()
+    monkeypatch.setattr(form_provider, "translate_json", translator)
+    monkeypatch.setattr(form_provider, "TRANSLATION_CHUNK_SIZE", 2)
+    monkeypatch.setattr(form_provider, "TRANSLATION_CHUNK_RETRIES", 0)
+    monkeypatch.setattr(
+        form_provider,
+        "translation_chunk_cache",
+        TTLCache("translation_chunk", max_size=64),
+    )
+    return translator
+
+
+def test_chunks_carry_the_title_once(translator):
+    chunks = form_provider.translation_chunks(form_data(5))
+
+    assert [len(chunk.fields) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0].form.label == "Title"
+    assert all(chunk.form.label == "" for chunk in chunks[1:])
+    assert all(chunk.form.description is None for chunk in chunks[1:])
+
+
+def labels(data: FormTranslationModel) -> list[str]:
+    return [field.label for field in data.fields]
+
+
+async def test_chunks_are_merged_in_order(translator):
+    translated, complete = await form_provider.translate_form_data(
+        form_data(5), "French"
+    )
+
+    assert complete
+    assert translated.form.label == "TITLE"
+    assert labels(translated) == [f"FIELD {position}" for position in range(5)]
+    assert len(translator.calls) == 3
+
+
+async def test_failed_chunks_are_left_untranslated(translator):
+    translator.failing = {"field 2"}
+
+    translated, complete = await form_provider.translate_form_data(
+        form_data(5), "French"
+    )
+
+    assert not complete
+    assert translated.form.label == "TITLE"
+    assert labels(translated) == [
+        "FIELD 0",
+        "FIELD 1",
+        "field 2",
+        "field 3",
+        "FIELD 4",
+    ]
+
+
+async def test_only_failed_chunks_are_retried(translator):
+    data = form_data(5)
+    translator.failing = {"field 2"}
+    await form_provider.translate_form_data(data, "French")
+    translator.calls.clear()
+    translator.failing.clear()
+
+    translated, complete = await form_provider.translate_form_data(
+        data, "French"
+    )
+
+    assert complete
+    assert translator.calls == [["field 2", "field 3"]]
+    assert labels(translated) == [f"FIELD {position}" for position in range(5)]
+
+
+async def test_fails_when_every_chunk_fails(translator):
+    translator.failing = {f"field {position}" for position in range(5)}
+
+    with pytest.raises(HTTPException) as error:
+        await form_provider.translate_form_data(form_data(5), "French")
+    assert error.value.status_code == 503
+
+
+async def test_chunks_are_cached_per_language(translator):
+    data = form_data(2)
+    await form_provider.translate_form_data(data, "French")
+    await form_provider.translate_form_data(data, "French")
+    await form_provider.translate_form_data(data, "German")
+
+    assert len(translator.calls) == 2
+
+
+def test_partial_translations_are_not_stored(
+    admin, make_form, translator, db_session
+):
+    translator.failing = {"Q2"}
+    form_id, _ = make_form("Text", "Text", "Text")
+    response = admin.post(
+        f"/api/v1/forms/{form_id}/translate", params={"language": "Spanish"}
+    )
+    assert response.status_code == 200, response.text
+    stored = db_session.exec(
+        select(FormTranslation).where(
+            FormTranslation.form_id == UUID(form_id),
+            FormTranslation.language == "Spanish",
+        )
+    ).all()
+    assert stored == []
+
+
+async def test_failing_chunks_are_retried_with_a_backoff(
+    translator, monkeypatch
+):
+    monkeypatch.setattr(form_provider, "TRANSLATION_CHUNK_RETRIES", 2)
+    monkeypatch.setattr(form_provider, "TRANSLATION_CHUNK_BACKOFF", 0.05)
+    translator.failing = {"field 0"}
+    started_at = time.monotonic()
+
+    with pytest.raises(HTTPException):
+        await form_provider.translate_chunk(form_data(1), "French")
+
+    assert len(translator.calls) == 3
+    assert time.monotonic() - started_at >= 0.05 + 0.1
+
+
+async def test_chunks_are_not_retried_while_the_breaker_is_open(
+    translator, monkeypatch
+):
+    monkeypatch.setattr(form_provider, "TRANSLATION_CHUNK_RETRIES", 2)
+    calls = []
+
+    async def rejected(json_data: str, language: str):
+        calls.append(json_data)
+        raise CircuitOpenError(status_code=503)
+
+    monkeypatch.setattr(form_provider, "translate_json", rejected)
+
+    with pytest.raises(CircuitOpenError):
+        await form_provider.translate_chunk(form_data(1), "French")
+    assert len(calls) == 1
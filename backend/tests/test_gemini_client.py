@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anyio
+import pytest
+from fastapi import HTTPException
+
+from app.core.services.ai import client
+from app.core.services.ai.providers import (
+    LLMProvider,
+    ask_gemini,
+    stream_gemini,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeGemini(ThreadingHTTPServer):
+    """
+    A local stand-in for the Gemini API, answering every prompt with its
+    text, and counting the requests it is serving at once.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeGeminiHandler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.delay = 0.0
+        self.status = 200
+        self.requests: list[tuple[str, dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def handle_error(self, request, client_address):
+        pass  # clients that timed out have hung up
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    server: FakeGemini
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(
+            self.rfile.read(int(self.headers["Content-Length"]))
+        )
+        with server.lock:
+            server.requests.append((self.path, payload))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            text = payload["contents"][0]["parts"]["text"]
+            if server.status != 200:
+                self.send_error(server.status)
+            elif ":streamGenerateContent" in self.path:
+                self.send_stream(text)
+            else:
+                self.send_json(generated(text))
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def send_json(self, data: dict):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_stream(self, text: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        words = text.split(" ")
+        for index, word in enumerate(words):
+            last = index == len(words) - 1
+            chunk = {
+                "candidates": [
+                    {
+                        "content": {
+                            "parts": [{"text": word if last else f"{word} "}],
+                            "role": "model",
+                        },
+                        **({"finishReason": "STOP"} if last else {}),
+                    }
+                ],
+                **({"usageMetadata": usage(text)} if last else {}),
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\r\n\r\n".encode())
+            self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def usage(text: str):
+    tokens = len(text.split())
+    return {
+        "promptTokenCount": tokens,
+        "candidatesTokenCount": tokens,
+        "totalTokenCount": 2 * tokens,
+    }
+
+
+def generated(text: str):
+    return {
+        "candidates": [
+            {
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "avgLogprobs": -0.1,
+            }
+        ],
+        "usageMetadata": usage(text),
+        "modelVersion": "gemini-2.0-flash",
+        "responseId": "fake",
+    }
+
+
+@pytest.fixture
+def fake_gemini():
+    server = FakeGemini()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def gemini(fake_gemini, monkeypatch):
+    """The shared client, pointed at the fake Gemini server."""
+    monkeypatch.setattr(client, "GEMINI_API_URL", fake_gemini.url)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    await client.close_http_client()
+    yield fake_gemini
+    await client.close_http_client()
+
+
+async def test_ask_gemini_parses_the_response(gemini):
+    response = await ask_gemini("hello there")
+
+    assert response.candidates[0].text == "hello there"
+    assert response.candidates[0].finish_reason == "STOP"
+    assert response.usage.total_tokens == 4
+    path, payload = gemini.requests[0]
+    assert path.startswith("/v1beta/models/gemini-2.0-flash:generateContent")
+    assert "key=test-key" in path
+    assert payload == {"contents": [{"parts": {"text": "hello there"}}]}
+
+
+async def test_requests_reuse_the_shared_client(gemini):
+    await ask_gemini("one")
+    shared = client._client
+    await ask_gemini("two")
+
+    assert shared is not None and client._client is shared
+
+
+async def test_stream_gemini_yields_the_events(gemini):
+    chunks = [chunk async for chunk in stream_gemini("a streamed answer")]
+
+    assert "".join(chunk.text for chunk in chunks) == "a streamed answer"
+    assert [chunk.finish_reason for chunk in chunks] == [None, None, "STOP"]
+    assert chunks[-1].usage is not None
+    assert "alt=sse" in gemini.requests[0][0]
+
+
+async def test_provider_goes_through_gemini(gemini):
+    assert await LLMProvider("gemini").ask("hi") == "hi"
+    streamed = [text async for text in LLMProvider("gemini").stream("a b")]
+    assert streamed == ["a ", "b"]
+
+
+async def test_server_errors_are_unavailable(gemini):
+    gemini.status = 500
+
+    with pytest.raises(HTTPException) as error:
+        await ask_gemini("hello")
+    assert error.value.status_code == 503
+
+
+async def test_timeouts_are_unavailable(gemini, monkeypatch):
+    monkeypatch.setattr(client, "GEMINI_READ_TIMEOUT", 0.1)
+    gemini.delay = 0.5
+
+    with pytest.raises(HTTPException) as error:
+        await ask_gemini("hello")
+    assert error.value.status_code == 503
+
+
+async def test_concurrency_is_limited(gemini, monkeypatch):
+    monkeypatch.setattr(client, "GEMINI_MAX_CONCURRENCY", 2)
+    gemini.delay = 0.1
+    answers = []
+
+    async def ask(index: int):
+        response = await ask_gemini(f"prompt {index}")
+        answers.append(response.candidates[0].text)
+
+    async with anyio.create_task_group() as group:
+        for index in range(6):
+            group.start_soon(ask, index)
+
+    assert sorted(answers) == [f"prompt {index}" for index in range(6)]
+    assert gemini.max_in_flight == 2
@@ -0,0 +1,38 @@
+import asyncio
+
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.metrics.instruments import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+from app.core.metrics.middleware import MetricsMiddleware
+
+LABELS = ("POST", "/metrics-test/{task}")
+
+
+def test_background_tasks_are_not_part_of_the_request():
+    in_flight_during_task = []
+
+    async def task():
+        await asyncio.sleep(0.2)
+        in_flight_during_task.append(HTTP_REQUESTS_IN_FLIGHT.values[LABELS])
+
+    async def endpoint(request):
+        return PlainTextResponse("ok", background=BackgroundTask(task))
+
+    app = Starlette(routes=[Route(LABELS[1], endpoint, methods=["POST"])])
+    app.add_middleware(MetricsMiddleware)
+
+    response = TestClient(app).post("/metrics-test/precompute")
+
+    assert response.status_code == 200
+    assert in_flight_during_task == [0]
+    _, total, count = HTTP_REQUEST_DURATION.values[LABELS]
+    assert count == 1 and total < 0.2
+    assert HTTP_REQUESTS.values[(*LABELS, "200")] == 1
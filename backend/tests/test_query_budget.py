@@ -0,0 +1,119 @@
+import orjson
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import middleware
+from app.core.db.setup import QueryStats, query_stats
+
+pytestmark = pytest.mark.anyio
+
+SCOPE = {"type": "http", "method": "GET", "path": "/test", "headers": []}
+
+
+def endpoint(queries: int, late_queries: int = 0):
+    """An app issuing `queries` before responding, the rest after."""
+
+    async def app(scope, receive, send):
+        query_stats.get().count += queries
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": []}
+        )
+        query_stats.get().count += late_queries
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+async def serve(app) -> list[dict]:
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware.QueryCountMiddleware(app)(dict(SCOPE), None, send)
+    return sent
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        middleware,
+        "log_warning",
+        lambda message, context: logged.append(context),
+    )
+    monkeypatch.setattr(middleware, "SQL_QUERY_BUDGET", 2)
+    return logged
+
+
+async def test_queries_are_reported(warnings):
+    start, body = await serve(endpoint(queries=2))
+
+    assert start["status"] == 200
+    assert (b"server-timing", b'db;dur=0.00;desc="2 queries"') in start[
+        "headers"
+    ]
+    assert body["body"] == b"ok"
+    assert warnings == []
+
+
+async def test_going_over_budget_is_logged(warnings):
+    start, body = await serve(endpoint(queries=3))
+
+    assert start["status"] == 200
+    assert body["body"] == b"ok"
+    assert [context["queries"] for context in warnings] == [3]
+
+
+async def test_going_over_a_strict_budget_fails(warnings, monkeypatch):
+    monkeypatch.setattr(middleware, "SQL_QUERY_BUDGET_STRICT", True)
+
+    start, body = await serve(endpoint(queries=3))
+
+    assert start["status"] == 500
+    assert "3 queries" in orjson.loads(body["body"])["detail"]
+
+
+async def test_queries_after_the_response_started_are_logged(
+    warnings, monkeypatch
+):
+    monkeypatch.setattr(middleware, "SQL_QUERY_BUDGET_STRICT", True)
+
+    start, body = await serve(endpoint(queries=1, late_queries=4))
+
+    assert start["status"] == 200
+    assert body["body"] == b"ok"
+    assert [context["late_queries"] for context in warnings] == [4]
+
+
+def test_strict_budget_fails_real_requests(admin, monkeypatch):
+    monkeypatch.setattr(middleware, "SQL_QUERY_BUDGET", 0)
+    monkeypatch.setattr(middleware, "SQL_QUERY_BUDGET_STRICT", True)
+    monkeypatch.setattr(middleware, "log_warning", lambda *_, **__: None)
+
+    response = admin.get("/api/v1/miscellaneous/coalescing")
+
+    assert response.status_code == 500
+    assert "budget: 0" in response.json()["detail"]
+
+
+def test_failed_statements_are_counted(database):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        with database.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+            connection.execute(text("SELECT 1"))
+            assert connection.info["query_started_at"] == []
+    finally:
+        query_stats.reset(token)
+
+    assert stats.count == 2
+
+
+def test_unmatched_requests_share_a_route():
+    stats = QueryStats(scope={"path": "/api/v1/nothing/1234"})
+
+    assert stats.route == "unmatched"
@@ -0,0 +1,120 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.v1.providers import form as form_provider
+from app.core.db.response_filters import escape_like, parse_response_filter
+
+FIELD_TYPES = ("Text", "Select", "Multiselect", "Boolean", "Date", "Numerical")
+FIELD_OPTIONS = {
+    "Select": {"possible_answers": "a\\b"},
+    "Multiselect": {"possible_answers": "x\\y"},
+}
+RESPONSES = [
+    ("Hello World", "a", "x,y", "1", "2024-01-02", "5"),
+    ("100% done", "b", "x", "0", "2024-03-01", "50"),
+]
+
+
+@pytest.fixture(scope="module")
+def responses(make_form, respondent):
+    form_id, fields = make_form(*FIELD_TYPES, **FIELD_OPTIONS)
+    for values in RESPONSES:
+        client = respondent()
+        response = client.post(
+            "/api/v1/forms/responses/save",
+            json={
+                "form_id": form_id,
+                "field_answers": {
+                    field["id"]: value for field, value in zip(fields, values)
+                },
+            },
+        )
+        assert response.status_code == 200, response.text
+        assert client.post(
+            f"/api/v1/forms/{form_id}/sessions/submit"
+        ).is_success
+    return form_id, {field["field_type"]: field["id"] for field in fields}
+
+
+def text_answers(admin, form_id: str, text_id: str, *filters, **params):
+    response = admin.get(
+        f"/api/v1/forms/{form_id}/responses",
+        params={"filter": list(filters), **params},
+    )
+    assert response.status_code == 200, response.text
+    return sorted(
+        answer["value"]
+        for session in response.json()
+        for answer in session["answers"]
+        if answer["field_id"] == text_id
+    )
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        (("Text:contains:WORLD",), ["Hello World"]),
+        (("Text:contains:%",), ["100% done"]),
+        (("Select:eq:b",), ["100% done"]),
+        (("Multiselect:includes:y",), ["Hello World"]),
+        (("Multiselect:includes:x",), ["100% done", "Hello World"]),
+        (("Boolean:eq:1",), ["Hello World"]),
+        (("Date:gte:2024-02-01",), ["100% done"]),
+        (("Numerical:gt:10", "Boolean:eq:0"), ["100% done"]),
+        (("Numerical:gt:10", "Boolean:eq:1"), []),
+    ],
+)
+def test_responses_are_filtered(admin, responses, filters, expected):
+    form_id, field_ids = responses
+    filters = [
+        f"{field_ids[field_type]}:{rest}"
+        for field_type, rest in (flt.split(":", 1) for flt in filters)
+    ]
+
+    assert text_answers(admin, form_id, field_ids["Text"], *filters) == (
+        expected
+    )
+
+
+def test_responses_are_filtered_by_submission_time(admin, responses):
+    form_id, field_ids = responses
+
+    after = {"submitted_after": "2999-01-01T00:00:00"}
+    before = {"submitted_before": "2999-01-01T00:00:00"}
+    assert text_answers(admin, form_id, field_ids["Text"], **after) == []
+    assert len(text_answers(admin, form_id, field_ids["Text"], **before)) == 2
+
+
+@pytest.mark.parametrize(
+    ("field_type", "filter"),
+    [("Boolean", "gt:1"), ("Date", "gte:soon"), ("Numerical", "includes:1")],
+)
+def test_invalid_filters_are_rejected(admin, responses, field_type, filter):
+    form_id, field_ids = responses
+
+    response = admin.get(
+        f"/api/v1/forms/{form_id}/responses",
+        params={"filter": f"{field_ids[field_type]}:{filter}"},
+    )
+    assert response.status_code == 422
+
+
+def test_malformed_filters_are_rejected():
+    with pytest.raises(HTTPException) as error:
+        parse_response_filter("not a filter")
+    assert error.value.status_code == 422
+
+
+def test_like_patterns_are_escaped():
+    assert escape_like("100%_\\") == "100\\%\\_\\\\"
+
+
+def test_filters_need_answer_rows(admin, responses, monkeypatch):
+    monkeypatch.setattr(form_provider, "ANSWER_STORAGE", "document")
+    form_id, field_ids = responses
+
+    response = admin.get(
+        f"/api/v1/forms/{form_id}/responses",
+        params={"filter": f"{field_ids['Text']}:eq:x"},
+    )
+    assert response.status_code == 400
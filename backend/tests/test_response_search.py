@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import text
+
+from app.api.routes.v1.providers import form as form_provider
+
+ANSWERS = ["world world world peace", "peace only", "hello world"]
+
+
+@pytest.fixture
+def responses(make_form, respondent):
+    form_id, (field,) = make_form("Text")
+    for value in ANSWERS:
+        client = respondent()
+        client.post(
+            "/api/v1/forms/responses/save",
+            json={"form_id": form_id, "field_answers": {field["id"]: value}},
+        )
+        assert client.post(
+            f"/api/v1/forms/{form_id}/sessions/submit"
+        ).is_success
+    return form_id, field["id"]
+
+
+def search(admin, form_id: str, q: str, **params) -> list[str]:
+    response = admin.get(
+        f"/api/v1/forms/{form_id}/responses", params={"q": q, **params}
+    )
+    assert response.status_code == 200, response.text
+    return [
+        answer["value"]
+        for session in response.json()
+        for answer in session["answers"]
+    ]
+
+
+@pytest.mark.parametrize(
+    ("q", "expected"),
+    [
+        ("WORLD", ["world world world peace", "hello world"]),
+        ("peace only", ["peace only"]),
+        ("hello wor", []),
+        ('hello" OR', []),
+        ('hello"*', ["hello world"]),
+        ("nothing", []),
+    ],
+)
+def test_answers_are_searched_best_first(admin, responses, q, expected):
+    form_id, _ = responses
+
+    assert search(admin, form_id, q) == expected
+
+
+def test_blank_searches_match_everything(admin, responses):
+    form_id, _ = responses
+
+    assert sorted(search(admin, form_id, "  ")) == sorted(ANSWERS)
+
+
+def test_searches_combine_with_filters(admin, responses):
+    form_id, field_id = responses
+
+    assert search(
+        admin, form_id, "peace", filter=f"{field_id}:contains:only"
+    ) == ["peace only"]
+
+
+def test_index_follows_edits_and_vacuums(admin, responses, database):
+    form_id, _ = responses
+    with database.connect() as connection:
+        connection.execute(
+            text("UPDATE fieldanswer SET value = 'war' WHERE value = :value"),
+            {"value": "peace only"},
+        )
+        connection.commit()
+    with database.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.exec_driver_sql("VACUUM")
+
+    assert search(admin, form_id, "war") == ["war"]
+    assert search(admin, form_id, "peace") == ["world world world peace"]
+
+
+def test_search_needs_answer_rows(admin, responses, monkeypatch):
+    monkeypatch.setattr(form_provider, "ANSWER_STORAGE", "document")
+    form_id, _ = responses
+
+    response = admin.get(
+        f"/api/v1/forms/{form_id}/responses", params={"q": "peace"}
+    )
+    assert response.status_code == 400
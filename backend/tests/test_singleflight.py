@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test_shared")
+    started = 0
+
+    async def load():
+        nonlocal started
+        started += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    results = await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert started == 1
+    assert flight.stats() == {
+        "calls": 5,
+        "executed": 1,
+        "coalesced": 4,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.anyio
+async def test_failures_are_shared_but_not_kept():
+    flight = SingleFlight("test_failure")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def succeed():
+        return "value"
+
+    assert await flight.do("key", succeed) == "value"
+    assert flight.executed == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight("test_cancel")
+
+    async def load():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    first = asyncio.ensure_future(flight.do("key", load))
+    second = asyncio.ensure_future(flight.do("key", load))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+
+
+def test_stats_are_admin_only(admin, member, respondent):
+    response = respondent().get("/api/v1/miscellaneous/coalescing")
+    assert response.status_code == 404
+    response = member.get("/api/v1/miscellaneous/coalescing")
+    assert response.status_code == 401
+
+    response = admin.get("/api/v1/miscellaneous/coalescing")
+    assert response.status_code == 200
+    assert "form_translation" in response.json()
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.utils.ttl_cache import TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+class Loader:
+    def __init__(self):
+        self.loads = 0
+
+    def __call__(self, value: str):
+        async def load():
+            self.loads += 1
+            await asyncio.sleep(0.01)
+            return value
+
+        return load
+
+
+async def test_concurrent_misses_load_once():
+    cache = TTLCache[str, str]("test_concurrent")
+    loader = Loader()
+
+    values = await asyncio.gather(
+        *(cache.get_or_load("key", loader("value")) for _ in range(3))
+    )
+
+    assert values == ["value"] * 3
+    assert loader.loads == 1
+    assert await cache.get_or_load("key", loader("other")) == "value"
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 1}
+
+
+async def test_entries_expire():
+    cache = TTLCache[str, str]("test_expiry", ttl=0.05)
+    loader = Loader()
+
+    await cache.get_or_load("key", loader("old"))
+    await asyncio.sleep(0.06)
+
+    assert await cache.get_or_load("key", loader("new")) == "new"
+
+
+async def test_least_recently_used_entries_are_evicted():
+    cache = TTLCache[str, str]("test_eviction", max_size=2)
+    loader = Loader()
+
+    for key in ("a", "b", "a", "c"):
+        await cache.get_or_load(key, loader(key))
+
+    assert await cache.get_or_load("a", loader("reloaded")) == "a"
+    assert await cache.get_or_load("b", loader("reloaded")) == "reloaded"
+
+
+async def test_failures_are_not_cached():
+    cache = TTLCache[str, str]("test_failures")
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("key", fail)
+    assert await cache.get_or_load("key", Loader()("value")) == "value"
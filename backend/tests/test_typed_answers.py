@@ -0,0 +1,68 @@
+from datetime import date
+from uuid import UUID
+
+import pytest
+from sqlmodel import select
+
+from app.api.routes.v1.providers import form as form_provider
+from app.core.db.models import FieldAnswer
+from app.utils.answers import typed_answer_values
+
+
+@pytest.mark.parametrize(
+    ("field_type", "value", "typed"),
+    [
+        ("Numerical", "42", {"value_num": 42.0}),
+        ("Currency", "-0.5", {"value_num": -0.5}),
+        ("Numerical", "nan", {}),
+        ("Numerical", "many", {}),
+        ("Date", "2024-01-02", {"value_date": date(2024, 1, 2)}),
+        ("Date", "yesterday", {}),
+        ("Boolean", "1", {"value_bool": True}),
+        ("Boolean", "0", {"value_bool": False}),
+        ("Boolean", "yes", {}),
+        ("Text", "42", {}),
+        ("Numerical", None, {}),
+    ],
+)
+def test_typed_answer_values(field_type, value, typed):
+    assert typed_answer_values(field_type, value) == {
+        "value_num": None,
+        "value_date": None,
+        "value_bool": None,
+        **typed,
+    }
+
+
+def typed_numbers(db_session, field_id: str):
+    db_session.expire_all()
+    return sorted(
+        db_session.exec(
+            select(FieldAnswer.value_num).where(
+                FieldAnswer.field_id == UUID(field_id),
+                FieldAnswer.value_num.is_not(None),
+            )
+        ).all()
+    )
+
+
+def test_answers_are_retyped_with_their_field(
+    admin, make_form, respondent, db_session, monkeypatch
+):
+    monkeypatch.setattr(form_provider, "RETYPE_BATCH_SIZE", 2)
+    form_id, (field,) = make_form("Currency")
+    for value in ("1500", "-20", "0.5"):
+        response = respondent().post(
+            "/api/v1/forms/responses/save",
+            json={"form_id": form_id, "field_answers": {field["id"]: value}},
+        )
+        assert response.status_code == 200, response.text
+    assert typed_numbers(db_session, field["id"]) == [-20, 0.5, 1500]
+
+    for field_type, numbers in (("Text", []), ("Numerical", [-20, 0.5, 1500])):
+        response = admin.put(
+            f"/api/v1/forms/fields/{field['id']}",
+            json={"field_type": field_type},
+        )
+        assert response.status_code == 200, response.text
+        assert typed_numbers(db_session, field["id"]) == numbers